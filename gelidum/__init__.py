@@ -1,11 +1,23 @@
-from gelidum.decorators import freeze_freezable, freeze_params  # noqa
+from gelidum.cache import FreezeCache  # noqa
+from gelidum.compact import compact  # noqa
+from gelidum.decorators import freeze_freezable, freeze_params, immutable  # noqa
 from gelidum.dependencies import NUMPY_INSTALLED  # noqa
+from gelidum.evolve import assoc_in, evolve, update_in  # noqa
 from gelidum.exceptions import FrozenException  # noqa
-from gelidum.freeze import freeze  # noqa
+from gelidum.freeze import (  # noqa
+    compile_freeze_plan,
+    freeze,
+    freeze_many,
+    freeze_typed,
+    register_freezer,
+    unregister_freezer,
+)
 from gelidum.frozen import isfrozen  # noqa
 from gelidum.on_freeze import (  # noqa
     OnFreezeCopier,
     OnFreezeIdentityFunc,
     OnFreezeOriginalObjTracker,
 )
+from gelidum.produce import produce, thaw  # noqa
+from gelidum.snapshot import snapshot, track  # noqa
 from gelidum.typing import Freezable  # noqa
@@ -0,0 +1,123 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Union
+
+from gelidum.on_update import on_update_func_creator
+from gelidum.typing import FrozenType, OnUpdateFuncType
+
+__all__ = ['FreezeCache']
+
+
+class _CacheEntry(NamedTuple):
+    # Weak reference to the original object, or the object itself if it cannot be weakly referenced
+    original: Callable[[], Any]
+    frozen: FrozenType
+
+
+_CacheKey = Tuple[int, OnUpdateFuncType]
+
+
+class FreezeCache:
+    """
+    Cache of the frozen versions of the objects frozen by copy, so freezing
+    again an object returns its frozen version without copying it.
+    Pass it to freeze with on_freeze=OnFreezeCopier(cache=FreezeCache(...)).
+
+    The cache cannot know when an object is modified: call invalidate(obj) after
+    modifying an object, otherwise freezing it returns its outdated frozen version.
+
+    The objects are weakly referenced when their classes allow it, so they are removed
+    from the cache when they are garbage collected. The objects that cannot be weakly
+    referenced (e.g. dicts and lists) are kept alive by the cache until they are evicted.
+    When the cache is full, the least recently used objects are evicted.
+    This class is thread-safe.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize <= 0:
+            raise ValueError('maxsize must be greater than 0')
+        self.__maxsize = maxsize
+        self.__entries: 'OrderedDict[_CacheKey, _CacheEntry]' = OrderedDict()
+        # Entries of the garbage collected objects, removed by the next operation on the cache as the
+        # weak reference callbacks can be called by the garbage collector while the cache is locked
+        self.__pending_removals: List[Tuple[_CacheKey, weakref.ref]] = []
+        self.__lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def __len__(self) -> int:
+        with self.__lock:
+            self.__remove_pending()
+            return len(self.__entries)
+
+    def get(
+        self, obj: Any, on_update: Union[str, OnUpdateFuncType] = 'exception', default: Any = None
+    ) -> Optional[FrozenType]:
+        """
+        Frozen version of the object frozen with the on_update policy, or default if it is not cached.
+        """
+        key = (id(obj), on_update_func_creator(on_update=on_update))
+        with self.__lock:
+            self.__remove_pending()
+            entry = self.__entries.get(key)
+            if entry is None or entry.original() is not obj:
+                return default
+            self.__entries.move_to_end(key)
+            return entry.frozen
+
+    def set(self, obj: Any, frozen_obj: FrozenType, on_update: Union[str, OnUpdateFuncType] = 'exception') -> None:
+        """
+        Cache the frozen version of the object frozen with the on_update policy.
+        """
+        key = (id(obj), on_update_func_creator(on_update=on_update))
+        pending_removals = self.__pending_removals
+        try:
+            original = weakref.ref(obj, lambda original_ref: pending_removals.append((key, original_ref)))
+        except TypeError:
+            original = _StrongRef(obj)
+        with self.__lock:
+            self.__remove_pending()
+            self.__entries[key] = _CacheEntry(original=original, frozen=frozen_obj)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, obj: Any) -> None:
+        """
+        Remove the frozen versions of the object from the cache.
+        """
+        obj_id = id(obj)
+        with self.__lock:
+            self.__remove_pending()
+            for key in [key for key, entry in self.__entries.items() if key[0] == obj_id and entry.original() is obj]:
+                del self.__entries[key]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__pending_removals.clear()
+
+    def __remove_pending(self) -> None:
+        while self.__pending_removals:
+            key, original_ref = self.__pending_removals.pop()
+            entry = self.__entries.get(key)
+            # The id of the garbage collected object could have been reused by a new cached object
+            if entry is not None and entry.original is original_ref:
+                del self.__entries[key]
+
+
+class _StrongRef(object):
+    """
+    Reference to an object that cannot be weakly referenced, with the same interface as weakref.ref.
+    """
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __call__(self) -> Any:
+        return self.obj
@@ -1,5 +1,12 @@
+from gelidum.collections.frozenarray import frozenarray  # noqa
+from gelidum.collections.frozencounter import frozencounter  # noqa
+from gelidum.collections.frozendefaultdict import frozendefaultdict  # noqa
+from gelidum.collections.frozendeque import frozendeque  # noqa
 from gelidum.collections.frozendict import frozendict  # noqa
 from gelidum.collections.frozenlist import frozenlist  # noqa
+from gelidum.collections.frozenmap import frozenmap  # noqa
+from gelidum.collections.frozenordereddict import frozenordereddict  # noqa
+from gelidum.collections.frozenvector import frozenvector  # noqa
 from gelidum.collections.frozenzet import frozenzet  # noqa
 from gelidum.dependencies import NUMPY_INSTALLED
 
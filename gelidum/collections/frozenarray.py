@@ -0,0 +1,102 @@
+import array
+from typing import Any, Iterable, Optional
+
+from gelidum.exceptions import FrozenException
+from gelidum.frozen import FrozenBase
+
+__all__ = ['frozenarray']
+
+
+class frozenarray(array.array, FrozenBase):  # noqa
+    """
+    Read-only array.array. Its methods that modify it raise an exception,
+    but note that its buffer can be modified through a memoryview.
+    """
+
+    # Hash of the frozenarray, computed only the first time it is needed
+    _gelidum_hash: Optional[int] = None
+
+    def __new__(cls, typecode: str, initializer: Iterable[Any] = ()) -> 'frozenarray':
+        return super().__new__(cls, typecode, initializer)
+
+    def __raise_immutable_exception(self, *args, **kwargs):
+        raise FrozenException("'frozenarray' object is immutable")
+
+    @classmethod
+    def _gelidum_on_update(cls, *args, **kwargs):
+        raise FrozenException("'frozenarray' object is immutable")
+
+    @classmethod
+    def get_gelidum_hot_class_name(cls) -> str:
+        return 'array'
+
+    @classmethod
+    def get_gelidum_hot_class_module(cls) -> str:
+        return 'array.array'
+
+    def __hash__(self) -> int:
+        """
+        Hash of the items (arrays with the same items are equal whatever their typecodes).
+        Computed once and stored in the instance.
+        """
+        if self._gelidum_hash is None:
+            object.__setattr__(self, '_gelidum_hash', hash(tuple(self)))
+        return self._gelidum_hash
+
+    def __getitem__(self, key: Any) -> Any:
+        if type(key) is slice:
+            return frozenarray(self.typecode, super().__getitem__(key))
+        return super().__getitem__(key)
+
+    # The methods of array.array take precedence over the ones of FrozenBase
+    __setitem__ = FrozenBase.__setitem__
+    __delitem__ = FrozenBase.__delitem__
+    __deepcopy__ = FrozenBase.__deepcopy__
+
+    def __iadd__(self, other: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def __imul__(self, times: int) -> None:
+        self.__raise_immutable_exception()
+
+    def append(self, item: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def byteswap(self) -> None:
+        self.__raise_immutable_exception()
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        self.__raise_immutable_exception()
+
+    def frombytes(self, buffer: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def fromfile(self, f: Any, n: int) -> None:
+        self.__raise_immutable_exception()
+
+    def fromlist(self, items: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def fromunicode(self, s: str) -> None:
+        self.__raise_immutable_exception()
+
+    def insert(self, i: int, x: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def pop(self, i: int = -1) -> None:
+        self.__raise_immutable_exception()
+
+    def remove(self, x: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def reverse(self) -> None:
+        self.__raise_immutable_exception()
+
+    def __copy__(self) -> 'frozenarray':
+        return self
+
+    def __reduce_ex__(self, protocol: int):
+        return frozenarray, (self.typecode, self.tolist())
+
+    def __repr__(self) -> str:
+        return f'frozenarray({self.typecode!r}, {self.tolist()!r})'
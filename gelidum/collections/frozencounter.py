@@ -0,0 +1,65 @@
+from collections import Counter
+from typing import Any, Iterator, List, Optional, Tuple
+
+from gelidum.collections.frozendict import frozendict
+from gelidum.exceptions import FrozenException
+
+__all__ = ['frozencounter']
+
+
+class frozencounter(frozendict):  # noqa
+    """
+    frozendict with the read-only methods of Counter.
+    Missing elements have a zero count, and arithmetic
+    operations return new frozencounter objects.
+    """
+
+    def __raise_immutable_exception(self, *args, **kwargs):
+        raise FrozenException("'frozencounter' object is immutable")
+
+    @classmethod
+    def _gelidum_on_update(cls, *args, **kwargs):
+        raise FrozenException("'frozencounter' object is immutable")
+
+    @classmethod
+    def get_gelidum_hot_class_name(cls) -> str:
+        return 'Counter'
+
+    @classmethod
+    def get_gelidum_hot_class_module(cls) -> str:
+        return 'collections.Counter'
+
+    def __missing__(self, key: Any) -> int:
+        return 0
+
+    def total(self) -> int:
+        return sum(self.values())
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        return Counter.most_common(self, n)
+
+    def elements(self) -> Iterator[Any]:
+        return Counter.elements(self)
+
+    def __operation(self, other: Any, operation: str) -> Any:
+        if not isinstance(other, (Counter, frozencounter)):
+            return NotImplemented
+        return frozencounter(getattr(Counter(self), operation)(Counter(other)))
+
+    def __add__(self, other: Any) -> 'frozencounter':
+        return self.__operation(other, '__add__')
+
+    def __sub__(self, other: Any) -> 'frozencounter':
+        return self.__operation(other, '__sub__')
+
+    def __or__(self, other: Any) -> 'frozencounter':
+        return self.__operation(other, '__or__')
+
+    def __and__(self, other: Any) -> 'frozencounter':
+        return self.__operation(other, '__and__')
+
+    def subtract(self, *args, **kwargs) -> None:
+        self.__raise_immutable_exception()
+
+    def __repr__(self) -> str:
+        return f'frozencounter({dict.__repr__(self)})'
@@ -0,0 +1,53 @@
+from typing import Any, Callable, Hashable, Mapping, Optional, Sequence, Tuple, Union
+
+from gelidum.collections.frozendict import frozendict
+from gelidum.exceptions import FrozenException
+from gelidum.frozen import FrozenBase
+from gelidum.typing import FrozenType
+
+__all__ = ['frozendefaultdict']
+
+
+class frozendefaultdict(frozendict):  # noqa
+    """
+    frozendict with the default_factory of a defaultdict. Reading a missing key
+    returns the frozen default value, that is not stored (the frozendefaultdict is immutable).
+    """
+
+    def __init__(
+        self,
+        default_factory: Optional[Callable[[], Any]] = None,
+        seq: Optional[Union[Mapping, Sequence, Tuple[Hashable, Any]]] = None,
+        freeze_func: Optional[Callable[[Any], FrozenBase]] = None,
+        **kwargs,
+    ):
+        super().__init__(seq, freeze_func=freeze_func, **kwargs)
+        object.__setattr__(self, 'default_factory', default_factory)
+
+    def __raise_immutable_exception(self, *args, **kwargs):
+        raise FrozenException("'frozendefaultdict' object is immutable")
+
+    @classmethod
+    def _gelidum_on_update(cls, *args, **kwargs):
+        raise FrozenException("'frozendefaultdict' object is immutable")
+
+    @classmethod
+    def get_gelidum_hot_class_name(cls) -> str:
+        return 'defaultdict'
+
+    @classmethod
+    def get_gelidum_hot_class_module(cls) -> str:
+        return 'collections.defaultdict'
+
+    def __missing__(self, key: Any) -> FrozenType:
+        if self.default_factory is None:
+            raise KeyError(key)
+        from gelidum.freeze import freeze
+
+        return freeze(self.default_factory(), on_update='exception', on_freeze='copy')
+
+    def __reduce__(self):
+        return self.__class__, (self.default_factory, dict(self))
+
+    def __repr__(self) -> str:
+        return f'frozendefaultdict({self.default_factory!r}, {dict.__repr__(self)})'
@@ -0,0 +1,70 @@
+from collections import deque
+from typing import Any, Callable, Optional
+
+from gelidum.collections.frozenlist import _FrozenListParameterType, frozenlist
+from gelidum.exceptions import FrozenException
+from gelidum.frozen import FrozenBase
+
+__all__ = ['frozendeque']
+
+
+class frozendeque(frozenlist):  # noqa
+    """
+    frozenlist with the maxlen of a deque.
+    As in a deque, only the last maxlen items are kept.
+    """
+
+    def __new__(
+        cls,
+        seq: Optional[_FrozenListParameterType] = None,
+        freeze_func: Optional[Callable[[Any], FrozenBase]] = None,
+        maxlen: Optional[int] = None,
+    ) -> 'frozendeque':
+        if maxlen is not None and seq:
+            seq = deque(seq, maxlen=maxlen)
+        self = super().__new__(cls, seq, freeze_func=freeze_func)
+        object.__setattr__(self, 'maxlen', maxlen)
+        return self
+
+    def __init__(
+        self,
+        seq: Optional[_FrozenListParameterType] = None,
+        freeze_func: Optional[Callable[[Any], FrozenBase]] = None,
+        maxlen: Optional[int] = None,
+    ):
+        pass
+
+    def __raise_immutable_exception(self, *args, **kwargs):
+        raise FrozenException("'frozendeque' object is immutable")
+
+    @classmethod
+    def _gelidum_on_update(cls, *args, **kwargs):
+        raise FrozenException("'frozendeque' object is immutable")
+
+    @classmethod
+    def get_gelidum_hot_class_name(cls) -> str:
+        return 'deque'
+
+    @classmethod
+    def get_gelidum_hot_class_module(cls) -> str:
+        return 'collections.deque'
+
+    def appendleft(self, item: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def extendleft(self, iterable: Any) -> None:
+        self.__raise_immutable_exception()
+
+    def popleft(self) -> None:
+        self.__raise_immutable_exception()
+
+    def rotate(self, n: int = 1) -> None:
+        self.__raise_immutable_exception()
+
+    def __repr__(self) -> str:
+        if self.maxlen is None:
+            return f'frozendeque({list(self)!r})'
+        return f'frozendeque({list(self)!r}, maxlen={self.maxlen})'
+
+    def __reduce__(self):
+        return frozendeque, (tuple(self), None, self.maxlen)
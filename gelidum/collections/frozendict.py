@@ -1,4 +1,4 @@
-from typing import Any, Callable, Hashable, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Union
 
 try:
     from collections import Mapping
@@ -14,8 +14,11 @@ __all__ = ['frozendict']
 
 
 class frozendict(dict, FrozenBase):  # noqa
+    # Hash of the frozendict, computed only the first time it is needed
+    _gelidum_hash: Optional[int] = None
+
     def __raise_immutable_exception(self, *args, **kwargs):
-        raise FrozenException("'frozendict' object is immutable")
+        raise FrozenException(f"'{type(self).__name__}' object is immutable")
 
     def __init__(
         self,
@@ -24,11 +27,13 @@ class frozendict(dict, FrozenBase):  # noqa
         **kwargs,
     ):
         if freeze_func is None:
+            # Items referenced several times are frozen only once
+            memo: Dict[int, Any] = {}
 
             def freeze_func(item: Any) -> FrozenType:
                 from gelidum.freeze import freeze
 
-                return freeze(item, on_update='exception', on_freeze='copy')
+                return freeze(item, on_update='exception', on_freeze='copy', memo=memo)
 
         if seq is not None:
             items = None
@@ -51,7 +56,7 @@ class frozendict(dict, FrozenBase):  # noqa
 
     @classmethod
     def _gelidum_on_update(cls, *args, **kwargs):
-        raise FrozenException("'frozendict' object is immutable")
+        raise FrozenException(f"'{cls.__name__}' object is immutable")
 
     @classmethod
     def get_gelidum_hot_class_name(cls) -> str:
@@ -62,7 +67,17 @@ class frozendict(dict, FrozenBase):  # noqa
         return 'builtins.dict'
 
     def __hash__(self) -> int:
-        return hash(tuple((k, v) for k, v in self.items()))
+        """
+        Hash of the items of the frozendict, independent of their order
+        (as equality is). Computed once and stored in the instance.
+        """
+        if self._gelidum_hash is None:
+            object.__setattr__(self, '_gelidum_hash', hash(frozenset(self.items())))
+        return self._gelidum_hash
+
+    def __reduce__(self):
+        # The cached hash is not pickled, as it depends on the hash seed of the process
+        return self.__class__, (dict(self),)
 
     def __getitem__(self, key) -> Any:
         if type(key) is slice:
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Generator, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Generator, Optional, Sequence, Union
 
 from gelidum.exceptions import FrozenException
 from gelidum.frozen import FrozenBase
@@ -11,18 +11,23 @@ _FrozenListParameterType = Optional[Union[Sequence, Generator]]
 
 
 class frozenlist(tuple, FrozenBase):  # noqa
+    # Hash of the frozenlist, computed only the first time it is needed
+    _gelidum_hash: Optional[int] = None
+
     def __raise_immutable_exception(self, *args, **kwargs):
-        raise FrozenException("'frozenlist' object is immutable")
+        raise FrozenException(f"'{type(self).__name__}' object is immutable")
 
     def __new__(
         cls, seq: Optional[_FrozenListParameterType] = None, freeze_func: Optional[Callable[[Any], FrozenBase]] = None
     ) -> 'frozenlist':
         if freeze_func is None:
+            # Items referenced several times are frozen only once
+            memo: Dict[int, Any] = {}
 
             def freeze_func(item: Any) -> FrozenType:
                 from gelidum.freeze import freeze
 
-                return freeze(item, on_update='exception', on_freeze='copy')
+                return freeze(item, on_update='exception', on_freeze='copy', memo=memo)
 
         if seq:
             self = tuple.__new__(cls, (freeze_func(arg) for arg in seq))
@@ -37,7 +42,7 @@ class frozenlist(tuple, FrozenBase):  # noqa
 
     @classmethod
     def _gelidum_on_update(cls, *args, **kwargs):
-        raise FrozenException("'frozenlist' object is immutable")
+        raise FrozenException(f"'{cls.__name__}' object is immutable")
 
     @classmethod
     def get_gelidum_hot_class_name(cls) -> str:
@@ -47,6 +52,18 @@ class frozenlist(tuple, FrozenBase):  # noqa
     def get_gelidum_hot_class_module(cls) -> str:
         return 'builtins.tuple'
 
+    def __hash__(self) -> int:
+        """
+        tuple hash, computed once and stored in the instance.
+        """
+        if self._gelidum_hash is None:
+            object.__setattr__(self, '_gelidum_hash', tuple.__hash__(self))
+        return self._gelidum_hash
+
+    def __reduce__(self):
+        # The cached hash is not pickled, as it depends on the hash seed of the process
+        return self.__class__, (tuple(self),)
+
     def __getitem__(self, key) -> Any:
         if type(key) is slice:
             return frozenlist(super().__getitem__(key))
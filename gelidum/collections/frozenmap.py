@@ -0,0 +1,454 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    from collections import ItemsView, Mapping
+except ImportError:
+    # For python > 3.10
+    from collections.abc import ItemsView, Mapping
+
+from gelidum.exceptions import FrozenException
+from gelidum.frozen import FrozenBase
+from gelidum.typing import FrozenMap, FrozenType
+
+__all__ = ['frozenmap']
+
+
+# Each level of the trie consumes this number of bits of the hash of the key
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # pragma: no cover
+    # For python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
+class _Entry(NamedTuple):
+    hash: int
+    key: Hashable
+    value: Any
+
+
+class _BitmapNode(object):
+    """
+    Node of the trie. The bitmap has a bit set for each one of the 32 positions
+    of this level that are occupied, and children stores them compactly
+    (entries or other nodes) in the order of their position.
+    """
+
+    __slots__ = ('bitmap', 'children')
+
+    def __init__(self, bitmap: int, children: tuple):
+        self.bitmap = bitmap
+        self.children = children
+
+
+class _CollisionNode(object):
+    """
+    Node of the trie with the entries whose keys have the same hash.
+    """
+
+    __slots__ = ('hash', 'entries')
+
+    def __init__(self, hash: int, entries: Tuple[_Entry, ...]):
+        self.hash = hash
+        self.entries = entries
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+# Value returned when a key is not found (None could be a value)
+_MISSING = object()
+
+
+def _find(node: Union[_BitmapNode, _CollisionNode], key_hash: int, key: Hashable) -> Any:
+    shift = 0
+    while type(node) is _BitmapNode:
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+        child = node.children[_popcount(node.bitmap & (bit - 1))]
+        if type(child) is _Entry:
+            if child.hash == key_hash and (child.key is key or child.key == key):
+                return child.value
+            return _MISSING
+        node = child
+        shift += _BITS
+    for entry in node.entries:
+        if entry.key is key or entry.key == key:
+            return entry.value
+    return _MISSING
+
+
+def _merge(entry1: _Entry, entry2: _Entry, shift: int) -> Union[_BitmapNode, _CollisionNode]:
+    """
+    Node containing two entries whose hashes are the same in the bits of the previous levels.
+    """
+    if entry1.hash == entry2.hash:
+        return _CollisionNode(entry1.hash, (entry1, entry2))
+    position1 = (entry1.hash >> shift) & _MASK
+    position2 = (entry2.hash >> shift) & _MASK
+    if position1 == position2:
+        return _BitmapNode(1 << position1, (_merge(entry1, entry2, shift + _BITS),))
+    if position1 > position2:
+        entry1, entry2 = entry2, entry1
+    return _BitmapNode((1 << position1) | (1 << position2), (entry1, entry2))
+
+
+def _replaced(items: tuple, index: int, item: Any) -> tuple:
+    """
+    Copy of the tuple with the item at the index replaced.
+    """
+    next_index = index + 1
+    return items[:index] + (item,) + items[next_index:]
+
+
+def _removed(items: tuple, index: int) -> tuple:
+    """
+    Copy of the tuple without the item at the index.
+    """
+    next_index = index + 1
+    return items[:index] + items[next_index:]
+
+
+def _assoc(
+    node: Union[_BitmapNode, _CollisionNode], entry: _Entry, shift: int
+) -> Tuple[Union[_BitmapNode, _CollisionNode], bool]:
+    """
+    Node with the entry added (or replacing the one with the same key) and
+    whether the number of entries has grown. The nodes that are not in the
+    path to the entry are shared with the original node.
+    """
+    if type(node) is _CollisionNode:
+        return _assoc_collision(node, entry, shift)
+
+    bit = 1 << ((entry.hash >> shift) & _MASK)
+    index = _popcount(node.bitmap & (bit - 1))
+    children = node.children
+    if not node.bitmap & bit:
+        return _BitmapNode(node.bitmap | bit, children[:index] + (entry,) + children[index:]), True
+
+    child = children[index]
+    if type(child) is _Entry:
+        if child.hash == entry.hash and (child.key is entry.key or child.key == entry.key):
+            if child.value is entry.value:
+                return node, False
+            new_child, added = entry, False
+        else:
+            new_child, added = _merge(child, entry, shift + _BITS), True
+    else:
+        new_child, added = _assoc(child, entry, shift + _BITS)
+        if new_child is child:
+            return node, False
+    return _BitmapNode(node.bitmap, _replaced(children, index, new_child)), added
+
+
+def _assoc_collision(
+    node: _CollisionNode, entry: _Entry, shift: int
+) -> Tuple[Union[_BitmapNode, _CollisionNode], bool]:
+    if node.hash != entry.hash:
+        # Put the collision node one level deeper, as a child of a bitmap node
+        parent = _BitmapNode(1 << ((node.hash >> shift) & _MASK), (node,))
+        return _assoc(parent, entry, shift)
+    for index, old_entry in enumerate(node.entries):
+        if old_entry.key is entry.key or old_entry.key == entry.key:
+            if old_entry.value is entry.value:
+                return node, False
+            return _CollisionNode(node.hash, _replaced(node.entries, index, entry)), False
+    return _CollisionNode(node.hash, node.entries + (entry,)), True
+
+
+def _dissoc(
+    node: Union[_BitmapNode, _CollisionNode], key_hash: int, key: Hashable, shift: int
+) -> Union[_BitmapNode, _CollisionNode, _Entry, None]:
+    """
+    Node without the entry of the key. If the node is left with only an entry,
+    the entry is returned (so the parent can store it instead of the node),
+    and if it is left empty, None is returned.
+    The same node is returned if the key is not in it.
+    """
+    if type(node) is _CollisionNode:
+        return _dissoc_collision(node, key)
+
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node
+    index = _popcount(node.bitmap & (bit - 1))
+    children = node.children
+    child = children[index]
+    if type(child) is _Entry:
+        if child.hash != key_hash or not (child.key is key or child.key == key):
+            return node
+        return _without_child(node, bit, index)
+
+    new_child = _dissoc(child, key_hash, key, shift + _BITS)
+    if new_child is child:
+        return node
+    if new_child is None:
+        return _without_child(node, bit, index)
+    if len(children) == 1 and type(new_child) is _Entry:
+        return new_child
+    return _BitmapNode(node.bitmap, _replaced(children, index, new_child))
+
+
+def _dissoc_collision(node: _CollisionNode, key: Hashable) -> Union[_CollisionNode, _Entry]:
+    for index, entry in enumerate(node.entries):
+        if entry.key is key or entry.key == key:
+            entries = _removed(node.entries, index)
+            if len(entries) == 1:
+                return entries[0]
+            return _CollisionNode(node.hash, entries)
+    return node
+
+
+def _without_child(node: _BitmapNode, bit: int, index: int) -> Union[_BitmapNode, _Entry, None]:
+    """
+    Node without the child at the index (whose position in the bitmap is the bit).
+    """
+    children = node.children
+    if len(children) == 1:
+        return None
+    if len(children) == 2 and type(children[1 - index]) is _Entry:
+        return children[1 - index]
+    return _BitmapNode(node.bitmap & ~bit, _removed(children, index))
+
+
+def _iter_entries(node: Union[_BitmapNode, _CollisionNode]) -> Iterator[_Entry]:
+    if type(node) is _CollisionNode:
+        yield from node.entries
+        return
+    for child in node.children:
+        if type(child) is _Entry:
+            yield child
+        else:
+            yield from _iter_entries(child)
+
+
+class frozenmap(Mapping, FrozenBase):  # noqa
+    """
+    Immutable mapping stored in a hash array mapped trie (HAMT).
+
+    set, delete and update return a new frozenmap in O(log n) time that
+    shares all the nodes of the trie that are not modified with this one.
+    """
+
+    # Hash of the frozenmap, computed only the first time it is needed
+    _gelidum_hash: Optional[int] = None
+
+    def __raise_immutable_exception(self, *args, **kwargs):
+        raise FrozenException("'frozenmap' object is immutable")
+
+    def __init__(
+        self,
+        seq: Optional[Union[Mapping, Sequence, Tuple[Hashable, Any]]] = None,
+        freeze_func: Optional[Callable[[Any], FrozenBase]] = None,
+        **kwargs,
+    ):
+        if freeze_func is None:
+            freeze_func = self.__default_freeze_func()
+
+        items = []
+        if seq is not None:
+            items = seq.items() if isinstance(seq, Mapping) else seq
+        root, size = _EMPTY_NODE, 0
+        for items_ in (items, kwargs.items()):
+            for key, value in items_:
+                root, added = _assoc(root, _Entry(hash(key), key, freeze_func(value)), 0)
+                size += added
+        self.__init_trie(root, size)
+
+    @staticmethod
+    def __default_freeze_func() -> Callable[[Any], FrozenType]:
+        # Items referenced several times are frozen only once
+        memo: Dict[int, Any] = {}
+
+        def freeze_func(item: Any) -> FrozenType:
+            from gelidum.freeze import freeze
+
+            return freeze(item, on_update='exception', on_freeze='copy', memo=memo)
+
+        return freeze_func
+
+    def __init_trie(self, root: _BitmapNode, size: int) -> None:
+        object.__setattr__(self, '_frozenmap__root', root)
+        object.__setattr__(self, '_frozenmap__size', size)
+
+    @classmethod
+    def __from_trie(cls, root: Union[_BitmapNode, _Entry, None], size: int) -> 'frozenmap':
+        if root is None:
+            root = _EMPTY_NODE
+        elif type(root) is _Entry:
+            # Only one entry was left in the trie
+            root = _BitmapNode(1 << (root.hash & _MASK), (root,))
+        frozen_map = cls.__new__(cls)
+        frozen_map.__init_trie(root, size)
+        return frozen_map
+
+    @classmethod
+    def _gelidum_on_update(cls, *args, **kwargs):
+        raise FrozenException("'frozenmap' object is immutable")
+
+    @classmethod
+    def get_gelidum_hot_class_name(cls) -> str:
+        return 'dict'
+
+    @classmethod
+    def get_gelidum_hot_class_module(cls) -> str:
+        return 'builtins.dict'
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = _find(self.__root, hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = _find(self.__root, hash(key), key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return _find(self.__root, hash(key), key) is not _MISSING
+        except TypeError:
+            # Unhashable keys
+            return False
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for entry in _iter_entries(self.__root):
+            yield entry.key
+
+    def items(self):
+        return _FrozenMapItemsView(self)
+
+    def __hash__(self) -> int:
+        """
+        Hash of the items of the frozenmap, the same as the one
+        of a frozendict with the same items.
+        """
+        if self._gelidum_hash is None:
+            object.__setattr__(self, '_gelidum_hash', hash(frozenset(self.items())))
+        return self._gelidum_hash
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, frozenmap):
+            if self.__size != other.__size:
+                return False
+            for entry in _iter_entries(self.__root):
+                other_value = _find(other.__root, entry.hash, entry.key)
+                if other_value is _MISSING or not (other_value is entry.value or other_value == entry.value):
+                    return False
+            return True
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f'frozenmap({dict(self.items())!r})'
+
+    def __reduce__(self):
+        return self.__class__, (dict(self.items()),)
+
+    def set(self, key: Hashable, value: Any) -> 'frozenmap':
+        """
+        New frozenmap with the key set to the frozen value.
+        """
+        root, added = _assoc(self.__root, _Entry(hash(key), key, self.__freeze(value)), 0)
+        if root is self.__root:
+            return self
+        return self.__from_trie(root, self.__size + added)
+
+    def delete(self, key: Hashable) -> 'frozenmap':
+        """
+        New frozenmap without the key. Raises KeyError if the key is not present.
+        """
+        root = _dissoc(self.__root, hash(key), key, 0)
+        if root is self.__root:
+            raise KeyError(key)
+        return self.__from_trie(root, self.__size - 1)
+
+    def update(self, seq: Optional[Union[Mapping, Sequence, Tuple[Hashable, Any]]] = None, **kwargs) -> 'frozenmap':
+        """
+        New frozenmap with the items of the mapping (or sequence of pairs)
+        and the keyword arguments set.
+        """
+        items = []
+        if seq is not None:
+            items = seq.items() if isinstance(seq, Mapping) else seq
+        freeze_func = self.__default_freeze_func()
+        root, size = self.__root, self.__size
+        for items_ in (items, kwargs.items()):
+            for key, value in items_:
+                root, added = _assoc(root, _Entry(hash(key), key, freeze_func(value)), 0)
+                size += added
+        if root is self.__root:
+            return self
+        return self.__from_trie(root, size)
+
+    @staticmethod
+    def __freeze(value: Any) -> FrozenType:
+        from gelidum.freeze import freeze
+
+        return freeze(value, on_update='exception', on_freeze='copy')
+
+    def __add__(self, other: FrozenMap) -> FrozenMap:
+        return self.update(other)
+
+    def __or__(self, other: FrozenMap) -> FrozenMap:
+        return self.update(other)
+
+    def __sub__(self, other: FrozenMap) -> FrozenMap:
+        frozen_map = self
+        for key in other:
+            if key in frozen_map:
+                frozen_map = frozen_map.delete(key)
+        return frozen_map
+
+    def pop(self, *args, **kwargs):
+        self.__raise_immutable_exception()
+
+    def popitem(self, *args, **kwarg):
+        self.__raise_immutable_exception()
+
+    def __setitem__(self, key, val, *args, **kwargs):
+        self.__raise_immutable_exception()
+
+    def __delitem__(self, key, *args, **kwargs):
+        self.__raise_immutable_exception()
+
+    def clear(self):
+        self.__raise_immutable_exception()
+
+    def setdefault(self, *args, **kwargs):
+        self.__raise_immutable_exception()
+
+    def copy(self) -> 'frozenmap':
+        """
+        frozenmap objects are only shallow-copied.
+        """
+        return self
+
+
+class _FrozenMapItemsView(ItemsView):
+    """
+    Items view of a frozenmap that iterates its entries without looking up the values.
+    """
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, Any]]:
+        for entry in _iter_entries(self._mapping._frozenmap__root):
+            yield entry.key, entry.value
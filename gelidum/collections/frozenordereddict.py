@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from typing import Any, Iterator
+
+from gelidum.collections.frozendict import frozendict
+from gelidum.exceptions import FrozenException
+
+__all__ = ['frozenordereddict']
+
+
+class frozenordereddict(frozendict):  # noqa
+    """
+    frozendict that compares with ordered dicts as OrderedDict does,
+    i.e. taking into account the order of the items.
+    """
+
+    def __raise_immutable_exception(self, *args, **kwargs):
+        raise FrozenException("'frozenordereddict' object is immutable")
+
+    @classmethod
+    def _gelidum_on_update(cls, *args, **kwargs):
+        raise FrozenException("'frozenordereddict' object is immutable")
+
+    @classmethod
+    def get_gelidum_hot_class_name(cls) -> str:
+        return 'OrderedDict'
+
+    @classmethod
+    def get_gelidum_hot_class_module(cls) -> str:
+        return 'collections.OrderedDict'
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (OrderedDict, frozenordereddict)):
+            return dict.__eq__(self, other) and all(key == other_key for key, other_key in zip(self, other))
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    # Equal frozenordereddict objects are equal as dicts too, so they have the same hash
+    __hash__ = frozendict.__hash__
+
+    def __reversed__(self) -> Iterator[Any]:
+        # dicts are reversible since Python 3.8 only
+        return reversed(list(self))
+
+    def move_to_end(self, key: Any, last: bool = True) -> None:
+        self.__raise_immutable_exception()
+
+    def __repr__(self) -> str:
+        return f'frozenordereddict({list(self.items())!r})'
@@ -0,0 +1,367 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    from collections import Sequence as SequenceABC
+except ImportError:
+    # For python > 3.10
+    from collections.abc import Sequence as SequenceABC
+
+from gelidum.exceptions import FrozenException
+from gelidum.frozen import FrozenBase
+from gelidum.typing import FrozenType, FrozenVector
+
+__all__ = ['frozenvector']
+
+
+_FrozenVectorParameterType = Optional[Union[Sequence, Generator, Iterable]]
+
+# Each level of the trie consumes this number of bits of the index
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+# The state of a vector is a tuple (root, shift, tail, count) where:
+# - root is the root node of the trie. Nodes are tuples of up to 32 children,
+#   and the leaves (the nodes at level 0) are tuples of up to 32 items.
+# - shift is the number of bits of the index consumed by the levels below the root.
+# - tail is the last leaf, that is kept outside the trie to make appending cheap.
+# - count is the number of items.
+_VectorState = Tuple[tuple, int, tuple, int]
+
+_EMPTY_STATE: _VectorState = ((), _BITS, (), 0)
+
+
+def _tail_offset(count: int) -> int:
+    if count < _WIDTH:
+        return 0
+    return ((count - 1) >> _BITS) << _BITS
+
+
+def _leaf_for(state: _VectorState, index: int) -> tuple:
+    root, shift, tail, count = state
+    if index >= _tail_offset(count):
+        return tail
+    node = root
+    level = shift
+    while level > 0:
+        node = node[(index >> level) & _MASK]
+        level -= _BITS
+    return node
+
+
+def _new_path(level: int, node: tuple) -> tuple:
+    while level > 0:
+        node = (node,)
+        level -= _BITS
+    return node
+
+
+def _replaced(items: tuple, index: int, item: Any) -> tuple:
+    """
+    Copy of the tuple with the item at the index replaced.
+    """
+    next_index = index + 1
+    return items[:index] + (item,) + items[next_index:]
+
+
+def _chunks(items: Sequence, stop: int) -> List[tuple]:
+    """
+    Tuples of _WIDTH consecutive items of the sequence, from its start to stop.
+    """
+    chunks = []
+    for start in range(0, stop, _WIDTH):
+        end = start + _WIDTH
+        chunks.append(tuple(items[start:end]))
+    return chunks
+
+
+def _push_tail(level: int, parent: tuple, count: int, tail: tuple) -> tuple:
+    index = ((count - 1) >> level) & _MASK
+    if level == _BITS:
+        child = tail
+    elif index < len(parent):
+        child = _push_tail(level - _BITS, parent[index], count, tail)
+    else:
+        child = _new_path(level - _BITS, tail)
+    return _replaced(parent, index, child)
+
+
+def _append(state: _VectorState, value: Any) -> _VectorState:
+    root, shift, tail, count = state
+    if count - _tail_offset(count) < _WIDTH:
+        return root, shift, tail + (value,), count + 1
+    # The tail is full: it is moved into the trie
+    if (count >> _BITS) > (1 << shift):
+        # No room left in the root: the trie grows one level
+        root, shift = (root, _new_path(shift, tail)), shift + _BITS
+    else:
+        root = _push_tail(shift, root, count, tail)
+    return root, shift, (value,), count + 1
+
+
+def _assoc(level: int, node: tuple, index: int, value: Any) -> tuple:
+    child_index = (index >> level) & _MASK
+    if level == 0:
+        child = value
+    else:
+        child = _assoc(level - _BITS, node[child_index], index, value)
+    return _replaced(node, child_index, child)
+
+
+def _set(state: _VectorState, index: int, value: Any) -> _VectorState:
+    root, shift, tail, count = state
+    if index >= _tail_offset(count):
+        tail_index = index & _MASK
+        return root, shift, _replaced(tail, tail_index, value), count
+    return _assoc(shift, root, index, value), shift, tail, count
+
+
+def _pop_tail(level: int, node: tuple, count: int) -> Optional[tuple]:
+    index = ((count - 2) >> level) & _MASK
+    if level > _BITS:
+        child = _pop_tail(level - _BITS, node[index], count)
+        if child is not None:
+            return node[:index] + (child,)
+    return node[:index] or None
+
+
+def _pop(state: _VectorState) -> _VectorState:
+    root, shift, tail, count = state
+    if count == 1:
+        return _EMPTY_STATE
+    if count - _tail_offset(count) > 1:
+        return root, shift, tail[:-1], count - 1
+    # The tail is left empty: the last leaf of the trie is the new tail
+    new_tail = _leaf_for(state, count - 2)
+    root = _pop_tail(shift, root, count) or ()
+    if shift > _BITS and len(root) == 1:
+        root, shift = root[0], shift - _BITS
+    return root, shift, new_tail, count - 1
+
+
+def _from_items(items: Sequence) -> _VectorState:
+    count = len(items)
+    tail_offset = _tail_offset(count)
+    nodes = _chunks(items, tail_offset)
+    shift = _BITS
+    while len(nodes) > _WIDTH:
+        nodes = _chunks(nodes, len(nodes))
+        shift += _BITS
+    return tuple(nodes), shift, tuple(items[tail_offset:]), count
+
+
+class frozenvector(SequenceABC, FrozenBase):  # noqa
+    """
+    Immutable sequence stored in a bit-partitioned vector trie.
+
+    append, set and pop return a new frozenvector in O(log n) time that
+    shares all the nodes of the trie that are not modified with this one.
+    Slices with step 1 are frozenvectors that share the trie of the sliced one.
+    """
+
+    # Hash of the frozenvector, computed only the first time it is needed
+    _gelidum_hash: Optional[int] = None
+
+    def __raise_immutable_exception(self, *args, **kwargs):
+        raise FrozenException("'frozenvector' object is immutable")
+
+    def __init__(
+        self,
+        seq: Optional[_FrozenVectorParameterType] = None,
+        freeze_func: Optional[Callable[[Any], FrozenBase]] = None,
+    ):
+        if freeze_func is None:
+            freeze_func = self.__default_freeze_func()
+        state = _from_items([freeze_func(item) for item in seq]) if seq else _EMPTY_STATE
+        self.__init_state(state, 0, state[3])
+
+    @staticmethod
+    def __default_freeze_func() -> Callable[[Any], FrozenType]:
+        # Items referenced several times are frozen only once
+        memo: Dict[int, Any] = {}
+
+        def freeze_func(item: Any) -> FrozenType:
+            from gelidum.freeze import freeze
+
+            return freeze(item, on_update='exception', on_freeze='copy', memo=memo)
+
+        return freeze_func
+
+    def __init_state(self, state: _VectorState, start: int, size: int) -> None:
+        # The items of the vector are the ones of the state from start to start + size
+        object.__setattr__(self, '_frozenvector__state', state)
+        object.__setattr__(self, '_frozenvector__start', start)
+        object.__setattr__(self, '_frozenvector__size', size)
+
+    @classmethod
+    def __from_state(cls, state: _VectorState, start: int, size: int) -> 'frozenvector':
+        frozen_vector = cls.__new__(cls)
+        frozen_vector.__init_state(state, start, size)
+        return frozen_vector
+
+    @classmethod
+    def _gelidum_on_update(cls, *args, **kwargs):
+        raise FrozenException("'frozenvector' object is immutable")
+
+    @classmethod
+    def get_gelidum_hot_class_name(cls) -> str:
+        return 'list'
+
+    @classmethod
+    def get_gelidum_hot_class_module(cls) -> str:
+        return 'builtins.list'
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if type(key) is slice:
+            start, stop, step = key.indices(self.__size)
+            if step == 1:
+                return self.__from_state(self.__state, self.__start + start, max(0, stop - start))
+            items = [self[index] for index in range(start, stop, step)]
+            return self.__from_state(_from_items(items), 0, len(items))
+        if key < 0:
+            key += self.__size
+        if not 0 <= key < self.__size:
+            raise IndexError('frozenvector index out of range')
+        index = self.__start + key
+        return _leaf_for(self.__state, index)[index & _MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        state = self.__state
+        index = self.__start
+        stop = index + self.__size
+        while index < stop:
+            leaf_index = index & _MASK
+            leaf_end = leaf_index + stop - index
+            items = _leaf_for(state, index)[leaf_index:leaf_end]
+            yield from items
+            index += len(items)
+
+    def __hash__(self) -> int:
+        """
+        tuple hash, computed once and stored in the instance.
+        """
+        if self._gelidum_hash is None:
+            object.__setattr__(self, '_gelidum_hash', hash(tuple(self)))
+        return self._gelidum_hash
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, (frozenvector, tuple)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return all(item is other_item or item == other_item for item, other_item in zip(self, other))
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self) -> str:
+        return f'frozenvector({list(self)!r})'
+
+    def __reduce__(self):
+        return self.__class__, (tuple(self),)
+
+    def __with_appended(self, items: Iterable[Any]) -> 'frozenvector':
+        state, start, size = self.__state, self.__start, self.__size
+        for item in items:
+            stop = start + size
+            if stop == state[3]:
+                state = _append(state, item)
+            else:
+                # Slice that does not reach the end of the trie: the items
+                # after the slice are not part of it and can be replaced
+                state = _set(state, stop, item)
+            size += 1
+        return self.__from_state(state, start, size)
+
+    @staticmethod
+    def __freeze(value: Any) -> FrozenType:
+        from gelidum.freeze import freeze
+
+        return freeze(value, on_update='exception', on_freeze='copy')
+
+    def append(self, value: Any) -> 'frozenvector':
+        """
+        New frozenvector with the frozen value added at the end.
+        """
+        return self.__with_appended((self.__freeze(value),))
+
+    def extend(self, values: Iterable[Any]) -> 'frozenvector':
+        """
+        New frozenvector with the frozen values added at the end.
+        """
+        return self.__with_appended(map(self.__default_freeze_func(), values))
+
+    def set(self, index: int, value: Any) -> 'frozenvector':
+        """
+        New frozenvector with the item in the index replaced by the frozen value.
+        """
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError('frozenvector assignment index out of range')
+        state = _set(self.__state, self.__start + index, self.__freeze(value))
+        return self.__from_state(state, self.__start, self.__size)
+
+    def pop(self) -> 'frozenvector':
+        """
+        New frozenvector without the last item.
+        """
+        if not self.__size:
+            raise IndexError('pop from empty frozenvector')
+        if self.__start == 0 and self.__size == self.__state[3]:
+            state = _pop(self.__state)
+            return self.__from_state(state, 0, state[3])
+        return self.__from_state(self.__state, self.__start, self.__size - 1)
+
+    def __add__(self, other: FrozenVector) -> FrozenVector:
+        return self.extend(other)
+
+    def __mul__(self, other: int) -> FrozenVector:
+        if other <= 0:
+            return self[:0]
+        return self.__with_appended(tuple(self) * (other - 1))
+
+    def __setitem__(self, key, value):
+        self.__raise_immutable_exception()
+
+    def __delitem__(self, key):
+        self.__raise_immutable_exception()
+
+    def insert(self, *args, **kwargs):
+        self.__raise_immutable_exception()
+
+    def remove(self, *args, **kwargs):
+        self.__raise_immutable_exception()
+
+    def clear(self):
+        self.__raise_immutable_exception()
+
+    def sort(self, *args, **kwargs):
+        self.__raise_immutable_exception()
+
+    def reverse(self):
+        self.__raise_immutable_exception()
+
+    def copy(self) -> 'frozenvector':
+        """
+        frozenvector objects are only shallow-copied.
+        """
+        return self
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Generator, Iterable, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Generator, Iterable, Optional, Sequence, Union
 
 from gelidum.exceptions import FrozenException
 from gelidum.frozen import FrozenBase
@@ -17,11 +17,13 @@ class frozenzet(frozenset, FrozenBase):  # noqa
         cls, seq: Optional[_FrozenZetParameterType] = None, freeze_func: Optional[Callable[[Any], FrozenBase]] = None
     ) -> 'frozenzet':
         if freeze_func is None:
+            # Items referenced several times are frozen only once
+            memo: Dict[int, Any] = {}
 
             def freeze_func(item: Any) -> FrozenType:
                 from gelidum.freeze import freeze
 
-                return freeze(item, on_update='exception', on_freeze='copy')
+                return freeze(item, on_update='exception', on_freeze='copy', memo=memo)
 
         if seq:
             self = frozenset.__new__(cls, (freeze_func(arg) for arg in seq))
@@ -47,7 +49,11 @@ class frozenzet(frozenset, FrozenBase):  # noqa
         return 'builtins.frozenset'
 
     def __hash__(self) -> int:
-        return hash(tuple(v for v in self))
+        """
+        frozenset hash, that does not depend on the iteration order
+        and is computed only once.
+        """
+        return frozenset.__hash__(self)
 
     def __add__(self, other: FrozenZet) -> FrozenZet:
         joined_set = set()
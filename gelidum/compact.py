@@ -0,0 +1,43 @@
+from typing import Any, Tuple, Union
+
+from gelidum.freeze import freeze
+from gelidum.frozen import FrozenBase, isfrozen, make_compact_frozen_class
+from gelidum.typing import FrozenType, OnUpdateFuncType
+
+__all__ = ['compact']
+
+
+def compact(obj: Any, on_update: Union[str, OnUpdateFuncType] = 'exception') -> FrozenType:
+    """
+    Compact version of a frozen object, i.e. an object of a frozen class generated (only once) for
+    its frozen class and attributes, that stores the attribute values in slots instead of in a __dict__.
+    Mutable objects are frozen by copy (with the on_update policy) before being compacted.
+    The attribute values are shared with the frozen object, so the frozen objects referenced
+    by them are not compacted. Compact objects are not instances of the original class.
+    Only frozen objects of classes without __slots__ are compacted,
+    the rest of frozen values are returned as they are.
+    """
+    if not isfrozen(obj):
+        obj = freeze(obj, on_update=on_update)
+
+    frozen_class = type(obj)
+    bases = frozen_class.__bases__
+    if len(bases) != 2 or bases[0] is not FrozenBase or hasattr(bases[1], '__slots__'):
+        # Not a frozen object made by __freeze_object from a class without __slots__
+        # (e.g. frozen collections, views or lazy frozen objects)
+        return obj
+
+    attrs: Tuple[str, ...] = tuple(obj.__dict__)
+    if not all(__is_slot_name(attr) for attr in attrs):
+        return obj
+
+    compact_frozen_class = make_compact_frozen_class(frozen_class=frozen_class, attrs=attrs)
+    compact_obj = compact_frozen_class.__new__(compact_frozen_class)
+    for attr, attr_value in obj.__dict__.items():
+        object.__setattr__(compact_obj, attr, attr_value)
+    return compact_obj
+
+
+def __is_slot_name(attr: str) -> bool:
+    # Private names would be mangled in the __slots__ of the compact frozen class
+    return attr.isidentifier() and not (attr.startswith('__') and not attr.endswith('__'))
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import functools
-from typing import Any, Iterable, Optional, Set
+from typing import Any, Callable, Iterable, Optional, Set, TypeVar, Union
 
-from gelidum.freeze import freeze
+from gelidum.exceptions import FrozenException
+from gelidum.freeze import compile_freeze_plan, freeze
+from gelidum.frozen import make_frozen_class
+from gelidum.on_update import on_update_func_creator
+from gelidum.typing import OnUpdateFuncType
+
+_ClassType = TypeVar('_ClassType', bound=type)
 
 
 def freeze_params(params: Optional[Iterable[str]] = None):
@@ -57,3 +63,46 @@ def freeze_freezable(func):
 def __param_is_freezable(param_typing: Any) -> bool:
     param_typing_str = str(param_typing)
     return param_typing_str.startswith('gelidum.typing.Freezable')
+
+
+def immutable(
+    klass: Optional[_ClassType] = None, *, on_update: Union[str, OnUpdateFuncType] = 'exception', validate: bool = False
+) -> Union[_ClassType, Callable[[_ClassType], _ClassType]]:
+    """
+    Class decorator that freezes the objects of a class inplace as the last step of their __init__,
+    so they are immutable from their creation. The frozen class is created when decorating the class,
+    and the attribute values are frozen (by copy) by the freeze plan of the class
+    (see compile_freeze_plan, compiled the first time an object is created).
+    Use it as @immutable or @immutable(on_update=..., validate=...).
+    The objects of subclasses are not frozen unless the subclasses are decorated too.
+    """
+
+    def decorate(klass: _ClassType) -> _ClassType:
+        if hasattr(klass, '__slots__'):
+            raise FrozenException('Objects of classes with __slots__ cannot be frozen inplace')
+
+        on_update_func = on_update_func_creator(on_update=on_update)
+        frozen_class = make_frozen_class(klass=klass, attrs=tuple(), on_update=on_update_func)
+        original_init = klass.__init__
+        freeze_plan: Optional[Callable[..., Any]] = None
+
+        @functools.wraps(original_init)
+        def __init__(self, *args, **kwargs) -> None:
+            nonlocal freeze_plan
+            if type(self) is frozen_class:
+                # Objects created from the frozen class (e.g. by dataclasses.replace) are initialized as mutable ones
+                object.__setattr__(self, '__class__', klass)
+            original_init(self, *args, **kwargs)
+            if type(self) is klass:
+                if freeze_plan is None:
+                    freeze_plan = compile_freeze_plan(klass, validate=validate, on_freeze='inplace')
+                freeze_plan(self, on_update=on_update_func)
+
+        klass.__init__ = __init__
+        return klass
+
+    return decorate if klass is None else decorate(klass)
+
+
+# Alias of immutable
+frozen = immutable
@@ -0,0 +1,218 @@
+from collections import deque
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Union
+
+from gelidum.collections import (
+    frozendeque,
+    frozendict,
+    frozenlist,
+    frozenmap,
+    frozenvector,
+)
+from gelidum.freeze import freeze
+from gelidum.frozen import FrozenBase, FrozenSlotsBase
+from gelidum.lazy import lazyfrozendict, lazyfrozenlist
+from gelidum.typing import FrozenType
+
+__all__ = ['assoc_in', 'evolve', 'update_in']
+
+# Value of the missing last key of the path of assoc_in
+_MISSING = object()
+
+
+def evolve(frozen_obj: FrozenType, **changes: Any) -> FrozenType:
+    """
+    Make a new frozen value from a frozen object, frozen dataclass or frozendict
+    by changing some of its attributes (or keys, in the case of frozendicts).
+
+    Only the top-level storage (the __dict__, the slots or the dict items) is copied:
+    the new values are frozen, and the rest of the values are shared with frozen_obj.
+    If no value changes, frozen_obj is returned.
+    """
+    memo: Dict[int, Any] = {}
+    new_values = {
+        name: freeze(value, on_update='exception', on_freeze='copy', memo=memo) for name, value in changes.items()
+    }
+
+    if isinstance(frozen_obj, frozendict):
+        return __evolve_frozendict(frozen_obj, new_values)
+    if isinstance(frozen_obj, FrozenSlotsBase) or __is_frozen_object_class(type(frozen_obj)):
+        return __evolve_frozen_object(frozen_obj, new_values)
+    raise TypeError(f"'{type(frozen_obj).__name__}' objects cannot be evolved")
+
+
+def update_in(frozen_obj: FrozenType, path: Iterable[Hashable], func: Callable[[Any], Any]) -> FrozenType:
+    """
+    Make a new frozen value from a frozen tree by replacing the value at the end of the path
+    with the frozen result of calling func with it.
+
+    The path is a sequence of keys of frozendicts (and frozenmaps), indexes of frozenlists,
+    tuples (and frozenvectors) and attribute names of frozen objects. Only the nodes along the path
+    are copied (as in evolve), so the new tree shares the rest of the nodes with frozen_obj.
+    If the value does not change, frozen_obj is returned.
+    """
+    path = tuple(path)
+    nodes = __get_path_nodes(frozen_obj, path)
+    value = freeze(func(nodes[-1]), on_update='exception', on_freeze='copy')
+    return __set_path_nodes(nodes, path, value)
+
+
+def assoc_in(frozen_obj: FrozenType, path: Iterable[Hashable], value: Any) -> FrozenType:
+    """
+    Make a new frozen value from a frozen tree by setting the frozen value at the end of the path.
+    The last key of the path is added if it is not in the frozendict (or frozenmap).
+    See update_in.
+    """
+    path = tuple(path)
+    nodes = __get_path_nodes(frozen_obj, path[:-1])
+    if path:
+        try:
+            nodes.append(__get_child(nodes[-1], path[-1]))
+        except (KeyError, IndexError, AttributeError):
+            nodes.append(_MISSING)
+    return __set_path_nodes(nodes, path, freeze(value, on_update='exception', on_freeze='copy'))
+
+
+def __get_path_nodes(frozen_obj: FrozenType, path: tuple) -> List[Any]:
+    nodes = [frozen_obj]
+    for key in path:
+        nodes.append(__get_child(nodes[-1], key))
+    return nodes
+
+
+def __set_path_nodes(nodes: List[Any], path: tuple, value: FrozenType) -> FrozenType:
+    # The nodes are copied from the end of the path to the root,
+    # until a node does not change (then, neither do its ancestors)
+    for depth in range(len(path) - 1, -1, -1):
+        if value is nodes[depth + 1]:
+            return nodes[0]
+        value = __set_child(nodes[depth], path[depth], value)
+    return value
+
+
+def __get_child(node: Any, key: Hashable) -> Any:
+    if isinstance(node, tuple) and isinstance(key, str):
+        # Field of a namedtuple
+        return getattr(node, key)
+    if isinstance(node, (dict, tuple, frozenmap, frozenvector)):
+        return node[key]
+    return getattr(node, key)
+
+
+def __set_child(node: Any, key: Hashable, value: FrozenType) -> FrozenType:
+    if isinstance(node, frozendict):
+        return __evolve_frozendict(node, {key: value})
+    if isinstance(node, (frozenmap, frozenvector)):
+        return node.set(key, value)
+    if isinstance(node, tuple):
+        if isinstance(key, str) and hasattr(node, '_replace'):
+            # Field of a namedtuple
+            return node._replace(**{key: value})
+        items = list(node)
+        items[key] = value
+        if isinstance(node, frozenlist):
+            return _copy_frozen_collection(node, items)
+        if type(node) is tuple:
+            return tuple(items)
+        if hasattr(node, '_make'):
+            return node._make(items)
+    elif isinstance(node, FrozenSlotsBase) or __is_frozen_object_class(type(node)):
+        return __evolve_frozen_object(node, {key: value})
+    raise TypeError(f"'{type(node).__name__}' objects cannot be updated")
+
+
+def __is_frozen_object_class(klass: type) -> bool:
+    bases = klass.__bases__
+    if len(bases) == 1 and bases[0].__dict__.get('_gelidum_lazy_class') is klass:
+        # Lazy frozen classes derive from the frozen class of the object
+        bases = bases[0].__bases__
+    # Frozen classes of objects derive from FrozenBase and the original class
+    return len(bases) == 2 and bases[0] is FrozenBase
+
+
+def __evolve_frozendict(frozen_dict: frozendict, new_values: Dict[str, FrozenType]) -> frozendict:
+    if all(key in frozen_dict and dict.__getitem__(frozen_dict, key) is value for key, value in new_values.items()):
+        return frozen_dict
+    # The values of lazy frozendicts are frozen when they are copied
+    values = dict(frozen_dict)
+    values.update(new_values)
+    return _copy_frozen_collection(frozen_dict, values)
+
+
+def _copy_frozen_collection(
+    frozen_collection: Union[frozendict, frozenlist], items: Union[Mapping, List[FrozenType]]
+) -> Union[frozendict, frozenlist]:
+    """
+    Copy of a frozendict (or frozenlist) with other frozen items. The copy has the class and the
+    instance attributes (e.g. the default_factory of frozendefaultdicts or the maxlen of frozendeques)
+    of frozen_collection, except for the copies of lazy frozen collections, that are not lazy.
+    """
+    if isinstance(frozen_collection, frozendict):
+        klass = frozendict if isinstance(frozen_collection, lazyfrozendict) else type(frozen_collection)
+        frozen_copy = klass.__new__(klass)
+        dict.update(frozen_copy, items)
+    else:
+        klass = frozenlist if isinstance(frozen_collection, lazyfrozenlist) else type(frozen_collection)
+        if isinstance(frozen_collection, frozendeque) and frozen_collection.maxlen is not None:
+            # As in a deque, only the last maxlen items are kept
+            items = deque(items, maxlen=frozen_collection.maxlen)
+        frozen_copy = tuple.__new__(klass, items)
+    if klass is type(frozen_collection):
+        for name, value in frozen_collection.__dict__.items():
+            # The attributes of gelidum (e.g. the cached hash) are not copied
+            if not name.startswith('_gelidum_'):
+                object.__setattr__(frozen_copy, name, value)
+    return frozen_copy
+
+
+def __evolve_frozen_object(frozen_obj: Any, new_values: Dict[str, FrozenType]) -> Any:
+    klass = type(frozen_obj)
+    obj_dict = getattr(frozen_obj, '__dict__', None)
+    lazy_attrs: Dict[str, Any] = {} if obj_dict is None else obj_dict.get('_gelidum_lazy_attrs', {})
+    slots = __get_slots(klass)
+
+    for name in new_values:
+        if (obj_dict is None or name not in obj_dict) and name not in lazy_attrs and name not in slots:
+            raise AttributeError(f"'{frozen_obj.get_gelidum_hot_class_name()}' object has no attribute '{name}'")
+    if all(name not in lazy_attrs and getattr(frozen_obj, name, None) is value for name, value in new_values.items()):
+        return frozen_obj
+
+    evolved_obj = klass.__new__(klass)
+    if obj_dict is not None:
+        evolved_obj.__dict__.update(obj_dict)
+        if lazy_attrs:
+            # The pending attributes are removed from this dict when they are read, so it cannot be shared
+            evolved_obj.__dict__['_gelidum_lazy_attrs'] = {
+                name: value for name, value in lazy_attrs.items() if name not in new_values
+            }
+    for slot in slots.values():
+        try:
+            slot.__set__(evolved_obj, slot.__get__(frozen_obj, klass))
+        except AttributeError:
+            # Slot not assigned in frozen_obj
+            pass
+    for name, value in new_values.items():
+        object.__setattr__(evolved_obj, name, value)
+    return evolved_obj
+
+
+__SLOTS_BY_CLASS: Dict[type, Dict[str, MemberDescriptorType]] = {}
+
+
+def __get_slots(klass: type) -> Dict[str, MemberDescriptorType]:
+    """
+    Slot descriptors of the class (and of its bases) by attribute name.
+    Computed only the first time for each class.
+    """
+    try:
+        return __SLOTS_BY_CLASS[klass]
+    except KeyError:
+        pass
+    slots = {
+        name: attr
+        for base in reversed(klass.__mro__)
+        for name, attr in base.__dict__.items()
+        if isinstance(attr, MemberDescriptorType)
+    }
+    __SLOTS_BY_CLASS[klass] = slots
+    return slots
@@ -1,19 +1,85 @@
+import array
+import dataclasses
+import functools
+import inspect
 import io
 import sys
+import threading
 import warnings
-from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from collections import Counter, OrderedDict, defaultdict, deque
+from inspect import isgeneratorfunction
+from types import FunctionType, ModuleType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    get_type_hints,
+)
 
-from gelidum.collections import frozendict, frozenlist, frozenzet
+from gelidum.cache import FreezeCache
+from gelidum.collections import (
+    frozenarray,
+    frozencounter,
+    frozendefaultdict,
+    frozendeque,
+    frozendict,
+    frozenlist,
+    frozenordereddict,
+    frozenzet,
+)
 from gelidum.dependencies import NUMPY_INSTALLED
 from gelidum.exceptions import FrozenException
-from gelidum.frozen import FrozenBase, isfrozen, make_frozen_class
-from gelidum.frozen.frozen_class_creator import make_unique_class
-from gelidum.on_freeze import OnFreezeCopier, on_freeze_func_creator
-from gelidum.typing import FrozenList, FrozenType, OnFreezeFuncType, OnUpdateFuncType, T
+from gelidum.frozen import (
+    FrozenBase,
+    FrozenSlotsBase,
+    isfrozen,
+    make_frozen_class,
+    make_frozen_dataclass,
+    mark_frozen_inplace,
+)
+from gelidum.lazy import lazyfrozendict, lazyfrozenlist, make_lazy_frozen_object
+from gelidum.on_freeze import (
+    _ON_FREEZE_COPIER,
+    _ON_FREEZE_IDENTITY_FUNC,
+    OnFreezeCopier,
+    on_freeze_func_creator,
+)
+from gelidum.on_update import on_update_func_creator
+from gelidum.typing import (
+    FreezerFuncType,
+    FrozenList,
+    FrozenType,
+    OnFreezeFuncType,
+    OnUpdateFuncType,
+    T,
+    get_freezable_type_hint,
+    get_type_hint_args,
+    get_type_hint_classes,
+    is_immutable_type_hint,
+    is_union_type_hint,
+)
 from gelidum.utils import isbuiltin
+from gelidum.views import (
+    frozendictview,
+    frozenlistview,
+    frozenobjectview,
+    frozensetview,
+)
 
 if NUMPY_INSTALLED:
+    import numpy as np
+
     from gelidum.collections import frozenndarray
 
 NpArrayType = Any
@@ -25,6 +91,7 @@ def freeze(
     on_freeze: Union[str, OnFreezeFuncType] = 'copy',
     save_original_on_copy: bool = False,
     inplace: Optional[bool] = None,
+    memo: Optional[Dict[int, Any]] = None,
 ) -> FrozenType:
 
     # inplace argument will be removed from freeze in the next major version (0.6.0)
@@ -42,17 +109,560 @@ def freeze(
         if hasattr(obj.__class__, '__slots__') and on_freeze == 'inplace':
             raise FrozenException('Objects of classes with __slots__ cannot be frozen inplace')
 
+        if on_freeze == 'view':
+            return __view(obj=obj, on_update=on_update_func_creator(on_update=on_update))
+
+        if on_freeze == 'lazy':
+            return __lazy_freeze(obj=obj, on_update=on_update_func_creator(on_update=on_update), memo=memo)
+
         on_freeze_func: OnFreezeFuncType = on_freeze_func_creator(on_freeze=on_freeze)
 
-    on_update_func: OnUpdateFuncType = __on_update_func(on_update=on_update)
+    on_update_func: OnUpdateFuncType = on_update_func_creator(on_update=on_update)
+
+    # Objects frozen by a copier with a cache are frozen only the first time
+    cache: Optional[FreezeCache] = on_freeze_func.cache if isinstance(on_freeze_func, OnFreezeCopier) else None
+    if cache is not None and not save_original_on_copy and not isbuiltin(obj) and not isfrozen(obj):
+        frozen_obj = cache.get(obj, on_update=on_update_func, default=cache)
+        if frozen_obj is cache:
+            frozen_obj = __freeze(obj=obj, on_update=on_update_func, on_freeze=on_freeze_func, memo=memo)
+            cache.set(obj, frozen_obj, on_update=on_update_func)
+        return frozen_obj
 
     return __freeze(
-        obj=obj, on_update=on_update_func, on_freeze=on_freeze_func, save_original_on_copy=save_original_on_copy
+        obj=obj,
+        on_update=on_update_func,
+        on_freeze=on_freeze_func,
+        save_original_on_copy=save_original_on_copy,
+        memo=memo,
     )
 
 
+def freeze_many(
+    objs: Iterable[T],
+    on_update: Union[str, OnUpdateFuncType] = 'exception',
+    on_freeze: Union[str, OnFreezeFuncType] = 'copy',
+    memo: Optional[Dict[int, Any]] = None,
+    generator: bool = False,
+) -> Union[FrozenList, Iterator[FrozenType]]:
+    """
+    Freeze the objects of an iterable as freeze does, but resolving the on_update and
+    on_freeze policies only once, and the way of freezing the objects of each class
+    only for the first object of that class. The objects share the memo, so the
+    objects referenced by several of them are frozen only once.
+    Return a frozenlist of the frozen objects, or a generator of them if generator is True.
+    The generator does not share a memo between the objects unless one is passed, so it
+    only keeps alive the object being frozen (and the values referenced by it).
+    """
+    if on_freeze in ('view', 'lazy') or (isinstance(on_freeze, OnFreezeCopier) and on_freeze.cache is not None):
+        # These policies are not applied by __freeze
+        frozen_objs = (freeze(obj, on_update=on_update, on_freeze=on_freeze, memo=memo) for obj in objs)
+    elif generator and memo is None:
+        frozen_objs = __freeze_many_unshared(
+            objs,
+            on_update=on_update_func_creator(on_update=on_update),
+            on_freeze=on_freeze_func_creator(on_freeze=on_freeze),
+        )
+    else:
+        frozen_objs = __freeze_many(
+            objs,
+            on_update=on_update_func_creator(on_update=on_update),
+            on_freeze=on_freeze_func_creator(on_freeze=on_freeze),
+            memo={} if memo is None else memo,
+        )
+    if generator:
+        return frozen_objs
+    return frozenlist(frozen_objs, freeze_func=__frozen_item)
+
+
+def __freeze_many_unshared(
+    objs: Iterable[Any], on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType
+) -> Iterator[FrozenType]:
+    # The memo (and the objects kept alive while it is used) is emptied after each object is frozen
+    memo: Dict[int, Any] = {}
+    for frozen_obj in __freeze_many(objs, on_update=on_update, on_freeze=on_freeze, memo=memo):
+        yield frozen_obj
+        memo.clear()
+        __MEMO_STATES[id(memo)].kept_alive.clear()
+
+
+def __freeze_many(
+    objs: Iterable[Any], on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType, memo: Dict[int, Any]
+) -> Iterator[FrozenType]:
+    # The objects are kept alive until all of them have been frozen
+    state = __acquire_memo_state(memo)
+    try:
+        yield from __freeze_many_with_memo(objs, on_update=on_update, on_freeze=on_freeze, memo=memo)
+    finally:
+        __release_memo_state(memo, state=state)
+
+
+def __freeze_many_with_memo(
+    objs: Iterable[Any], on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType, memo: Dict[int, Any]
+) -> Iterator[FrozenType]:
+    # Frozen classes of the classes whose objects are frozen by copying their __dict__ to
+    # new objects of them, or None for the classes whose objects are frozen by __freeze
+    frozen_classes: Dict[type, Optional[Type[FrozenBase]]] = {}
+    for obj in objs:
+        klass = type(obj)
+        if klass in __IMMUTABLE_CLASSES:
+            yield obj
+            continue
+
+        try:
+            frozen_class = frozen_classes[klass]
+        except KeyError:
+            if hasattr(klass, '__slots__') and on_freeze is _ON_FREEZE_IDENTITY_FUNC:
+                raise FrozenException('Objects of classes with __slots__ cannot be frozen inplace')
+            frozen_class = frozen_classes[klass] = __dict_copy_frozen_class(
+                obj, on_update=on_update, on_freeze=on_freeze
+            )
+
+        frozen_obj = memo.get(id(obj), memo)
+        if frozen_class is None or frozen_obj is not memo:
+            yield __freeze(obj=obj, on_update=on_update, on_freeze=on_freeze, memo=memo)
+            continue
+
+        # Same as __freeze_object, but without copying the object
+        # (its frozen version is made from its attributes directly)
+        frozen_obj = frozen_class.__new__(frozen_class)
+        memo[id(obj)] = frozen_obj
+        __keep_alive(obj, memo=memo)
+        frozen_attrs = {}
+        for attr, attr_value in obj.__dict__.items():
+            if type(attr_value) in __IMMUTABLE_CLASSES:
+                frozen_attrs[attr] = attr_value
+            else:
+                frozen_attrs[attr] = __freeze(obj=attr_value, on_update=on_update, on_freeze=on_freeze, memo=memo)
+        frozen_obj.__dict__.update(frozen_attrs)
+        yield frozen_obj
+
+
+# Methods that change how the objects are copied
+__COPY_METHOD_NAMES = ('__copy__', '__reduce__', '__reduce_ex__', '__getstate__', '__setstate__')
+
+
+def __dict_copy_frozen_class(
+    obj: Any, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType
+) -> Optional[Type[FrozenBase]]:
+    """
+    Frozen class of the class of an object if the objects of that class can be frozen by copy
+    by creating objects of the frozen class with their __dict__, i.e. the objects frozen
+    by __freeze_object that do not change how they are copied. Otherwise, None.
+    """
+    klass = type(obj)
+    if (
+        type(on_freeze) is not OnFreezeCopier
+        or isfrozen(obj)
+        or __get_freezer(klass) is not __OBJECT_FREEZER
+        or hasattr(klass, '__slots__')
+        or __get_dataclass_field_names(klass) is not None
+        or __get_frozen_dataclass_field_names(klass) is not None
+        or not isinstance(getattr(obj, '__dict__', None), dict)
+        or any(getattr(klass, name, None) is not getattr(object, name, None) for name in __COPY_METHOD_NAMES)
+    ):
+        return None
+    return make_frozen_class(klass=klass, attrs=tuple(obj.__dict__.keys()), on_update=on_update)
+
+
+# Freeze function of a value of a type hint: it receives the value, the update policy and the memo.
+# None means that the values of the type hint are immutable, so they are not frozen
+_PlanFuncType = Callable[[Any, OnUpdateFuncType, Dict[int, Any]], FrozenType]
+
+
+def compile_freeze_plan(klass: type, validate: bool = False, on_freeze: str = 'copy') -> Callable[..., FrozenType]:
+    """
+    Freeze function specialized for the objects of a class by the type hints of their attributes,
+    that are read with typing.get_type_hints only the first time for each class:
+    - the attributes annotated as immutable (e.g. int, str, Tuple[str, ...] or Freezable[str]) are not frozen,
+    - the lists, dicts and sets are frozen by the freezers of their type hints
+      (e.g. a List[int] is frozen to a frozenlist without checking its items),
+    - the objects of annotated classes are frozen by the freeze plans of their classes,
+    - the rest of values (e.g. the attributes without type hint) are frozen by copy as freeze does.
+    The values are trusted to match their type hints. If validate is True, the values that are not
+    instances of the classes of their type hints (only the outermost ones, e.g. tuple for Tuple[int, ...])
+    raise a TypeError.
+    If on_freeze is 'inplace', the objects of the class are frozen inplace (their attribute values are
+    frozen by copy), otherwise ('copy') they are frozen in new objects.
+    The returned function receives the obj, on_update and memo parameters of freeze.
+    """
+    if on_freeze not in ('copy', 'inplace'):
+        raise AttributeError(
+            f"Invalid value for on_freeze parameter, '{on_freeze}' found, only 'copy' and 'inplace' are valid options"
+        )
+    if on_freeze == 'inplace' and hasattr(klass, '__slots__'):
+        raise FrozenException('Objects of classes with __slots__ cannot be frozen inplace')
+    object_plan = __get_object_plan(klass, validate=validate, inplace=on_freeze == 'inplace')
+
+    def freeze_plan(
+        obj: Any, on_update: Union[str, OnUpdateFuncType] = 'exception', memo: Optional[Dict[int, Any]] = None
+    ) -> FrozenType:
+        return __run_plan(object_plan, obj, on_update=on_update_func_creator(on_update=on_update), memo=memo)
+
+    return freeze_plan
+
+
+def freeze_typed(
+    obj: T,
+    on_update: Union[str, OnUpdateFuncType] = 'exception',
+    validate: bool = False,
+    memo: Optional[Dict[int, Any]] = None,
+) -> FrozenType:
+    """
+    Freeze an object by copy with the freeze plan of its class (see compile_freeze_plan).
+    """
+    object_plan = __get_object_plan(type(obj), validate=validate, inplace=False)
+    return __run_plan(object_plan, obj, on_update=on_update_func_creator(on_update=on_update), memo=memo)
+
+
+def __run_plan(
+    object_plan: _PlanFuncType, obj: Any, on_update: OnUpdateFuncType, memo: Optional[Dict[int, Any]]
+) -> FrozenType:
+    if memo is None:
+        memo = {}
+    state = __acquire_memo_state(memo)
+    try:
+        return object_plan(obj, on_update, memo)
+    finally:
+        __release_memo_state(memo, state=state)
+
+
+__OBJECT_PLANS: Dict[Tuple[type, bool, bool], _PlanFuncType] = dict()
+
+
+def __get_object_plan(klass: type, validate: bool, inplace: bool) -> _PlanFuncType:
+    try:
+        return __OBJECT_PLANS[(klass, validate, inplace)]
+    except KeyError:
+        pass
+    # Compiling a plan twice (e.g. by two threads) is harmless, so it is not locked
+    if inplace:
+        object_plan = __compile_inplace_object_plan(klass, validate=validate)
+    else:
+        object_plan = __compile_object_plan(klass, validate=validate)
+    __OBJECT_PLANS[(klass, validate, inplace)] = object_plan
+    return object_plan
+
+
+def __compile_attr_plans(klass: type, validate: bool) -> Dict[str, Optional[_PlanFuncType]]:
+    type_hints = __get_type_hints(klass)
+    return {
+        attr: __compile_value_plan(type_hint, validate=validate)
+        for attr, type_hint in type_hints.items()
+        if getattr(type_hint, '__origin__', None) is not ClassVar
+    }
+
+
+def __get_type_hints(klass: type) -> Dict[str, Any]:
+    """
+    Type hints of the attributes of a class. The class name can be used in them even if the class is
+    defined in a function, and the ones that cannot be resolved are skipped (their attribute values
+    are frozen as freeze does).
+    """
+    localns = {klass.__name__: klass}
+    try:
+        return get_type_hints(klass, localns=localns)
+    except Exception:
+        pass
+
+    type_hints: Dict[str, Any] = {}
+    for base in reversed(klass.__mro__):
+        base_globals = getattr(sys.modules.get(base.__module__), '__dict__', {})
+        for attr, type_hint in base.__dict__.get('__annotations__', {}).items():
+            try:
+                type_hints[attr] = eval(type_hint, base_globals, localns) if isinstance(type_hint, str) else type_hint
+            except Exception:
+                type_hints.pop(attr, None)
+    return type_hints
+
+
+def __compile_inplace_object_plan(klass: type, validate: bool) -> _PlanFuncType:
+    attr_plans = __compile_attr_plans(klass, validate=validate)
+
+    def freeze_object_inplace(obj: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+        if type(obj) is not klass or __get_freezer(klass) is not __OBJECT_FREEZER:
+            return __freeze(obj=obj, on_update=on_update, on_freeze=_ON_FREEZE_IDENTITY_FUNC, memo=memo)
+        frozen_obj = memo.get(id(obj))
+        if frozen_obj is not None:
+            return frozen_obj
+
+        memo[id(obj)] = obj
+        __keep_alive(obj, memo=memo)
+        obj_dict = obj.__dict__
+        for attr, attr_value in obj_dict.items():
+            attr_plan = attr_plans.get(attr, __freeze_with_copier)
+            if attr_plan is not None:
+                obj_dict[attr] = attr_plan(attr_value, on_update, memo)
+        obj.__class__ = make_frozen_class(klass=klass, attrs=tuple(obj_dict), on_update=on_update)
+        mark_frozen_inplace(obj)
+        return obj
+
+    return freeze_object_inplace
+
+
+def __compile_object_plan(klass: type, validate: bool) -> _PlanFuncType:
+    attr_plans = __compile_attr_plans(klass, validate=validate)
+    dataclass_field_names = __get_dataclass_field_names(klass)
+    dataclass_field_names_set = frozenset(dataclass_field_names or ())
+
+    def freeze_object(obj: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+        if type(obj) is not klass:
+            return __freeze_with_copier(obj, on_update, memo)
+        frozen_obj = memo.get(id(obj))
+        if frozen_obj is not None:
+            return frozen_obj
+
+        # Same frozen objects as __freeze_object, but made from the attributes directly
+        obj_dict = getattr(obj, '__dict__', None)
+        if dataclass_field_names is not None and obj_dict.keys() == dataclass_field_names_set:
+            frozen_dataclass = make_frozen_dataclass(
+                klass=klass, on_update=on_update, freeze_func=functools.partial(freeze, on_update=on_update)
+            )
+            frozen_obj = frozen_dataclass.__new__(frozen_dataclass)
+            attrs: Iterable[str] = dataclass_field_names
+        else:
+            frozen_class = __dict_copy_frozen_class(obj, on_update=on_update, on_freeze=_ON_FREEZE_COPIER)
+            if frozen_class is None:
+                return __freeze_with_copier(obj, on_update, memo)
+            frozen_obj = frozen_class.__new__(frozen_class)
+            attrs = tuple(obj_dict)
+
+        memo[id(obj)] = frozen_obj
+        __keep_alive(obj, memo=memo)
+        for attr in attrs:
+            attr_value = obj_dict[attr]
+            attr_plan = attr_plans.get(attr, __freeze_with_copier)
+            if attr_plan is not None:
+                attr_value = attr_plan(attr_value, on_update, memo)
+            object.__setattr__(frozen_obj, attr, attr_value)
+        return frozen_obj
+
+    return freeze_object
+
+
+def __compile_value_plan(type_hint: Any, validate: bool) -> Optional[_PlanFuncType]:
+    type_hint = get_freezable_type_hint(type_hint)
+    value_plan = __compile_value_plan_without_validation(type_hint, validate=validate)
+    classes = get_type_hint_classes(type_hint) if validate else None
+    if classes is not None:
+        try:
+            isinstance(None, classes)
+        except TypeError:
+            # Classes that do not support isinstance (e.g. TypedDicts or non-runtime Protocols)
+            classes = None
+    if classes is None:
+        return value_plan
+
+    def validate_and_freeze_value(value: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+        if not isinstance(value, classes):
+            raise TypeError(f"'{type(value).__name__}' object does not match the type hint {type_hint}")
+        return value if value_plan is None else value_plan(value, on_update, memo)
+
+    return validate_and_freeze_value
+
+
+def __compile_value_plan_without_validation(type_hint: Any, validate: bool) -> Optional[_PlanFuncType]:
+    if is_immutable_type_hint(type_hint):
+        return None
+
+    origin = getattr(type_hint, '__origin__', None)
+    args = get_type_hint_args(type_hint)
+    if origin is list:
+        return __compile_list_plan(__compile_value_plan(args[0], validate=validate) if args else __freeze_with_copier)
+    if origin is dict:
+        return __compile_dict_plan(__compile_value_plan(args[1], validate=validate) if args else __freeze_with_copier)
+    if origin is set:
+        return __compile_set_plan(__compile_value_plan(args[0], validate=validate) if args else __freeze_with_copier)
+    if origin is tuple or type_hint is tuple:
+        # As in freeze, tuples are considered frozen
+        return None
+    if is_union_type_hint(type_hint):
+        # Optional values are frozen by the plan of their type hint (values of other classes fall back to freeze)
+        not_none_args = [arg for arg in args if arg is not type(None)]
+        if len(not_none_args) == 1:
+            return __compile_value_plan_without_validation(not_none_args[0], validate=validate)
+    elif origin is None and isinstance(type_hint, type) and __get_freezer(type_hint) is __OBJECT_FREEZER:
+        return __compile_class_plan(type_hint, validate=validate)
+    return __freeze_with_copier
+
+
+def __compile_list_plan(item_plan: Optional[_PlanFuncType]) -> _PlanFuncType:
+    def freeze_list(value: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+        if type(value) is not list:
+            return __freeze_with_copier(value, on_update, memo)
+        frozen_value = memo.get(id(value))
+        if frozen_value is None:
+            items = value if item_plan is None else [item_plan(item, on_update, memo) for item in value]
+            frozen_value = memo[id(value)] = frozenlist(items, freeze_func=__frozen_item)
+            __keep_alive(value, memo=memo)
+        return frozen_value
+
+    return freeze_list
+
+
+def __compile_dict_plan(value_plan: Optional[_PlanFuncType]) -> _PlanFuncType:
+    def freeze_dict(value: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+        if type(value) is not dict:
+            return __freeze_with_copier(value, on_update, memo)
+        frozen_value = memo.get(id(value))
+        if frozen_value is None:
+            # As in __freeze_dict, the frozendict is memoized before its values are frozen
+            frozen_value = memo[id(value)] = frozendict()
+            __keep_alive(value, memo=memo)
+            if value_plan is None:
+                dict.update(frozen_value, value)
+            else:
+                dict.update(frozen_value, {key: value_plan(item, on_update, memo) for key, item in value.items()})
+        return frozen_value
+
+    return freeze_dict
+
+
+def __compile_set_plan(item_plan: Optional[_PlanFuncType]) -> _PlanFuncType:
+    def freeze_set(value: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+        if type(value) is not set:
+            return __freeze_with_copier(value, on_update, memo)
+        frozen_value = memo.get(id(value))
+        if frozen_value is None:
+            items = value if item_plan is None else [item_plan(item, on_update, memo) for item in value]
+            frozen_value = memo[id(value)] = frozenzet(items, freeze_func=__frozen_item)
+            __keep_alive(value, memo=memo)
+        return frozen_value
+
+    return freeze_set
+
+
+def __compile_class_plan(klass: type, validate: bool) -> _PlanFuncType:
+    def freeze_class_object(value: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+        # The plan of the class is looked up when it is used, as classes can reference themselves
+        return __get_object_plan(klass, validate=validate, inplace=False)(value, on_update, memo)
+
+    return freeze_class_object
+
+
+def __freeze_with_copier(value: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any]) -> FrozenType:
+    if type(value) in __IMMUTABLE_CLASSES:
+        return value
+    return __freeze(obj=value, on_update=on_update, on_freeze=_ON_FREEZE_COPIER, memo=memo)
+
+
+def __view(obj: Any, on_update: OnUpdateFuncType) -> FrozenType:
+    """
+    Read-only view of the object. Nothing is copied nor frozen: the values
+    of dicts, lists, sets and objects are viewed when they are read from their views.
+    Other objects are frozen by copy.
+    """
+    if isbuiltin(obj) or isfrozen(obj):
+        return obj
+    if isinstance(obj, dict):
+        return frozendictview(obj, on_update=on_update)
+    if isinstance(obj, list):
+        return frozenlistview(obj, on_update=on_update)
+    if isinstance(obj, set):
+        return frozensetview(obj, on_update=on_update)
+    if __get_freezer(type(obj)) is __OBJECT_FREEZER:
+        return frozenobjectview(obj, on_update=on_update)
+    return __freeze(obj=obj, on_update=on_update, on_freeze=on_freeze_func_creator(on_freeze='copy'))
+
+
+def __lazy_freeze(
+    obj: Any, on_update: OnUpdateFuncType, memo: Optional[Dict[int, Any]], kept_alive: Optional[List[Any]] = None
+) -> FrozenType:
+    """
+    Frozen version of the object whose values are frozen (lazily too) the first time they are read.
+    Only dicts, lists and objects are frozen lazily, the rest of values are frozen by copy.
+    """
+    if isbuiltin(obj) or isfrozen(obj):
+        return obj
+
+    # The memo is shared by all the lazily frozen values, to keep their shared references and cycles.
+    # As the values can be read (and so frozen) concurrently, the memo only keeps the finished
+    # frozen values, and each one is stored with setdefault so all the readers get the same one.
+    if memo is None:
+        memo = {}
+    frozen_obj = memo.get(id(obj))
+    if frozen_obj is not None:
+        return frozen_obj
+    # The objects of the memo are kept alive while their lazily frozen values can be read
+    if kept_alive is None:
+        kept_alive = []
+
+    def freeze_func(value: Any) -> FrozenType:
+        return __lazy_freeze(obj=value, on_update=on_update, memo=memo, kept_alive=kept_alive)
+
+    klass = type(obj)
+    if klass is dict:
+        frozen_obj = lazyfrozendict(obj, freeze_func=freeze_func)
+    elif klass is list:
+        frozen_obj = lazyfrozenlist(obj, freeze_func=freeze_func)
+    elif __get_freezer(klass) is __OBJECT_FREEZER and __get_frozen_dataclass_field_names(klass) is None:
+        attrs = __get_attrs(obj)
+        frozen_class = make_frozen_class(klass=klass, attrs=tuple(attrs), on_update=on_update)
+        frozen_obj = make_lazy_frozen_object(frozen_class, attrs=attrs, freeze_func=freeze_func)
+    else:
+        # Eagerly frozen values have their own memo, as it holds the values being frozen
+        frozen_obj = __freeze(obj=obj, on_update=on_update, on_freeze=on_freeze_func_creator(on_freeze='copy'))
+
+    kept_alive.append(obj)
+    return memo.setdefault(id(obj), frozen_obj)
+
+
+def __get_attrs(obj: Any) -> Dict[str, Any]:
+    """
+    Attributes of the object, both the ones in its __dict__ and the assigned slots.
+    """
+    attrs = dict(getattr(obj, '__dict__', {}))
+    if hasattr(type(obj), '__slots__'):
+        for attr in __get_slots(type(obj)):
+            try:
+                attrs[attr] = getattr(obj, attr)
+            except AttributeError:
+                # Slots without value
+                continue
+    return attrs
+
+
+class _FreezingInProgress:
+    """
+    Memo value of an object that is being frozen but whose frozen
+    version does not exist yet (e.g. lists, whose frozenlist is
+    created once all their items are frozen).
+    """
+
+    __slots__ = ('started_count',)
+
+    def __init__(self, started_count: int):
+        self.started_count = started_count
+
+
+class _MemoState:
+    """
+    Private state of the freezings that use a memo, kept apart from the memo so it only has
+    the frozen objects: the objects whose ids are keys of the memo, that are kept alive so their
+    ids are not reused, and the number of objects whose freezing has been started, that tells
+    if an object that is frozen again while being frozen is part of a cycle that cannot be frozen.
+    """
+
+    __slots__ = ('kept_alive', 'started_count', 'users')
+
+    def __init__(self):
+        self.kept_alive: List[Any] = []
+        self.started_count = 0
+        self.users = 0
+
+
+class _Freezing(NamedTuple):
+    obj_id: int
+    in_progress: _FreezingInProgress
+    freezing: Generator[Any, Any, Any]
+    on_freeze: OnFreezeFuncType
+
+
 def __freeze(
-    obj: Any, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType, save_original_on_copy: bool = False
+    obj: Any,
+    on_update: OnUpdateFuncType,
+    on_freeze: OnFreezeFuncType,
+    save_original_on_copy: bool = False,
+    memo: Optional[Dict[int, Any]] = None,
 ) -> Any:
 
     if isbuiltin(obj):
@@ -61,81 +671,364 @@ def __freeze(
     if isfrozen(obj):
         return obj
 
-    if isinstance(obj, ModuleType):
-        raise FrozenException('Modules cannot be frozen')
+    # The memo maps the ids of the objects to their frozen versions,
+    # so objects referenced several times are frozen only once
+    if memo is None:
+        memo = {}
+    state = __acquire_memo_state(memo)
+
+    # Objects are frozen without recursion to support any depth: the freezers of
+    # collections and objects are generators that yield the items they need frozen
+    # and receive them frozen, so the ones being frozen are kept in this stack
+    stack: List[_Freezing] = []
+    try:
+        frozen_obj = __start_freezing(
+            obj,
+            on_update=on_update,
+            on_freeze=on_freeze,
+            memo=memo,
+            state=state,
+            stack=stack,
+            save_original_on_copy=save_original_on_copy,
+        )
+        return __run_freezing(frozen_obj, on_update=on_update, memo=memo, state=state, stack=stack)
+    except BaseException:
+        for freezing in stack:
+            if memo.get(freezing.obj_id) is freezing.in_progress:
+                del memo[freezing.obj_id]
+        raise
+    finally:
+        __release_memo_state(memo, state=state)
 
-    class_name = type(obj).__name__
-    freeze_func_name = f'__freeze_{class_name}'
-    this_module = sys.modules[__name__]
-    if hasattr(this_module, freeze_func_name):
-        freeze_func = getattr(this_module, freeze_func_name)
-        return freeze_func(obj, on_update=on_update, on_freeze=on_freeze)
 
-    if NUMPY_INSTALLED:
-        import numpy as np
+def __run_freezing(
+    frozen_obj: Any, on_update: OnUpdateFuncType, memo: Dict[int, Any], state: _MemoState, stack: List[_Freezing]
+) -> Any:
+    """
+    Run the generators of the stack until it is empty, sending to each one
+    the frozen version of the last item it yielded. Return the last frozen object.
+    """
+    while stack:
+        freezing = stack[-1]
+        try:
+            item = freezing.freezing.send(frozen_obj)
+        except StopIteration as stop:
+            stack.pop()
+            frozen_obj = __end_freezing(
+                obj_id=freezing.obj_id, in_progress=freezing.in_progress, frozen_obj=stop.value, memo=memo
+            )
+        else:
+            if type(item) in __IMMUTABLE_CLASSES:
+                frozen_obj = item
+            else:
+                frozen_obj = __start_freezing(
+                    item, on_update=on_update, on_freeze=freezing.on_freeze, memo=memo, state=state, stack=stack
+                )
+    return frozen_obj
 
-        if isinstance(obj, np.ndarray):
-            return __freeze_ndarray(obj, on_update=on_update, on_freeze=on_freeze)
 
-    if isinstance(obj, object):
-        return __freeze_object(
-            obj, on_update=on_update, on_freeze=on_freeze, save_original_on_copy=save_original_on_copy
-        )
+def __start_freezing(
+    obj: Any,
+    on_update: OnUpdateFuncType,
+    on_freeze: OnFreezeFuncType,
+    memo: Dict[int, Any],
+    state: _MemoState,
+    stack: List[_Freezing],
+    save_original_on_copy: bool = False,
+) -> Any:
+    """
+    Start freezing an object.
+    If the object can be frozen right away, return its frozen version.
+    Otherwise, push the generator that freezes it to the stack and return None,
+    that is the value that must be sent to that new generator to start it.
+    """
+    if isbuiltin(obj) or isfrozen(obj):
+        return obj
+
+    obj_id = id(obj)
+    frozen_obj = memo.get(obj_id, memo)
+    if frozen_obj is memo:
+        state.started_count += 1
+        in_progress = _FreezingInProgress(started_count=state.started_count)
+        memo[obj_id] = in_progress
+        state.kept_alive.append(obj)
+    elif isinstance(frozen_obj, _FreezingInProgress):
+        in_progress = __refreeze_in_progress(obj, in_progress=frozen_obj, state=state)
+    else:
+        return frozen_obj
+
+    freezer = __get_freezer(type(obj))
+    try:
+        if freezer is __OBJECT_FREEZER:
+            # Objects of classes with __slots__ cannot be frozen inplace,
+            # so they are always frozen by copying their attributes
+            if hasattr(obj.__class__, '__slots__'):
+                on_freeze = on_freeze_func_creator(on_freeze='copy')
+            frozen_obj = freezer.func(
+                obj, on_update=on_update, on_freeze=on_freeze, memo=memo, save_original_on_copy=save_original_on_copy
+            )
+        else:
+            frozen_obj = freezer.func(obj, on_update=on_update, on_freeze=on_freeze, memo=memo)
+    except BaseException:
+        if memo.get(obj_id) is in_progress:
+            del memo[obj_id]
+        raise
+
+    if freezer.is_generator:
+        stack.append(_Freezing(obj_id=obj_id, in_progress=in_progress, freezing=frozen_obj, on_freeze=on_freeze))
+        return None
+
+    return __end_freezing(obj_id=obj_id, in_progress=in_progress, frozen_obj=frozen_obj, memo=memo)
+
+
+def __refreeze_in_progress(obj: Any, in_progress: _FreezingInProgress, state: _MemoState) -> _FreezingInProgress:
+    # Freezing again an object that is being frozen is only allowed if some object has
+    # been frozen since the last time, otherwise the references form a cycle that only
+    # has collections whose frozen versions cannot exist before their items
+    if in_progress.started_count == state.started_count:
+        raise FrozenException(f'{type(obj).__name__} object references itself and cannot be frozen')
+    in_progress.started_count = state.started_count
+    return in_progress
+
+
+def __end_freezing(obj_id: int, in_progress: _FreezingInProgress, frozen_obj: Any, memo: Dict[int, Any]) -> Any:
+    # If the object was frozen again while being frozen (i.e. it is part of a cycle),
+    # that frozen version is the one referenced by the other objects of the cycle
+    memoized_frozen_obj = memo[obj_id]
+    if memoized_frozen_obj is not in_progress:
+        return memoized_frozen_obj
+    memo[obj_id] = frozen_obj
+    return frozen_obj
+
 
-    # Actually, this code is unreachable
-    raise ValueError(f'object of type {obj.__class__} not frozen')  # pragma: no cover
+def __keep_alive(obj: Any, memo: Dict[int, Any]) -> None:
+    """
+    Keep a reference to the object while the memo is used, as its id must
+    not be reused by other object while it is a key of the memo.
+    """
+    __MEMO_STATES[id(memo)].kept_alive.append(obj)
+
+
+# States of the memos that are being used, by the ids of the memos
+__MEMO_STATES: Dict[int, _MemoState] = dict()
+
+
+def __acquire_memo_state(memo: Dict[int, Any]) -> _MemoState:
+    """
+    Return the state of a memo, that is shared by all the (nested) freezings that use it.
+    """
+    state = __MEMO_STATES.get(id(memo))
+    if state is None:
+        state = __MEMO_STATES[id(memo)] = _MemoState()
+    state.users += 1
+    return state
+
+
+def __release_memo_state(memo: Dict[int, Any], state: _MemoState) -> None:
+    """
+    Release the state of a memo, that is removed (with the objects it keeps alive)
+    when no freezing uses the memo.
+    """
+    state.users -= 1
+    if state.users == 0:
+        del __MEMO_STATES[id(memo)]
+
+
+class _Freezer(NamedTuple):
+    func: FreezerFuncType
+    subclasses: bool
+    is_generator: bool
+
+
+__FREEZERS: Dict[type, _Freezer] = dict()
+__FREEZERS_BY_CLASS: Dict[type, _Freezer] = dict()
+__FREEZERS_LOCK = threading.Lock()
+
+
+def register_freezer(klass: type, func: FreezerFuncType, subclasses: bool = True) -> None:
+    """
+    Register a function that freezes the objects of a class.
+    This method is thread-safe.
+    :param klass: class whose objects will be frozen by func.
+    :param func: function called as func(obj, on_update=..., on_freeze=..., **kwargs) that
+    returns the frozen version of obj. Nested values must be frozen by calling
+    freeze(value, on_update=on_update, on_freeze=on_freeze, **kwargs).
+    func can also be a generator function that yields the nested values and receives
+    them frozen (e.g. frozen_value = yield value), which avoids recursion when freezing
+    deeply nested values.
+    :param subclasses: if True, func also freezes the objects of the subclasses of klass
+    that have no freezer of their own.
+    """
+    with __FREEZERS_LOCK:
+        __FREEZERS[klass] = _Freezer(func=func, subclasses=subclasses, is_generator=isgeneratorfunction(func))
+        # Resolutions made before this registration could be outdated
+        __FREEZERS_BY_CLASS.clear()
+
+
+def unregister_freezer(klass: type) -> None:
+    """
+    Remove the function registered (with register_freezer) to freeze the objects of a class,
+    so they are frozen again as if it had not been registered.
+    This method is thread-safe.
+    :param klass: class whose freezer will be removed.
+    """
+    with __FREEZERS_LOCK:
+        __FREEZERS.pop(klass, None)
+        __FREEZERS_BY_CLASS.clear()
+
+
+def __get_freezer(klass: type) -> _Freezer:
+    """
+    Return the freezer of a class.
+    The freezer is resolved by following the MRO of the class only the first time,
+    as the result is cached for the next lookups.
+    """
+    try:
+        return __FREEZERS_BY_CLASS[klass]
+    except KeyError:
+        pass
+
+    # The freezer is resolved and cached while holding the lock, so a resolution
+    # cannot be cached after a later registration has cleared the cache
+    with __FREEZERS_LOCK:
+        klass_freezer = __OBJECT_FREEZER
+        for base_index, base in enumerate(klass.__mro__):
+            freezer = __FREEZERS.get(base)
+            if freezer is not None and (base_index == 0 or freezer.subclasses):
+                klass_freezer = freezer
+                break
+
+        __FREEZERS_BY_CLASS[klass] = klass_freezer
+    return klass_freezer
+
+
+def __freeze_module(*args, **kwargs) -> None:  # noqa
+    raise FrozenException('Modules cannot be frozen')
 
 
 def __freeze_bytearray(obj: bytearray, *args, **kwargs) -> bytes:  # noqa
     return bytes(obj)
 
 
-def __freeze_ndarray(obj: NpArrayType, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType) -> FrozenList:
+def __freeze_ndarray(
+    obj: NpArrayType, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType, **kwargs
+) -> FrozenList:
     def freeze_func(item: Any) -> FrozenType:
-        return freeze(item, on_update=on_update, on_freeze=on_freeze)
+        return freeze(item, on_update=on_update, on_freeze=on_freeze, **kwargs)
 
     return frozenndarray(obj, freeze_func=freeze_func)
 
 
-def __freeze_dict(obj: Dict, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType) -> frozendict:
-    def freeze_func(item: Any) -> FrozenType:
-        return freeze(item, on_update=on_update, on_freeze=on_freeze)
+# Classes whose objects are immutable for sure, checked first to
+# avoid the rest of the freezing machinery for the most common values
+__IMMUTABLE_CLASSES = frozenset((bool, int, float, complex, str, bytes, type(None)))
 
-    return frozendict(obj, freeze_func=freeze_func)
 
+def __frozen_item(item: FrozenType) -> FrozenType:
+    return item
 
-def __freeze_list(obj: List, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType) -> FrozenList:
-    def freeze_func(item: Any) -> FrozenType:
-        return freeze(item, on_update=on_update, on_freeze=on_freeze)
 
-    return frozenlist(obj, freeze_func=freeze_func)
+def __freeze_dict(obj: Dict, memo: Dict[int, Any], **kwargs) -> Generator[Any, FrozenType, frozendict]:  # noqa
+    # The frozendict is memoized before its values are frozen,
+    # so values that reference the dict reference the frozendict
+    frozen_dict = frozendict()
+    memo[id(obj)] = frozen_dict
+    frozen_values = {}
+    for key, value in obj.items():
+        frozen_values[key] = value if type(value) in __IMMUTABLE_CLASSES else (yield value)
+    dict.update(frozen_dict, frozen_values)
+    return frozen_dict
 
 
-def __freeze_tuple(obj: Tuple, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType) -> Tuple:
-    return tuple(freeze(item, on_update=on_update, on_freeze=on_freeze) for item in obj)
+def __freeze_dict_items(
+    obj: Dict, frozen_dict: frozendict, memo: Dict[int, Any]
+) -> Generator[Any, FrozenType, frozendict]:
+    # As in __freeze_dict, the frozen dict is memoized before its values are frozen
+    memo[id(obj)] = frozen_dict
+    frozen_values = {}
+    for key, value in obj.items():
+        frozen_values[key] = value if type(value) in __IMMUTABLE_CLASSES else (yield value)
+    dict.update(frozen_dict, frozen_values)
+    return frozen_dict
 
 
-def __freeze_set(obj: Set, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType) -> frozenzet:
-    def freeze_func(item: Any) -> FrozenType:
-        return freeze(item, on_update=on_update, on_freeze=on_freeze)
+def __freeze_ordered_dict(  # noqa
+    obj: OrderedDict, memo: Dict[int, Any], **kwargs
+) -> Generator[Any, FrozenType, frozenordereddict]:
+    return (yield from __freeze_dict_items(obj, frozen_dict=frozenordereddict(), memo=memo))
 
-    return frozenzet(obj, freeze_func=freeze_func)
 
+def __freeze_defaultdict(  # noqa
+    obj: defaultdict, memo: Dict[int, Any], **kwargs
+) -> Generator[Any, FrozenType, frozendefaultdict]:
+    return (yield from __freeze_dict_items(obj, frozen_dict=frozendefaultdict(obj.default_factory), memo=memo))
 
-def __freeze_function(obj: Callable, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType) -> FrozenBase:  # noqa
-    class FunctionWrapper(object):
-        def __init__(self):
-            pass
 
-        def __call__(self, *args, **kwargs):
-            return obj(*args, **kwargs)
+def __freeze_counter(obj: Counter, memo: Dict[int, Any], **kwargs) -> Generator[Any, FrozenType, frozencounter]:  # noqa
+    return (yield from __freeze_dict_items(obj, frozen_dict=frozencounter(), memo=memo))
 
-    for attr, value in obj.__dict__.items():
-        setattr(FunctionWrapper, attr, freeze(value, on_update=on_update, on_freeze=on_freeze))
 
-    frozen_class = make_frozen_class(klass=FunctionWrapper, attrs=tuple(), on_update=on_update)
+def __freeze_list(obj: List, **kwargs) -> Generator[Any, FrozenType, FrozenList]:  # noqa
+    frozen_items = []
+    for item in obj:
+        frozen_items.append(item if type(item) in __IMMUTABLE_CLASSES else (yield item))
+    return frozenlist(frozen_items, freeze_func=__frozen_item)
+
+
+def __freeze_deque(obj: deque, **kwargs) -> Generator[Any, FrozenType, frozendeque]:  # noqa
+    frozen_items = []
+    for item in obj:
+        frozen_items.append(item if type(item) in __IMMUTABLE_CLASSES else (yield item))
+    return frozendeque(frozen_items, freeze_func=__frozen_item, maxlen=obj.maxlen)
+
 
-    return frozen_class()
+def __freeze_array(obj: array.array, **kwargs) -> frozenarray:  # noqa
+    # The items of arrays are numbers or characters
+    return frozenarray(obj.typecode, obj)
+
+
+def __freeze_tuple(obj: Tuple, **kwargs) -> Generator[Any, FrozenType, Tuple]:  # noqa
+    frozen_items = []
+    for item in obj:
+        frozen_items.append(item if type(item) in __IMMUTABLE_CLASSES else (yield item))
+    return tuple(frozen_items)
+
+
+def __freeze_set(obj: Set, **kwargs) -> Generator[Any, FrozenType, frozenzet]:  # noqa
+    frozen_items = []
+    for item in obj:
+        frozen_items.append(item if type(item) in __IMMUTABLE_CLASSES else (yield item))
+    return frozenzet(frozen_items, freeze_func=__frozen_item)
+
+
+class _FunctionWrapper(object):
+    """
+    Callable object with the attributes of a function, that calls it.
+    Functions are frozen as objects of the frozen class of this class.
+    """
+
+    def __call__(self, *args, **kwargs):
+        return self._gelidum_func(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _FunctionWrapper) and self.__dict__ == other.__dict__
+
+    def __hash__(self) -> int:
+        return hash(self._gelidum_func)
+
+
+def __freeze_function(  # noqa
+    obj: Callable, on_update: OnUpdateFuncType, **kwargs
+) -> Generator[Any, FrozenType, FrozenBase]:
+    frozen_attrs = {}
+    for attr, value in obj.__dict__.items():
+        frozen_attrs[attr] = yield value
+
+    frozen_class = make_frozen_class(klass=_FunctionWrapper, attrs=tuple(), on_update=on_update)
+    frozen_function = frozen_class.__new__(frozen_class)
+    frozen_function.__dict__.update(frozen_attrs)
+    frozen_function.__dict__['_gelidum_func'] = obj
+    return frozen_function
 
 
 def __freeze_TextIOWrapper(*args, **kwargs) -> None:  # noqa
@@ -147,79 +1040,242 @@ def __freeze_BufferedWriter(*args, **kwargs) -> None:  # noqa
 
 
 def __freeze_object(
-    obj: object, on_update: OnUpdateFuncType, on_freeze: OnFreezeFuncType, save_original_on_copy: bool = False
-) -> FrozenBase:
+    obj: object,
+    on_update: OnUpdateFuncType,
+    on_freeze: OnFreezeFuncType,
+    memo: Dict[int, Any],
+    save_original_on_copy: bool = False,
+) -> Generator[Any, FrozenType, FrozenBase]:
 
-    # If the object has a class with __slots__ a unique class is created whose class attributes
-    # are the object attributes that we want to freeze
+    # Frozen dataclass objects cannot be changed, but the values of their fields are frozen
+    frozen_dataclass_field_names = __get_frozen_dataclass_field_names(obj.__class__)
+    if frozen_dataclass_field_names is not None:
+        return (
+            yield from __freeze_frozen_dataclass_object(
+                obj, frozen_dataclass_field_names, on_freeze=on_freeze, memo=memo
+            )
+        )
+
+    # Dataclass objects frozen by copy are frozen as objects of their frozen dataclasses with slots,
+    # whose fields are assigned directly in field order
+    if on_freeze.__class__ is OnFreezeCopier and not save_original_on_copy:
+        field_names = __get_dataclass_field_names(obj.__class__)
+        if field_names is not None and obj.__dict__.keys() == set(field_names):
+            return (yield from __freeze_dataclass_object(obj, field_names, on_update=on_update, memo=memo))
+
+    # Objects of classes with __slots__ cannot be frozen inplace (their attributes are not in a
+    # __dict__ that can be shared), so a new object of the frozen class is created for them
     if hasattr(obj.__class__, '__slots__'):
-        attrs = tuple(obj.__class__.__slots__)
-        on_freeze: OnFreezeFuncType = on_freeze_func_creator(on_freeze='copy')
-        frozen_class = make_unique_class(
-            klass=obj.__class__,
-            attrs={
-                attr: freeze(getattr(obj, attr), on_update=on_update, on_freeze=on_freeze, save_original_on_copy=False)
-                for attr in attrs
-            },
-            on_update=on_update,
+        return (yield from __freeze_slots_object(obj, on_update=on_update, memo=memo))
+
+    return (
+        yield from __freeze_dict_object(
+            obj, on_update=on_update, on_freeze=on_freeze, memo=memo, save_original_on_copy=save_original_on_copy
         )
-        return frozen_class()
-    else:
-        attrs = tuple(obj.__dict__.keys())
+    )
 
-        frozen_obj = on_freeze(obj)
-        for attr in attrs:
-            # Avoid self-reference loops
-            if getattr(obj, attr) is obj:
-                continue
-            attr_value = getattr(frozen_obj, attr)
-            setattr(
-                frozen_obj,
-                attr,
-                freeze(attr_value, on_update=on_update, on_freeze=on_freeze, save_original_on_copy=False),
-            )
 
-        # Only when the frozen method is copying the objects we can get the original object
-        # save_original_on_copy is used to save only the original object (the first-level object whose
-        # save_original_on_copy is set to True). Descendant attributes are not saved in other original_obj attributes,
-        # i.e. there is no copy of hierarchy, only the first-level object is saved.
-        if save_original_on_copy and on_freeze.__class__ == OnFreezeCopier:
-            setattr(frozen_obj, 'original_obj', obj)
+def __freeze_dataclass_object(
+    obj: object, field_names: Tuple[str, ...], on_update: OnUpdateFuncType, memo: Dict[int, Any]
+) -> Generator[Any, FrozenType, FrozenBase]:
+    frozen_dataclass = make_frozen_dataclass(
+        klass=obj.__class__,
+        on_update=on_update,
+        freeze_func=functools.partial(freeze, on_update=on_update),
+    )
+    frozen_obj = frozen_dataclass.__new__(frozen_dataclass)
+    memo[id(obj)] = frozen_obj
+    obj_dict = obj.__dict__
+    for field_name in field_names:
+        field_value = obj_dict[field_name]
+        if type(field_value) not in __IMMUTABLE_CLASSES:
+            field_value = yield field_value
+        object.__setattr__(frozen_obj, field_name, field_value)
+    return frozen_obj
 
-        frozen_class = make_frozen_class(klass=obj.__class__, attrs=attrs, on_update=on_update)
-        frozen_obj.__class__ = frozen_class
-        return frozen_obj
 
+def __freeze_frozen_dataclass_object(
+    obj: object, field_names: Tuple[str, ...], on_freeze: OnFreezeFuncType, memo: Dict[int, Any]
+) -> Generator[Any, FrozenType, object]:
+    # Objects whose field values are already frozen are frozen, otherwise the field values
+    # are frozen in the object returned by on_freeze (i.e. a copy of the object, unless frozen inplace)
+    if all(isbuiltin(getattr(obj, name)) or isfrozen(getattr(obj, name)) for name in field_names):
+        return obj
+    frozen_obj = on_freeze(obj)
+    memo[id(obj)] = frozen_obj
+    if frozen_obj is not obj:
+        memo[id(frozen_obj)] = frozen_obj
+    for field_name in field_names:
+        field_value = getattr(frozen_obj, field_name)
+        if type(field_value) not in __IMMUTABLE_CLASSES:
+            object.__setattr__(frozen_obj, field_name, (yield field_value))
+    return frozen_obj
 
-def __on_update_exception(frozen_obj: FrozenBase, message: str, *args, **kwargs) -> None:  # noqa
-    raise FrozenException(message)
 
+def __freeze_slots_object(
+    obj: object, on_update: OnUpdateFuncType, memo: Dict[int, Any]
+) -> Generator[Any, FrozenType, FrozenBase]:
+    frozen_class = make_frozen_class(klass=obj.__class__, attrs=tuple(), on_update=on_update)
+    frozen_obj = frozen_class.__new__(frozen_class)
+    memo[id(obj)] = frozen_obj
+    for attr in __get_slots(obj.__class__):
+        try:
+            attr_value = getattr(obj, attr)
+        except AttributeError:
+            # Slots without value
+            continue
+        if type(attr_value) not in __IMMUTABLE_CLASSES:
+            attr_value = yield attr_value
+        object.__setattr__(frozen_obj, attr, attr_value)
+    for attr, attr_value in getattr(obj, '__dict__', {}).items():
+        if type(attr_value) not in __IMMUTABLE_CLASSES:
+            attr_value = yield attr_value
+        object.__setattr__(frozen_obj, attr, attr_value)
+    return frozen_obj
 
-def __on_update_warning(frozen_obj: FrozenBase, message: str, *args, **kwargs) -> None:  # noqa
-    warnings.warn(message)
 
+def __freeze_dict_object(
+    obj: object,
+    on_update: OnUpdateFuncType,
+    on_freeze: OnFreezeFuncType,
+    memo: Dict[int, Any],
+    save_original_on_copy: bool,
+) -> Generator[Any, FrozenType, FrozenBase]:
+    attrs = tuple(obj.__dict__.keys())
 
-def __on_update_func(on_update: OnUpdateFuncType) -> OnUpdateFuncType:
-    if isinstance(on_update, str):
-        if on_update == 'exception':
-            return __on_update_exception
-        elif on_update == 'warning':
-            return __on_update_warning
-        elif on_update == 'nothing':
-            return lambda message, *args, **kwargs: None
-        else:
-            raise AttributeError(
-                f"Invalid value for on_update parameter, '{on_update}' found, "
-                f"only 'exception', 'warning', and 'nothing' are valid options "
-                f'if passed a string'
-            )
+    # The attributes of the object returned by on_freeze are frozen one by one, so
+    # each one of them is copied (if on_freeze copies) only once, when it is frozen
+    frozen_obj = on_freeze(obj)
+    # The frozen object is memoized before its attributes are frozen,
+    # so attributes that reference the object (even indirectly) reference the frozen object
+    memo[id(obj)] = frozen_obj
+    if frozen_obj is not obj:
+        memo[id(frozen_obj)] = frozen_obj
+    for attr in attrs:
+        attr_value = getattr(frozen_obj, attr)
+        if type(attr_value) not in __IMMUTABLE_CLASSES:
+            setattr(frozen_obj, attr, (yield attr_value))
 
-    elif callable(on_update):
-        return on_update
+    # Only when the frozen method is copying the objects we can get the original object
+    # save_original_on_copy is used to save only the original object (the first-level object whose
+    # save_original_on_copy is set to True). Descendant attributes are not saved in other original_obj attributes,
+    # i.e. there is no copy of hierarchy, only the first-level object is saved.
+    if save_original_on_copy and on_freeze.__class__ == OnFreezeCopier:
+        setattr(frozen_obj, 'original_obj', obj)
 
-    else:
-        raise AttributeError(
-            f"Invalid value for on_update parameter, '{on_update}' found, "
-            f"only 'exception', 'warning', 'nothing' or a function are "
-            f'valid options'
-        )
+    frozen_class = make_frozen_class(klass=obj.__class__, attrs=attrs, on_update=on_update)
+    frozen_obj.__class__ = frozen_class
+    if frozen_obj is obj:
+        # The object could be in sets or dicts, so it keeps the equality and hash of its class
+        mark_frozen_inplace(frozen_obj)
+    return frozen_obj
+
+
+__DATACLASS_FIELD_NAMES_BY_CLASS: Dict[type, Optional[Tuple[str, ...]]] = dict()
+__FROZEN_DATACLASS_FIELD_NAMES_BY_CLASS: Dict[type, Optional[Tuple[str, ...]]] = dict()
+
+
+def __get_frozen_dataclass_field_names(klass: type) -> Optional[Tuple[str, ...]]:
+    """
+    Return the names of the fields of a frozen dataclass (i.e. @dataclass(frozen=True)),
+    or None if the class is not a frozen dataclass. The result is computed only the first time for each class.
+    """
+    try:
+        return __FROZEN_DATACLASS_FIELD_NAMES_BY_CLASS[klass]
+    except KeyError:
+        pass
+
+    field_names: Optional[Tuple[str, ...]] = None
+    if (
+        dataclasses.is_dataclass(klass)
+        and klass.__dataclass_params__.frozen  # type: ignore
+        and not issubclass(klass, (FrozenBase, FrozenSlotsBase))
+    ):
+        field_names = tuple(field.name for field in dataclasses.fields(klass))
+
+    __FROZEN_DATACLASS_FIELD_NAMES_BY_CLASS[klass] = field_names
+    return field_names
+
+
+def __get_dataclass_field_names(klass: type) -> Optional[Tuple[str, ...]]:
+    """
+    Return the names of the fields of a dataclass whose objects can be frozen as objects of its frozen
+    dataclass with slots, i.e. a non-frozen dataclass without slots that does not change how its objects
+    are copied, and whose fields (and only them) are initialized by its generated __init__.
+    Otherwise, None. The result is computed only the first time for each class.
+    """
+    try:
+        return __DATACLASS_FIELD_NAMES_BY_CLASS[klass]
+    except KeyError:
+        pass
+
+    field_names: Optional[Tuple[str, ...]] = None
+    if (
+        dataclasses.is_dataclass(klass)
+        and not klass.__dataclass_params__.frozen  # type: ignore
+        and klass.__dataclass_params__.init  # type: ignore
+        and not issubclass(klass, FrozenBase)
+        and not hasattr(klass, '__slots__')
+        and __get_freezer(klass) is __OBJECT_FREEZER
+        and all(getattr(klass, name, None) is getattr(object, name, None) for name in __COPY_METHOD_NAMES)
+    ):
+        fields = dataclasses.fields(klass)
+        init_params = tuple(inspect.signature(klass.__init__).parameters)[1:]
+        # Fields with init=False and init-only variables are not supported
+        if all(field.init for field in fields) and set(init_params) == {field.name for field in fields}:
+            field_names = tuple(field.name for field in fields)
+
+    __DATACLASS_FIELD_NAMES_BY_CLASS[klass] = field_names
+    return field_names
+
+
+__SLOTS_BY_CLASS: Dict[type, Tuple[str, ...]] = dict()
+
+
+def __get_slots(klass: type) -> Tuple[str, ...]:
+    """
+    Return the names of the attributes stored in the slots of the objects of a class,
+    i.e. the __slots__ of the class and of its bases.
+    """
+    try:
+        return __SLOTS_BY_CLASS[klass]
+    except KeyError:
+        pass
+
+    slots: List[str] = []
+    for base in reversed(klass.__mro__):
+        base_slots = base.__dict__.get('__slots__', ())
+        if isinstance(base_slots, str):
+            base_slots = (base_slots,)
+        for slot in base_slots:
+            if slot in ('__dict__', '__weakref__'):
+                continue
+            # Private names are mangled
+            if slot.startswith('__') and not slot.endswith('__'):
+                slot = f"_{base.__name__.lstrip('_')}{slot}"
+            if slot not in slots:
+                slots.append(slot)
+
+    __SLOTS_BY_CLASS[klass] = tuple(slots)
+    return __SLOTS_BY_CLASS[klass]
+
+
+__OBJECT_FREEZER = _Freezer(func=__freeze_object, subclasses=True, is_generator=True)
+
+
+register_freezer(ModuleType, __freeze_module)
+register_freezer(bytearray, __freeze_bytearray, subclasses=False)
+register_freezer(dict, __freeze_dict, subclasses=False)
+register_freezer(list, __freeze_list, subclasses=False)
+register_freezer(tuple, __freeze_tuple, subclasses=False)
+register_freezer(set, __freeze_set, subclasses=False)
+register_freezer(OrderedDict, __freeze_ordered_dict, subclasses=False)
+register_freezer(defaultdict, __freeze_defaultdict, subclasses=False)
+register_freezer(Counter, __freeze_counter, subclasses=False)
+register_freezer(deque, __freeze_deque, subclasses=False)
+register_freezer(array.array, __freeze_array, subclasses=False)
+register_freezer(FunctionType, __freeze_function, subclasses=False)
+register_freezer(io.TextIOWrapper, __freeze_TextIOWrapper)
+register_freezer(io.BufferedWriter, __freeze_BufferedWriter)
+if NUMPY_INSTALLED:
+    register_freezer(np.ndarray, __freeze_ndarray)
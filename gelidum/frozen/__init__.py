@@ -1,7 +1,13 @@
-from gelidum.frozen.frozen_base import FrozenBase  # noqa
+from gelidum.frozen.frozen_base import (  # noqa
+    FrozenBase,
+    FrozenSlotsBase,
+    mark_frozen_inplace,
+)
 from gelidum.frozen.frozen_class_creator import clear_frozen_classes  # noqa
 from gelidum.frozen.frozen_class_creator import (  # noqa
     get_frozen_classes,
+    make_compact_frozen_class,
     make_frozen_class,
+    make_frozen_dataclass,
 )
-from gelidum.frozen.isfrozen import isfrozen  # noqa
+from gelidum.frozen.isfrozen import isfrozen, isimmutableclass  # noqa
@@ -1,3 +1,9 @@
+import threading
+import weakref
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+
 class FrozenBase(object):
     @classmethod
     def _gelidum_on_update(cls, *args, **kwargs):  # pragma: no cover
@@ -42,3 +48,384 @@ class FrozenBase(object):
         :return: reference to self.
         """
         return self
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Frozen objects whose classes do not define their equality are equal to the frozen objects
+        of their frozen class with equal attributes. Identical objects are equal, and objects
+        whose (cached) hashes are different are not equal, without comparing their attributes.
+        The rest of the frozen objects (and the ones frozen inplace) keep the equality of their classes.
+        """
+        if self is other:
+            return True
+        original_eq, _ = _get_original_equality(type(self))
+        if original_eq is object.__eq__ and not _is_frozen_inplace(self):
+            return _structural_eq(self, other)
+        if _hashes_differ(self, other):
+            return False
+        return original_eq(self, other)
+
+    def __hash__(self) -> int:
+        """
+        Hash of the attributes of the frozen object (or its identity, if some of them are unhashable),
+        or the hash of its class if it defines its equality
+        (or if the object was frozen inplace, as it could be in a dict or a set before being frozen).
+        Computed once and stored apart from the object.
+        """
+        hash_entry = _HASHES.get(id(self))
+        if hash_entry is not None and hash_entry[0]() is self:
+            return hash_entry[1]
+        original_eq, original_hash = _get_original_equality(type(self))
+        if original_eq is object.__eq__ and not _is_frozen_inplace(self):
+            return _structural_hash(self)
+        if original_hash is None:
+            raise TypeError(f"unhashable type: '{type(self).__name__}'")
+        if original_hash is object.__hash__:
+            return original_hash(self)
+        return _cache_hash(self, original_hash(self))
+
+
+class FrozenSlotsBase(object):
+    """
+    Base class of the frozen classes whose objects have no __dict__ (they store their attributes in slots).
+    It cannot be a base class of FrozenBase, as the frozen classes of FrozenBase must have
+    the same layout as their original classes to freeze objects inplace.
+    """
+
+    __slots__ = ()
+
+    _gelidum_on_update = FrozenBase._gelidum_on_update
+    get_gelidum_hot_class_name = FrozenBase.get_gelidum_hot_class_name
+    get_gelidum_hot_class_module = FrozenBase.get_gelidum_hot_class_module
+    __setattr__ = FrozenBase.__setattr__
+    __set__ = FrozenBase.__set__
+    __delattr__ = FrozenBase.__delattr__
+    __setitem__ = FrozenBase.__setitem__
+    __delitem__ = FrozenBase.__delitem__
+    __deepcopy__ = FrozenBase.__deepcopy__
+    __eq__ = FrozenBase.__eq__
+    __hash__ = FrozenBase.__hash__
+
+
+def mark_frozen_inplace(obj: Any) -> None:
+    """
+    Mark an object frozen inplace, so it keeps the equality and the hash of its class.
+    The mark is kept apart from the object, so it is not one of its attributes.
+    Objects that cannot be weakly referenced cannot be marked.
+    """
+    _add_entry(_FROZEN_INPLACE, obj, obj_value=None)
+
+
+# Objects frozen inplace (by id), with weak references to the objects
+_FROZEN_INPLACE: Dict[int, Tuple[Callable[[], Any], None]] = {}
+
+# Hashes of the frozen objects (by id), with weak references to the objects
+_HASHES: Dict[int, Tuple[Callable[[], Any], int]] = {}
+
+# Frozen objects hashed by identity (by id), with weak references to the objects
+_HASHED_BY_IDENTITY: Dict[int, Tuple[Callable[[], Any], None]] = {}
+
+# Equality and hash of the classes of the frozen classes, by frozen class
+_ORIGINAL_EQUALITY_BY_CLASS: Dict[type, Tuple[Callable, Optional[Callable]]] = {}
+
+# Values compared or hashed by the current thread
+_COMPARISONS = threading.local()
+
+
+def _add_entry(entries: Dict[int, Tuple[Callable[[], Any], Any]], obj: Any, obj_value: Any) -> None:
+    obj_id = id(obj)
+    try:
+        entries[obj_id] = (weakref.ref(obj, lambda obj_ref: _remove_entry(entries, obj_id, obj_ref)), obj_value)
+    except TypeError:
+        # Objects that cannot be weakly referenced (e.g. compact objects) have no entries
+        pass
+
+
+def _has_entry(entries: Dict[int, Tuple[Callable[[], Any], Any]], obj: Any) -> bool:
+    entry = entries.get(id(obj))
+    return entry is not None and entry[0]() is obj
+
+
+def _remove_entry(entries: Dict[int, Any], obj_id: int, obj_ref: Callable[[], Any]) -> None:
+    # The id of the garbage collected object could have been reused by a new object
+    entry = entries.get(obj_id)
+    if entry is not None and entry[0] is obj_ref:
+        del entries[obj_id]
+
+
+def _is_frozen_inplace(obj: Any) -> bool:
+    return _has_entry(_FROZEN_INPLACE, obj)
+
+
+def _cache_hash(obj: Any, obj_hash: int) -> int:
+    # Objects that cannot be weakly referenced (e.g. compact objects) compute their hashes every time
+    _add_entry(_HASHES, obj, obj_value=obj_hash)
+    return obj_hash
+
+
+def _hashes_differ(obj: Any, other: Any) -> bool:
+    hash_entry = _HASHES.get(id(obj))
+    other_hash_entry = _HASHES.get(id(other))
+    return (
+        hash_entry is not None
+        and other_hash_entry is not None
+        and hash_entry[0]() is obj
+        and other_hash_entry[0]() is other
+        and hash_entry[1] != other_hash_entry[1]
+    )
+
+
+def _get_original_equality(klass: type) -> Tuple[Callable, Optional[Callable]]:
+    """
+    __eq__ and __hash__ of the first classes after FrozenBase (or FrozenSlotsBase)
+    in the MRO of the frozen class that define them (object, if no class does).
+    Computed only the first time for each class.
+    """
+    try:
+        return _ORIGINAL_EQUALITY_BY_CLASS[klass]
+    except KeyError:
+        pass
+    mro = klass.__mro__
+    original_index = mro.index(FrozenBase if FrozenBase in mro else FrozenSlotsBase) + 1
+    original_eq = next(base.__dict__['__eq__'] for base in mro[original_index:] if '__eq__' in base.__dict__)
+    original_hash = next(base.__dict__['__hash__'] for base in mro[original_index:] if '__hash__' in base.__dict__)
+    _ORIGINAL_EQUALITY_BY_CLASS[klass] = (original_eq, original_hash)
+    return original_eq, original_hash
+
+
+def _structural_class(klass: type) -> type:
+    bases = klass.__bases__
+    if len(bases) == 1 and bases[0].__dict__.get('_gelidum_lazy_class') is klass:
+        # Lazy frozen objects are equal to the frozen objects of the frozen class they derive from
+        return bases[0]
+    return klass
+
+
+def _attrs(obj: Any) -> Dict[str, Any]:
+    """
+    Attributes of a frozen object, with the ones added by gelidum (e.g. original_obj) excluded.
+    """
+    attrs: Dict[str, Any] = {}
+    obj_dict: Optional[Dict[str, Any]] = getattr(obj, '__dict__', None)
+    if obj_dict is not None:
+        for attr in list(obj_dict):
+            if not attr.startswith('_gelidum_') and attr != 'original_obj':
+                attrs[attr] = obj_dict[attr]
+        for attr in list(obj_dict.get('_gelidum_lazy_attrs', ())):
+            # Lazy attributes are frozen when they are read
+            attrs[attr] = getattr(obj, attr)
+    for attr, slot in _get_slots(type(obj)):
+        try:
+            attrs[attr] = slot.__get__(obj, type(obj))
+        except AttributeError:
+            # Slot without value
+            pass
+    return attrs
+
+
+_SLOTS_BY_CLASS: Dict[type, Tuple[Tuple[str, MemberDescriptorType], ...]] = {}
+
+
+def _get_slots(klass: type) -> Tuple[Tuple[str, MemberDescriptorType], ...]:
+    """
+    Slot descriptors of the class (and of its bases), with their attribute names.
+    Computed only the first time for each class.
+    """
+    try:
+        return _SLOTS_BY_CLASS[klass]
+    except KeyError:
+        pass
+    slots = tuple(
+        (attr, slot)
+        for base in klass.__mro__
+        for attr, slot in base.__dict__.items()
+        if isinstance(slot, MemberDescriptorType)
+    )
+    _SLOTS_BY_CLASS[klass] = slots
+    return slots
+
+
+def _is_structural(obj: Any) -> bool:
+    """
+    Whether the object is a frozen object compared and hashed by its attributes.
+    """
+    klass = type(obj)
+    return (
+        klass.__eq__ is FrozenBase.__eq__
+        and _get_original_equality(klass)[0] is object.__eq__
+        and not _is_frozen_inplace(obj)
+    )
+
+
+def _is_unhashable(obj: Any) -> bool:
+    """
+    Whether the class of the object is unhashable (e.g. a class that defines __eq__ but not __hash__),
+    without computing the hash of the object.
+    """
+    klass = type(obj)
+    return klass.__hash__ is None or (
+        klass.__hash__ is FrozenBase.__hash__ and _get_original_equality(klass)[1] is None
+    )
+
+
+def _structural_eq(obj: FrozenBase, other: Any) -> bool:
+    if type(other) is not type(obj) and (
+        not isinstance(other, (FrozenBase, FrozenSlotsBase))
+        or _structural_class(type(other)) is not _structural_class(type(obj))
+    ):
+        return NotImplemented
+
+    # Pairs of objects compared by the outermost comparison (and assumed equal while they are compared),
+    # so shared objects are compared only once and cycles of references end
+    comparisons: Optional[Set[Tuple[int, int]]] = getattr(_COMPARISONS, 'eq', None)
+    outermost = comparisons is None
+    if comparisons is None:
+        comparisons = _COMPARISONS.eq = set()
+    compared_pairs: List[Tuple[int, int]] = []
+    try:
+        equal = _compare_pairs(obj, other, comparisons=comparisons, compared_pairs=compared_pairs)
+        if not equal:
+            # The pairs compared by this comparison are not known to be equal
+            comparisons.difference_update(compared_pairs)
+        return equal
+    finally:
+        if outermost:
+            _COMPARISONS.eq = None
+
+
+def _compare_pairs(
+    obj: FrozenBase, other: Any, comparisons: Set[Tuple[int, int]], compared_pairs: List[Tuple[int, int]]
+) -> bool:
+    """
+    Compare two frozen objects, and the pairs of frozen objects referenced by their attributes,
+    without recursion, so the objects can be nested at any depth.
+    """
+    pairs = [(obj, other)]
+    while pairs:
+        obj, other = pairs.pop()
+        pair = (id(obj), id(other))
+        if pair in comparisons:
+            continue
+        comparisons.add(pair)
+        compared_pairs.append(pair)
+        if (
+            _is_frozen_inplace(other)
+            or _hashes_differ(obj, other)
+            or _has_entry(_HASHED_BY_IDENTITY, obj)
+            or _has_entry(_HASHED_BY_IDENTITY, other)
+            or not _compare_attrs(obj, other, pairs=pairs)
+        ):
+            return False
+    return True
+
+
+def _compare_attrs(obj: FrozenBase, other: FrozenBase, pairs: List[Tuple[Any, Any]]) -> bool:
+    """
+    Compare the attributes of two frozen objects, but the frozen objects compared by their attributes,
+    that are added to pairs to be compared later.
+    """
+    attrs = _attrs(obj)
+    other_attrs = _attrs(other)
+    if attrs.keys() != other_attrs.keys():
+        return False
+    for attr, value in attrs.items():
+        other_value = other_attrs[attr]
+        if _is_unhashable(value) or _is_unhashable(other_value):
+            # Objects with unhashable attribute values are hashed by identity, so they are only equal to themselves
+            return False
+        if value is other_value:
+            continue
+        if (
+            _is_structural(value)
+            and _is_structural(other_value)
+            and _structural_class(type(value)) is _structural_class(type(other_value))
+        ):
+            pairs.append((value, other_value))
+        elif not value == other_value:
+            return False
+    return True
+
+
+class _Hashing(NamedTuple):
+    # Attribute of the object hashed before this one that references it
+    attr: Optional[str]
+    obj: FrozenBase
+    attr_values: Iterator[Tuple[str, Any]]
+    attr_hashes: List[Tuple[str, int]]
+    # Cycles of references found before hashing the object
+    cycles: int
+
+
+def _structural_hash(obj: FrozenBase) -> int:
+    # Objects being hashed by the current thread, to end cycles of references
+    hashing: Optional[Set[int]] = getattr(_COMPARISONS, 'hashing', None)
+    if hashing is None:
+        hashing = _COMPARISONS.hashing = set()
+        _COMPARISONS.cycles = 0
+    if id(obj) in hashing:
+        _COMPARISONS.cycles += 1
+        return hash(_structural_class(type(obj)))
+
+    # The frozen objects referenced by the attributes are hashed without recursion,
+    # so the objects can be nested at any depth
+    stack = [_start_hashing(None, obj, hashing=hashing)]
+    try:
+        while True:
+            hashing_obj = stack[-1]
+            try:
+                next_attr_value = _hash_attrs(hashing_obj, hashing=hashing)
+            except TypeError:
+                # Objects with unhashable attribute values (e.g. objects of classes that define __eq__ but not
+                # __hash__) are hashed by identity
+                obj_hash = _end_hashing(hashing_obj, hashing=hashing, by_identity=True)
+            else:
+                if next_attr_value is not None:
+                    stack.append(_start_hashing(*next_attr_value, hashing=hashing))
+                    continue
+                obj_hash = _end_hashing(hashing_obj, hashing=hashing, by_identity=False)
+            stack.pop()
+            if not stack:
+                return obj_hash
+            stack[-1].attr_hashes.append((hashing_obj.attr, obj_hash))
+    finally:
+        for hashing_obj in stack:
+            hashing.discard(id(hashing_obj.obj))
+
+
+def _start_hashing(attr: Optional[str], obj: FrozenBase, hashing: Set[int]) -> _Hashing:
+    hashing.add(id(obj))
+    return _Hashing(
+        attr=attr, obj=obj, attr_values=iter(_attrs(obj).items()), attr_hashes=[], cycles=_COMPARISONS.cycles
+    )
+
+
+def _hash_attrs(hashing_obj: _Hashing, hashing: Set[int]) -> Optional[Tuple[str, FrozenBase]]:
+    """
+    Hash the attribute values of the object until one of them is a frozen object
+    hashed by its attributes whose hash is not cached (returned with its attribute, to be hashed first).
+    """
+    for attr, value in hashing_obj.attr_values:
+        if id(value) in hashing and _is_structural(value):
+            # The hash of the objects in cycles of references depends on the object where the cycle was entered
+            _COMPARISONS.cycles += 1
+            value_hash = hash(_structural_class(type(value)))
+        elif _is_structural(value) and not _has_entry(_HASHES, value):
+            return attr, value
+        else:
+            value_hash = hash(value)
+        hashing_obj.attr_hashes.append((attr, value_hash))
+    return None
+
+
+def _end_hashing(hashing_obj: _Hashing, hashing: Set[int], by_identity: bool) -> int:
+    obj = hashing_obj.obj
+    hashing.discard(id(obj))
+    if by_identity:
+        obj_hash = object.__hash__(obj)
+        _add_entry(_HASHED_BY_IDENTITY, obj, obj_value=None)
+    else:
+        obj_hash = hash((_structural_class(type(obj)), frozenset(hashing_obj.attr_hashes)))
+    if _COMPARISONS.cycles != hashing_obj.cycles:
+        # The hash depends on the object where the cycle was entered, so it is not cached
+        return obj_hash
+    return _cache_hash(obj, obj_hash)
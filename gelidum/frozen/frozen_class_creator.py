@@ -1,103 +1,315 @@
+import dataclasses
 import sys
 import threading
-import uuid
-from typing import Any, Dict, Iterable, Optional, Set, Type, cast
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, Type, cast
 
-from gelidum.frozen.frozen_base import FrozenBase
+from gelidum.frozen.frozen_base import FrozenBase, FrozenSlotsBase
 from gelidum.typing import OnUpdateFuncType
 
 
+def __frozen_class_name(klass: Type[object], on_update: OnUpdateFuncType, kind: str = '') -> str:
+    camel_case_module = __camel_case(klass.__module__)
+    on_update_suffix = __on_update_suffix(on_update)
+    return __unique_frozen_class_name(f'Frozen{kind}{klass.__name__}From{camel_case_module}{on_update_suffix}')
+
+
+def __camel_case(name: str) -> str:
+    return name.title().replace('.', '').replace('_', '')
+
+
+def __on_update_suffix(on_update: OnUpdateFuncType) -> str:
+    """
+    Suffix of the names of the frozen classes of an update policy. The update policies of gelidum have
+    fixed suffixes (the default one, 'exception', has none), so their frozen classes have the same names
+    in every process and their objects can be unpickled by other processes.
+    """
+    from gelidum.on_update import (
+        _on_update_exception,
+        _on_update_nothing,
+        _on_update_warning,
+    )
+
+    on_update_suffixes = {
+        _on_update_exception: '',
+        _on_update_warning: 'OnUpdateWarning',
+        _on_update_nothing: 'OnUpdateNothing',
+    }
+    # The frozen classes of other update policies are told apart by an index
+    return on_update_suffixes.get(on_update, 'OnUpdateCustom')
+
+
+def __frozen_class_base_attrs(klass: Type[object], on_update_func: OnUpdateFuncType) -> Dict[str, Any]:
+    return {
+        'get_gelidum_hot_class_name': lambda _: klass.__name__,
+        'get_gelidum_hot_class_module': lambda _: klass.__module__,
+        '_gelidum_on_update': lambda _self, *args, **kwargs: on_update_func(*args, **kwargs),
+    }
+
+
 def __create_frozen_class(
     klass: Type[object], attrs: Iterable[str], on_update_func: OnUpdateFuncType
 ) -> Type[FrozenBase]:
-    camel_case_module = klass.__module__.title().replace('.', '').replace('_', "")
-    frozen_class_name = f'Frozen{klass.__name__}From{camel_case_module}'
+    frozen_class_name = __frozen_class_name(klass, on_update=on_update_func)
+    frozen_class_attrs: Dict[str, Any] = {
+        **__frozen_class_base_attrs(klass=klass, on_update_func=on_update_func),
+        'original_obj': None,
+    }
+    if hasattr(klass, '__slots__'):
+        # The attribute values are kept in the slots of each frozen object
+        frozen_class_attrs['__slots__'] = ()
+        if not hasattr(klass, '__setstate__'):
+            frozen_class_attrs['__setstate__'] = __set_frozen_object_state
+    else:
+        frozen_class_attrs.update({attr: None for attr in attrs})
+
     frozen_class: Type[FrozenBase] = cast(
-        Type[FrozenBase],
-        type(
-            frozen_class_name,
-            (FrozenBase, klass),
-            {
-                **{
-                    'get_gelidum_hot_class_name': lambda _: klass.__name__,
-                    'get_gelidum_hot_class_module': lambda _: klass.__module__,
-                    '_gelidum_on_update': lambda _self, *args, **kwargs: on_update_func(*args, **kwargs),
-                    'original_obj': None,
-                    **{attr: None for attr in attrs},
-                }
-            },
-        ),
+        Type[FrozenBase], type(frozen_class_name, (FrozenBase, klass), frozen_class_attrs)
     )
-    __store_frozen_class(klass=klass, frozen_class=frozen_class)
     return frozen_class
 
 
-def make_frozen_class(klass: Type[object], attrs: Iterable[str], on_update: OnUpdateFuncType) -> Type[FrozenBase]:
-    frozen_class = get_frozen_class(klass_key=f'{klass.__module__}.{klass.__qualname__}')
+def __create_frozen_dataclass(
+    klass: Type[object], on_update_func: OnUpdateFuncType, freeze_func: Callable[[Any], Any]
+) -> Type[FrozenSlotsBase]:
+    """
+    Frozen dataclass with slots with the same fields as the dataclass, that derives from the dataclass
+    (so its objects are instances of the dataclass and its methods can use super()).
+    The fields are stored in the slots, so the __dict__ of its objects is never created.
+    """
+    fields = dataclasses.fields(klass)
+    field_names = tuple(field.name for field in fields)
+    frozen_class_name = __frozen_class_name(klass, on_update=on_update_func, kind='Dataclass')
 
-    if not frozen_class:
-        frozen_class = __create_frozen_class(klass=klass, attrs=attrs, on_update_func=on_update)
+    def __post_init__(self) -> None:
+        # The values of the objects created by dataclasses.replace are frozen here
+        for field_name in field_names:
+            object.__setattr__(self, field_name, freeze_func(getattr(self, field_name)))
 
-    return frozen_class
+    frozen_class_attrs = {
+        **__frozen_class_base_attrs(klass=klass, on_update_func=on_update_func),
+        '__module__': __name__,
+        '__qualname__': frozen_class_name,
+        '__annotations__': {field.name: field.type for field in fields},
+        '__post_init__': __post_init__,
+        **{field.name: __copy_field(field) for field in fields},
+    }
+
+    params = klass.__dataclass_params__  # type: ignore
+    frozen_dataclass = dataclasses.dataclass(  # type: ignore
+        type(frozen_class_name, (FrozenSlotsBase,), frozen_class_attrs),
+        repr=params.repr,
+        eq=params.eq,
+        order=params.order,
+        unsafe_hash=params.unsafe_hash,
+        frozen=True,
+    )
 
+    # The same class but deriving from the dataclass (a frozen dataclass cannot derive from a dataclass
+    # that is not frozen, so it cannot be decorated) and storing the fields in slots (as dataclass does
+    # when slots=True), and whose updates follow the on_update policy instead of raising
+    # dataclasses.FrozenInstanceError
+    frozen_dataclass_attrs = dict(frozen_dataclass.__dict__)
+    for attr in field_names + ('__dict__', '__weakref__', '__setattr__', '__delattr__'):
+        frozen_dataclass_attrs.pop(attr, None)
+    frozen_dataclass_attrs['__slots__'] = field_names
+    frozen_dataclass_attrs['__setstate__'] = __set_frozen_object_state
+    return type(frozen_class_name, (FrozenSlotsBase, klass), frozen_dataclass_attrs)
 
-def make_unique_class(klass: Type[object], attrs: Dict[str, Any], on_update: OnUpdateFuncType) -> Type[FrozenBase]:
 
-    camel_case_module = klass.__module__.title().replace('.', '').replace('_', "")
-    unique_suffix = str(uuid.uuid4()).replace('-', '')
-    frozen_class_name = f'Frozen{klass.__name__}From{camel_case_module}{unique_suffix}'
-    frozen_class: Type[FrozenBase] = cast(
-        Type[FrozenBase],
-        type(
-            frozen_class_name,
-            (FrozenBase, klass),
-            {
-                **{
-                    'get_gelidum_hot_class_name': lambda _: klass.__name__,
-                    'get_gelidum_hot_class_module': lambda _: klass.__module__,
-                    '_gelidum_on_update': lambda _self, *args, **kwargs: on_update(*args, **kwargs),
-                    **attrs,
-                    '__init__': lambda _: None,
-                }
-            },
-        ),
+# Attributes of the frozen classes that are not copied to their compact frozen classes,
+# because they store the state of the objects or they are provided by FrozenSlotsBase
+__COMPACT_EXCLUDED_ATTRS = frozenset(
+    (
+        '__dict__',
+        '__weakref__',
+        '__slots__',
+        '__slotnames__',
+        '__module__',
+        '__qualname__',
+        '__init__',
+        '__getstate__',
+        '__setstate__',
+        '__setattr__',
+        '__delattr__',
     )
+)
 
-    return frozen_class
+
+def __create_compact_frozen_class(frozen_class: Type[FrozenBase], attrs: Tuple[str, ...]) -> Type[FrozenSlotsBase]:
+    """
+    Frozen class with the methods of a frozen class whose objects store the attributes in slots.
+    Its objects are not instances of the original class, as the original class has a __dict__.
+    """
+    # The attributes are in the name, as a frozen class can have compact frozen classes with different attributes
+    camel_case_attrs = ''.join(__camel_case(attr) for attr in attrs)
+    compact_frozen_class_name = __unique_frozen_class_name(f'Compact{frozen_class.__name__}With{camel_case_attrs}')
+    compact_frozen_class_attrs = __class_attrs(frozen_class, excluded_attrs=__COMPACT_EXCLUDED_ATTRS.union(attrs))
+    compact_frozen_class_attrs.update(
+        {
+            '__slots__': attrs,
+            '__module__': __name__,
+            '__qualname__': compact_frozen_class_name,
+            '__setstate__': __set_frozen_object_state,
+        }
+    )
+    return cast(Type[FrozenSlotsBase], type(compact_frozen_class_name, (FrozenSlotsBase,), compact_frozen_class_attrs))
 
 
-__FROZEN_CLASSES: Dict[str, Type[FrozenBase]] = dict()
-__FROZEN_CLASSES_LOCK = threading.Lock()
+def __class_attrs(klass: Type[object], excluded_attrs: Set[str]) -> Dict[str, Any]:
+    """
+    Attributes of a class and of its bases (but FrozenBase and object), but the excluded ones.
+    """
+    class_attrs: Dict[str, Any] = {}
+    for base in reversed(klass.__mro__):
+        if base in (object, FrozenBase, FrozenSlotsBase):
+            continue
+        for attr, value in base.__dict__.items():
+            if attr not in excluded_attrs:
+                class_attrs[attr] = value
+    return class_attrs
+
+
+def __copy_field(field: dataclasses.Field) -> dataclasses.Field:
+    field_kwargs: Dict[str, Any] = {}
+    if sys.version_info >= (3, 10):
+        field_kwargs['kw_only'] = field.kw_only
+    return dataclasses.field(  # type: ignore
+        default=field.default,
+        default_factory=field.default_factory,
+        repr=field.repr,
+        hash=field.hash,
+        compare=field.compare,
+        metadata=field.metadata,
+        **field_kwargs,
+    )
+
 
+def __set_frozen_object_state(self: FrozenBase, state: Any) -> None:
+    """
+    Restore the attributes of a frozen object when it is unpickled or copied
+    (without this method, the attributes stored in slots would be assigned
+    with setattr, which is not allowed in frozen objects).
+    """
+    dict_state, slots_state = state if isinstance(state, tuple) else (state, None)
+    for state_attrs in (dict_state, slots_state):
+        for attr, value in (state_attrs or {}).items():
+            object.__setattr__(self, attr, value)
+
+
+def make_frozen_class(klass: Type[object], attrs: Iterable[str], on_update: OnUpdateFuncType) -> Type[FrozenBase]:
+    # Lookups are not locked, only the creation of the frozen classes
+    frozen_class = __FROZEN_CLASSES.get((klass, on_update))
+    if frozen_class is not None:
+        return frozen_class
 
-def get_frozen_class(klass_key: str) -> Optional[Type[FrozenBase]]:
     with __FROZEN_CLASSES_LOCK:
-        frozen_class = __FROZEN_CLASSES.get(klass_key)
+        # Other thread could have created the frozen class while this one was waiting for the lock
+        frozen_class = __FROZEN_CLASSES.get((klass, on_update))
+        if frozen_class is None:
+            frozen_class = __create_frozen_class(klass=klass, attrs=attrs, on_update_func=on_update)
+            __store_frozen_class(klass=klass, on_update=on_update, frozen_class=frozen_class)
+
     return frozen_class
 
 
-def get_frozen_classes() -> Set[Type[FrozenBase]]:
+def make_frozen_dataclass(
+    klass: Type[object], on_update: OnUpdateFuncType, freeze_func: Callable[[Any], Any]
+) -> Type[FrozenSlotsBase]:
+    """
+    Frozen dataclass with slots of a dataclass, created only once for each dataclass and update policy.
+    freeze_func freezes the values of the objects created by dataclasses.replace.
+    """
+    # Lookups are not locked, only the creation of the frozen dataclasses
+    frozen_dataclass = __FROZEN_DATACLASSES.get((klass, on_update))
+    if frozen_dataclass is not None:
+        return frozen_dataclass
+
+    with __FROZEN_CLASSES_LOCK:
+        frozen_dataclass = __FROZEN_DATACLASSES.get((klass, on_update))
+        if frozen_dataclass is None:
+            frozen_dataclass = __create_frozen_dataclass(klass=klass, on_update_func=on_update, freeze_func=freeze_func)
+            __FROZEN_DATACLASSES[(klass, on_update)] = frozen_dataclass
+            __store_frozen_class_in_module(frozen_class=frozen_dataclass)
+
+    return frozen_dataclass
+
+
+def make_compact_frozen_class(frozen_class: Type[FrozenBase], attrs: Tuple[str, ...]) -> Type[FrozenSlotsBase]:
+    """
+    Frozen class whose objects store the attributes of the objects of a frozen class in slots,
+    created only once for each frozen class and attributes.
+    """
+    # Lookups are not locked, only the creation of the compact frozen classes
+    compact_frozen_class = __COMPACT_FROZEN_CLASSES.get((frozen_class, attrs))
+    if compact_frozen_class is not None:
+        return compact_frozen_class
+
+    with __FROZEN_CLASSES_LOCK:
+        compact_frozen_class = __COMPACT_FROZEN_CLASSES.get((frozen_class, attrs))
+        if compact_frozen_class is None:
+            compact_frozen_class = __create_compact_frozen_class(frozen_class=frozen_class, attrs=attrs)
+            __COMPACT_FROZEN_CLASSES[(frozen_class, attrs)] = compact_frozen_class
+            __store_frozen_class_in_module(frozen_class=compact_frozen_class)
+
+    return compact_frozen_class
+
+
+__FROZEN_CLASSES: Dict[Tuple[Type[object], OnUpdateFuncType], Type[FrozenBase]] = dict()
+__FROZEN_DATACLASSES: Dict[Tuple[Type[object], OnUpdateFuncType], Type[FrozenSlotsBase]] = dict()
+__COMPACT_FROZEN_CLASSES: Dict[Tuple[Type[FrozenBase], Tuple[str, ...]], Type[FrozenSlotsBase]] = dict()
+__FROZEN_CLASS_NAMES: Set[str] = set()
+__FROZEN_CLASSES_LOCK = threading.Lock()
+
+
+def get_frozen_class(klass: Type[object], on_update: OnUpdateFuncType) -> Optional[Type[FrozenBase]]:
+    return __FROZEN_CLASSES.get((klass, on_update))
+
+
+def get_frozen_classes() -> Set[Type[object]]:
     with __FROZEN_CLASSES_LOCK:
-        return set(__FROZEN_CLASSES.values())
+        return (
+            set(__FROZEN_CLASSES.values()) | set(__FROZEN_DATACLASSES.values()) | set(__COMPACT_FROZEN_CLASSES.values())
+        )
+
+
+def __unique_frozen_class_name(frozen_class_name: str) -> str:
+    """
+    Return a name for a frozen class that is not used by any other stored frozen class
+    (e.g. the frozen classes of the same class with different custom update policies,
+    or the frozen classes of classes with the same name defined in the same module).
+    """
+    unique_frozen_class_name = frozen_class_name
+    index = 1
+    while unique_frozen_class_name in __FROZEN_CLASS_NAMES:
+        index += 1
+        unique_frozen_class_name = f'{frozen_class_name}{index}'
+    return unique_frozen_class_name
 
 
-def __store_frozen_class(klass: Type[object], frozen_class: Type[FrozenBase]) -> None:
+def __store_frozen_class(klass: Type[object], on_update: OnUpdateFuncType, frozen_class: Type[FrozenBase]) -> None:
     """
     Add a frozen class to this module.
     Required for pickle serialization as only objects of non-dynamic
     classes are allowed.
-    This method is thread-safe.
+    This method must be called with the lock of the frozen classes acquired.
     :param klass: the original class.
+    :param on_update: the update policy of the frozen class.
     :param frozen_class: a class that inherits from FrozenBase.
     """
-    with __FROZEN_CLASSES_LOCK:
-        klass_key = f'{klass.__module__}.{klass.__qualname__}'
-        __FROZEN_CLASSES[klass_key] = frozen_class
-        # Required for pickling frozen objects (only classes defined in actual
-        # modules can have their objects pickled)
-        setattr(sys.modules[__name__], frozen_class.__name__, frozen_class)
+    __FROZEN_CLASSES[(klass, on_update)] = frozen_class
+    __store_frozen_class_in_module(frozen_class=frozen_class)
+
+
+def __store_frozen_class_in_module(frozen_class: Type[object]) -> None:
+    __FROZEN_CLASS_NAMES.add(frozen_class.__name__)
+    # Required for pickling frozen objects (only classes defined in actual
+    # modules can have their objects pickled)
+    setattr(sys.modules[__name__], frozen_class.__name__, frozen_class)
 
 
 def clear_frozen_classes() -> None:
     with __FROZEN_CLASSES_LOCK:
         __FROZEN_CLASSES.clear()
+        __FROZEN_DATACLASSES.clear()
+        __COMPACT_FROZEN_CLASSES.clear()
+        __FROZEN_CLASS_NAMES.clear()
@@ -1,9 +1,92 @@
-from typing import Any
+import datetime
+import enum
+import pathlib
+import uuid
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, Dict
 
-from gelidum.frozen.frozen_base import FrozenBase
+from gelidum.dependencies import NUMPY_INSTALLED
+from gelidum.frozen.frozen_base import FrozenBase, FrozenSlotsBase
 
-FROZEN_CLASSES = (FrozenBase, int, float, bool, tuple, None.__class__, complex, bytes, str)
+FROZEN_CLASSES = (FrozenBase, FrozenSlotsBase, int, float, bool, tuple, None.__class__, complex, bytes, str)
+
+# Classes whose objects are immutable, so they do not need to be frozen
+IMMUTABLE_CLASSES = (
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    datetime.timezone,
+    Decimal,
+    Fraction,
+    uuid.UUID,
+    pathlib.PurePath,
+    # Path adds (private) slots to PurePath in some Python versions
+    pathlib.Path,
+    range,
+    frozenset,
+    slice,
+)
+
+if NUMPY_INSTALLED:
+    import numpy as np
+
+    # numpy scalars
+    IMMUTABLE_CLASSES += (np.generic,)
 
 
 def isfrozen(obj: Any) -> bool:
-    return isinstance(obj, FROZEN_CLASSES)
+    return isinstance(obj, FROZEN_CLASSES) or isimmutableclass(type(obj))
+
+
+__IMMUTABLE_CLASS_BY_CLASS: Dict[type, bool] = dict()
+
+
+def isimmutableclass(klass: type) -> bool:
+    """
+    Return if the objects of a class are immutable, i.e. if the class is:
+    - one of the IMMUTABLE_CLASSES or a subclass of them that adds no state (no __dict__ and no slots),
+    - an Enum,
+    - or a class whose objects have no state (no __dict__ and no slots), other than object.
+    The objects of these classes are not frozen: freeze returns them as they are.
+    The result is computed only the first time for each class.
+    """
+    try:
+        return __IMMUTABLE_CLASS_BY_CLASS[klass]
+    except KeyError:
+        pass
+
+    immutable = (
+        (issubclass(klass, IMMUTABLE_CLASSES) and not __adds_state(klass))
+        or issubclass(klass, enum.Enum)
+        or (
+            klass is not object
+            and klass.__basicsize__ == object.__basicsize__
+            and klass.__dictoffset__ == 0
+            and klass.__itemsize__ == 0
+        )
+    )
+
+    __IMMUTABLE_CLASS_BY_CLASS[klass] = immutable
+    return immutable
+
+
+def __adds_state(klass: type) -> bool:
+    """
+    Return if the class, or any of its bases that are subclasses of one of the IMMUTABLE_CLASSES,
+    adds state to the objects, i.e. a __dict__ or non-empty __slots__.
+    The state of the IMMUTABLE_CLASSES themselves is not taken into account (e.g. UUID objects
+    have a __dict__ in Python 3.7).
+    """
+    for mro_class in klass.__mro__:
+        if mro_class in IMMUTABLE_CLASSES:
+            return False
+        mro_class_dict = vars(mro_class)
+        if '__dict__' in mro_class_dict:
+            return True
+        slots = mro_class_dict.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        if any(slot != '__weakref__' for slot in slots):
+            return True
+    return False
@@ -0,0 +1,231 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Type
+
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import FrozenBase, isfrozen
+from gelidum.typing import FrozenType
+
+__all__ = ['lazyfrozendict', 'lazyfrozenlist', 'make_lazy_frozen_object']
+
+
+_LazyFreezeFuncType = Callable[[Any], FrozenType]
+
+# Classes whose objects do not need to be frozen
+_IMMUTABLE_CLASSES = frozenset((bool, int, float, complex, str, bytes, type(None)))
+
+# Value of the items of a lazyfrozenlist that have not been frozen yet
+_PENDING = object()
+
+# Lock of the storage of the lazily frozen values. The values are frozen out of it, and the first
+# frozen value stored is the one returned to all the threads that read the value at the same time.
+_LAZY_VALUES_LOCK = threading.Lock()
+
+
+class lazyfrozendict(frozendict):  # noqa
+    """
+    frozendict whose values are frozen the first time they are read.
+    Created by freeze with on_freeze='lazy'.
+    """
+
+    def __init__(self, obj: Dict, freeze_func: _LazyFreezeFuncType):
+        # The values are stored as they are, and replaced by their frozen versions when read
+        dict.update(self, obj)
+        object.__setattr__(self, '_gelidum_lazy_freeze', freeze_func)
+
+    def __getitem__(self, key: Any) -> FrozenType:
+        value = dict.__getitem__(self, key)
+        if type(value) not in _IMMUTABLE_CLASSES and not isfrozen(value):
+            frozen_value = self._gelidum_lazy_freeze(value)
+            with _LAZY_VALUES_LOCK:
+                if dict.__getitem__(self, key) is value:
+                    dict.__setitem__(self, key, frozen_value)
+                value = dict.__getitem__(self, key)
+        return value
+
+    def _gelidum_freeze_values(self) -> None:
+        for key in dict.keys(self):
+            self[key]  # noqa
+
+    def __iter__(self) -> Iterator[Any]:
+        # Overriding __iter__ makes dict(self) and {**self} read the values with __getitem__
+        return dict.__iter__(self)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def values(self):
+        self._gelidum_freeze_values()
+        return dict.values(self)
+
+    def items(self):
+        self._gelidum_freeze_values()
+        return dict.items(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self._gelidum_freeze_values()
+        if isinstance(other, lazyfrozendict):
+            other._gelidum_freeze_values()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        self._gelidum_freeze_values()
+        return super().__hash__()
+
+    def __or__(self, other: Any) -> frozendict:
+        self._gelidum_freeze_values()
+        return super().__or__(other)
+
+    def __sub__(self, other: Any) -> frozendict:
+        self._gelidum_freeze_values()
+        return super().__sub__(other)
+
+    def __repr__(self) -> str:
+        self._gelidum_freeze_values()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return frozendict, (dict(self.items()),)
+
+
+class lazyfrozenlist(frozenlist):  # noqa
+    """
+    frozenlist whose items are frozen the first time they are read.
+    Created by freeze with on_freeze='lazy'.
+    """
+
+    def __new__(cls, obj: List, freeze_func: _LazyFreezeFuncType) -> 'lazyfrozenlist':
+        # The tuple keeps the original items, and the frozen items are stored apart
+        self = tuple.__new__(cls, obj)
+        object.__setattr__(self, '_gelidum_lazy_freeze', freeze_func)
+        object.__setattr__(self, '_gelidum_frozen_items', [_PENDING] * len(obj))
+        return self
+
+    def __init__(self, obj: List, freeze_func: _LazyFreezeFuncType):
+        pass
+
+    def __getitem__(self, key: Any) -> FrozenType:
+        if type(key) is slice:
+            return frozenlist([self[index] for index in range(*key.indices(len(self)))], freeze_func=_identity)
+        frozen_items: List[Any] = self._gelidum_frozen_items
+        try:
+            item = frozen_items[key]
+        except IndexError:
+            raise IndexError('frozenlist index out of range')
+        if item is _PENDING:
+            item = tuple.__getitem__(self, key)
+            if type(item) not in _IMMUTABLE_CLASSES and not isfrozen(item):
+                item = self._gelidum_lazy_freeze(item)
+            with _LAZY_VALUES_LOCK:
+                if frozen_items[key] is _PENDING:
+                    frozen_items[key] = item
+                item = frozen_items[key]
+        return item
+
+    def __iter__(self) -> Iterator[FrozenType]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self) -> Iterator[FrozenType]:
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+    def __contains__(self, item: Any) -> bool:
+        return any(frozen_item is item or frozen_item == item for frozen_item in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, tuple):
+            return NotImplemented
+        return len(self) == len(other) and all(item == other_item for item, other_item in zip(self, other))
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        if self._gelidum_hash is None:
+            object.__setattr__(self, '_gelidum_hash', hash(tuple(self)))
+        return self._gelidum_hash
+
+    def index(self, x, start=None, end=None) -> int:
+        return frozenlist(self, freeze_func=_identity).index(x, start, end)
+
+    def count(self, x) -> int:
+        return sum(1 for item in self if item is x or item == x)
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+    def __reduce__(self):
+        return frozenlist, (tuple(self),)
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class _LazyAttribute(object):
+    """
+    Non-data descriptor that freezes the value of an attribute of a lazy frozen object
+    the first time it is read. The frozen value is stored in the object, so the next
+    reads find it there without calling the descriptor.
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: FrozenBase, owner: Type[FrozenBase]) -> Any:
+        if instance is None:
+            return self
+        lazy_attrs: Dict[str, Any] = instance.__dict__['_gelidum_lazy_attrs']
+        value = lazy_attrs.get(self.name, _PENDING)
+        if value is _PENDING:
+            # The object has not this attribute pending of being frozen, it is looked up in its class
+            return getattr(super(instance.__class__, instance), self.name)
+        if type(value) not in _IMMUTABLE_CLASSES and not isfrozen(value):
+            value = instance._gelidum_lazy_freeze(value)
+        with _LAZY_VALUES_LOCK:
+            if lazy_attrs.pop(self.name, _PENDING) is not _PENDING:
+                object.__setattr__(instance, self.name, value)
+            value = instance.__dict__[self.name]
+        return value
+
+
+__LAZY_FROZEN_CLASSES_LOCK = threading.Lock()
+
+
+def __lazy_frozen_class(frozen_class: Type[FrozenBase], attrs: Iterable[str]) -> Type[FrozenBase]:
+    lazy_frozen_class = frozen_class.__dict__.get('_gelidum_lazy_class')
+    if lazy_frozen_class is None or any(attr not in lazy_frozen_class.__dict__ for attr in attrs):
+        with __LAZY_FROZEN_CLASSES_LOCK:
+            lazy_frozen_class = frozen_class.__dict__.get('_gelidum_lazy_class')
+            if lazy_frozen_class is None:
+                lazy_frozen_class = type(
+                    f'Lazy{frozen_class.__name__}',
+                    (frozen_class,),
+                    {'__slots__': (), '__module__': frozen_class.__module__},
+                )
+                type.__setattr__(frozen_class, '_gelidum_lazy_class', lazy_frozen_class)
+            for attr in attrs:
+                if attr not in lazy_frozen_class.__dict__:
+                    type.__setattr__(lazy_frozen_class, attr, _LazyAttribute(attr))
+    return lazy_frozen_class
+
+
+def make_lazy_frozen_object(
+    frozen_class: Type[FrozenBase], attrs: Dict[str, Any], freeze_func: _LazyFreezeFuncType
+) -> FrozenBase:
+    """
+    Object of (a subclass of) the frozen class whose attributes
+    are frozen the first time they are read.
+    """
+    lazy_frozen_class = __lazy_frozen_class(frozen_class, attrs)
+    frozen_obj = lazy_frozen_class.__new__(lazy_frozen_class)
+    object.__setattr__(frozen_obj, '_gelidum_lazy_attrs', dict(attrs))
+    object.__setattr__(frozen_obj, '_gelidum_lazy_freeze', freeze_func)
+    return frozen_obj
@@ -1,12 +1,58 @@
 import copy
-from typing import Any, Optional, Union
+from types import FunctionType
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from gelidum.typing import OnFreezeFuncType
 
+if TYPE_CHECKING:
+    from gelidum.cache import FreezeCache  # noqa
+
 
 class OnFreezeCopier:
+    """
+    A callable class that copies the objects before freezing them.
+    The copy of the objects whose state is only in their __dict__ and slots is shallow:
+    the attributes of the copy are frozen afterwards (and so copied in their turn),
+    so every object is copied only once. The rest of the objects (e.g. containers
+    whose items are not attributes) are deep-copied.
+    If it has a FreezeCache, freeze returns the cached frozen versions of the
+    objects instead of copying them again, and caches the new ones.
+    """
+
+    cache: Optional['FreezeCache'] = None
+
+    def __init__(self, cache: Optional['FreezeCache'] = None):
+        self.cache = cache
+
     def __call__(self, obj: Any) -> Any:
-        return copy.deepcopy(obj)
+        # The items of builtin collections are not frozen as attributes
+        if isinstance(obj, (dict, list, set, bytearray)) or not _has_attrs_only_state(type(obj)):
+            return copy.deepcopy(obj)
+        return copy.copy(obj)
+
+
+# Methods that objects whose state is only in their __dict__ and slots inherit from object
+_OBJECT_STATE_METHODS = ('__reduce_ex__', '__reduce__', '__getstate__', '__setstate__')
+
+_ATTRS_ONLY_STATE_BY_CLASS: Dict[type, bool] = {}
+
+
+def _has_attrs_only_state(klass: type) -> bool:
+    """
+    Return if the state of the objects of a class is only in their __dict__ and slots,
+    i.e. if the class does not define how its objects are reduced (as the containers,
+    e.g. deque, do), or if it defines (in Python) how they are copied.
+    Computed only the first time for each class.
+    """
+    try:
+        return _ATTRS_ONLY_STATE_BY_CLASS[klass]
+    except KeyError:
+        pass
+    attrs_only_state = isinstance(getattr(klass, '__copy__', None), FunctionType) or all(
+        getattr(klass, method, None) is getattr(object, method, None) for method in _OBJECT_STATE_METHODS
+    )
+    _ATTRS_ONLY_STATE_BY_CLASS[klass] = attrs_only_state
+    return attrs_only_state
 
 
 class OnFreezeIdentityFunc:
@@ -0,0 +1,44 @@
+import warnings
+from typing import Union
+
+from gelidum.exceptions import FrozenException
+from gelidum.frozen import FrozenBase
+from gelidum.typing import OnUpdateFuncType
+
+
+def _on_update_exception(frozen_obj: FrozenBase, message: str, *args, **kwargs) -> None:  # noqa
+    raise FrozenException(message)
+
+
+def _on_update_warning(frozen_obj: FrozenBase, message: str, *args, **kwargs) -> None:  # noqa
+    warnings.warn(message)
+
+
+def _on_update_nothing(*args, **kwargs) -> None:  # noqa
+    pass
+
+
+def on_update_func_creator(on_update: Union[str, OnUpdateFuncType]) -> OnUpdateFuncType:
+    if isinstance(on_update, str):
+        if on_update == 'exception':
+            return _on_update_exception
+        elif on_update == 'warning':
+            return _on_update_warning
+        elif on_update == 'nothing':
+            return _on_update_nothing
+        else:
+            raise AttributeError(
+                f"Invalid value for on_update parameter, '{on_update}' found, "
+                f"only 'exception', 'warning', and 'nothing' are valid options "
+                f'if passed a string'
+            )
+
+    elif callable(on_update):
+        return on_update
+
+    else:
+        raise AttributeError(
+            f"Invalid value for on_update parameter, '{on_update}' found, "
+            f"only 'exception', 'warning', 'nothing' or a function are "
+            f'valid options'
+        )
@@ -0,0 +1,552 @@
+import copy
+import operator
+import threading
+import weakref
+from collections.abc import ItemsView, KeysView, ValuesView
+from types import FunctionType
+from typing import Any, Callable, Dict, Generator, Iterator, Optional, Set, Type
+
+from gelidum.collections import frozendict, frozenlist, frozenzet
+from gelidum.evolve import _copy_frozen_collection
+from gelidum.freeze import freeze, register_freezer
+from gelidum.frozen import FrozenBase, FrozenSlotsBase
+from gelidum.typing import FrozenType
+from gelidum.views import _FORWARDED_METHOD_NAMES, _forwarded_method
+
+__all__ = ['produce', 'thaw']
+
+
+def produce(frozen_obj: FrozenType, recipe: Callable[[Any], Any]) -> FrozenType:
+    """
+    Make a new frozen value by mutating a draft of a frozen one.
+
+    The recipe receives a mutable draft of the frozendict, frozenlist,
+    frozenzet or frozen object, and can modify it as if it were not frozen.
+    The values of the draft are drafted too when they are accessed (by key,
+    index or attribute), so nested values can be modified.
+    When the recipe finishes, the drafts are frozen again: only the
+    modified values (and their ancestors) are copied; the rest of the
+    values are shared with frozen_obj. If nothing was modified, frozen_obj
+    is returned.
+
+    If the recipe returns something other than None or the draft,
+    the frozen returned value is the result.
+    """
+    draft = __make_draft(frozen_obj)
+    if draft is frozen_obj:
+        raise ValueError(f'{type(frozen_obj).__name__} objects cannot be drafted')
+
+    result = recipe(draft)
+    # The drafts are frozen by their freezers (see __freeze_draft), without recursion
+    if result is None or result is draft:
+        return freeze(draft, on_update='exception', on_freeze='copy')
+    return freeze(result, on_update='exception', on_freeze='copy')
+
+
+def thaw(frozen_obj: FrozenType) -> Any:
+    """
+    Mutable version of a frozen value, i.e. the inverse of freeze.
+
+    The frozendicts, frozenlists, frozenzets and frozen objects are thawed into
+    the drafts used by produce: each draft reads its frozen value until it is
+    modified for the first time (when it copies only its frozen value, not the
+    nested ones), and the nested values are thawed when they are accessed.
+    Freezing the thawed value reuses the frozen values that were not modified
+    (including the ones that were thawed). The rest of the frozen values
+    are immutable, so they are returned as they are.
+    """
+    draft = __make_draft(frozen_obj)
+    if draft is frozen_obj and isinstance(frozen_obj, (FrozenBase, FrozenSlotsBase)):
+        raise ValueError(f'{type(frozen_obj).__name__} objects cannot be thawed')
+    return draft
+
+
+def __make_draft(value: Any) -> Any:
+    if isinstance(value, frozendict):
+        return _DictDraft(value, __make_draft)
+    if isinstance(value, frozenlist):
+        return _ListDraft(value, __make_draft)
+    if isinstance(value, frozenzet):
+        return _SetDraft(value)
+    if type(value).__bases__[0] is FrozenBase or isinstance(value, FrozenSlotsBase):
+        # Frozen classes of objects derive from FrozenBase and the original class
+        # (or from FrozenSlotsBase, for frozen dataclasses and compact objects)
+        return _ObjectDraft(value, __make_draft)
+    return value
+
+
+def _modifier(method: Callable) -> Callable:
+    """
+    Method that modifies the draft, whose frozen value is copied before calling the method.
+    """
+
+    def modifier_method(self, *args, **kwargs):
+        self._gelidum_copy()
+        self._gelidum_modified = True
+        return method(self, *args, **kwargs)
+
+    modifier_method.__name__ = method.__name__
+    return modifier_method
+
+
+def _copier(method: Callable) -> Callable:
+    """
+    Method that reads the items of the draft directly, whose frozen value is copied before calling the method.
+    """
+
+    def copier_method(self, *args, **kwargs):
+        self._gelidum_copy()
+        return method(self, *args, **kwargs)
+
+    copier_method.__name__ = method.__name__
+    return copier_method
+
+
+_FinalizeType = Generator[Any, FrozenType, FrozenType]
+
+
+class _Draft(object):
+    """
+    Mutable copy of a frozen value made by produce.
+    """
+
+    def _gelidum_finalize(self) -> _FinalizeType:  # pragma: no cover
+        """
+        Frozen version of the draft. The values of the draft are yielded to be frozen, and received frozen.
+        """
+        raise NotImplementedError('Implement in derived class')
+
+
+class _DictDraft(dict, _Draft):
+    """
+    Draft of a frozendict. Until it is modified, its items are read from the frozendict
+    (and the drafts of its values are kept apart), so drafts that are only read are not copied.
+    """
+
+    def __init__(self, base: frozendict, make_draft: Callable[[Any], Any]):
+        super().__init__()
+        self._gelidum_base = base
+        self._gelidum_make_draft = make_draft
+        self._gelidum_copied = False
+        self._gelidum_modified = False
+        # Drafts of the values read before the items of the frozendict are copied
+        self._gelidum_drafts: Dict[Any, Any] = {}
+
+    def _gelidum_copy(self) -> None:
+        if not self._gelidum_copied:
+            dict.update(self, self._gelidum_base)
+            dict.update(self, self._gelidum_drafts)
+            self._gelidum_drafts = {}
+            self._gelidum_copied = True
+
+    def __getitem__(self, key: Any) -> Any:
+        if self._gelidum_copied:
+            value = dict.__getitem__(self, key)
+            drafts = self
+        else:
+            drafts = self._gelidum_drafts
+            if key in drafts:
+                return drafts[key]
+            if key not in self._gelidum_base:
+                raise KeyError(key)
+            value = self._gelidum_base[key]
+        draft = self._gelidum_make_draft(value)
+        if draft is not value:
+            dict.__setitem__(drafts, key, draft)
+        return draft
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self if self._gelidum_copied else self._gelidum_base, key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return dict.__iter__(self if self._gelidum_copied else self._gelidum_base)
+
+    def __len__(self) -> int:
+        return dict.__len__(self if self._gelidum_copied else self._gelidum_base)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    # The values are drafted when they are iterated
+    def keys(self) -> KeysView:
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        return ItemsView(self)
+
+    __eq__ = _copier(dict.__eq__)
+    __ne__ = _copier(dict.__ne__)
+    __repr__ = _copier(dict.__repr__)
+    copy = _copier(dict.copy)
+    if hasattr(dict, '__reversed__'):
+        # Python version >= 3.8
+        __reversed__ = _copier(dict.__reversed__)
+    if hasattr(dict, '__or__'):
+        # Python version >= 3.9
+        __or__ = _copier(dict.__or__)
+        __ror__ = _copier(dict.__ror__)
+
+    __setitem__ = _modifier(dict.__setitem__)
+    __delitem__ = _modifier(dict.__delitem__)
+    if hasattr(dict, '__ior__'):
+        # Python version >= 3.9
+        __ior__ = _modifier(dict.__ior__)
+    clear = _modifier(dict.clear)
+    pop = _modifier(dict.pop)
+    popitem = _modifier(dict.popitem)
+    setdefault = _modifier(dict.setdefault)
+    update = _modifier(dict.update)
+
+    def _gelidum_finalize(self) -> _FinalizeType:
+        base = self._gelidum_base
+        if not self._gelidum_copied:
+            # Only the values that were drafted can be different from the ones of the frozendict
+            frozen_drafts = {}
+            for key, draft in self._gelidum_drafts.items():
+                frozen_drafts[key] = yield draft
+            if all(frozen_value is base[key] for key, frozen_value in frozen_drafts.items()):
+                return base
+            values = dict(base)
+            values.update(frozen_drafts)
+            return _copy_frozen_collection(base, values)
+
+        values = {}
+        for key, value in dict.items(self):
+            values[key] = yield value
+        if not self._gelidum_modified and all(values[key] is value for key, value in base.items()):
+            return base
+        return _copy_frozen_collection(base, values)
+
+
+class _ListDraft(list, _Draft):
+    """
+    Draft of a frozenlist. Until it is modified, its items are read from the frozenlist
+    (and the drafts of its items are kept apart), so drafts that are only read are not copied.
+    """
+
+    def __init__(self, base: frozenlist, make_draft: Callable[[Any], Any]):
+        super().__init__()
+        self._gelidum_base = base
+        self._gelidum_make_draft = make_draft
+        self._gelidum_copied = False
+        self._gelidum_modified = False
+        # Drafts of the items read before the items of the frozenlist are copied, by index
+        self._gelidum_drafts: Dict[int, Any] = {}
+
+    def _gelidum_copy(self) -> None:
+        if not self._gelidum_copied:
+            list.extend(self, self._gelidum_base)
+            for index, draft in self._gelidum_drafts.items():
+                list.__setitem__(self, index, draft)
+            self._gelidum_drafts = {}
+            self._gelidum_copied = True
+
+    def __getitem__(self, index: Any) -> Any:
+        if self._gelidum_copied:
+            value = list.__getitem__(self, index)
+            if type(index) is slice:
+                return value
+        elif type(index) is slice:
+            drafts = self._gelidum_drafts
+            base = self._gelidum_base
+            return [drafts.get(item_index, base[item_index]) for item_index in range(*index.indices(len(base)))]
+        else:
+            index = operator.index(index)
+            if index < 0:
+                index += len(self._gelidum_base)
+            if index in self._gelidum_drafts:
+                return self._gelidum_drafts[index]
+            if not 0 <= index < len(self._gelidum_base):
+                raise IndexError('list index out of range')
+            value = self._gelidum_base[index]
+        draft = self._gelidum_make_draft(value)
+        if draft is not value:
+            if self._gelidum_copied:
+                list.__setitem__(self, index, draft)
+            else:
+                self._gelidum_drafts[index] = draft
+        return draft
+
+    def __len__(self) -> int:
+        return list.__len__(self) if self._gelidum_copied else len(self._gelidum_base)
+
+    # The items are drafted when they are iterated
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self) -> Iterator[Any]:
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+    __contains__ = _copier(list.__contains__)
+    __eq__ = _copier(list.__eq__)
+    __ne__ = _copier(list.__ne__)
+    __lt__ = _copier(list.__lt__)
+    __le__ = _copier(list.__le__)
+    __gt__ = _copier(list.__gt__)
+    __ge__ = _copier(list.__ge__)
+    __repr__ = _copier(list.__repr__)
+    __add__ = _copier(list.__add__)
+    __mul__ = _copier(list.__mul__)
+    __rmul__ = _copier(list.__rmul__)
+    copy = _copier(list.copy)
+    count = _copier(list.count)
+    index = _copier(list.index)
+
+    __setitem__ = _modifier(list.__setitem__)
+    __delitem__ = _modifier(list.__delitem__)
+    __iadd__ = _modifier(list.__iadd__)
+    __imul__ = _modifier(list.__imul__)
+    append = _modifier(list.append)
+    clear = _modifier(list.clear)
+    extend = _modifier(list.extend)
+    insert = _modifier(list.insert)
+    pop = _modifier(list.pop)
+    remove = _modifier(list.remove)
+    reverse = _modifier(list.reverse)
+    sort = _modifier(list.sort)
+
+    def _gelidum_finalize(self) -> _FinalizeType:
+        base = self._gelidum_base
+        if not self._gelidum_copied:
+            # Only the items that were drafted can be different from the ones of the frozenlist
+            frozen_drafts = {}
+            for index, draft in self._gelidum_drafts.items():
+                frozen_drafts[index] = yield draft
+            if all(frozen_item is base[index] for index, frozen_item in frozen_drafts.items()):
+                return base
+            items = list(base)
+            for index, frozen_item in frozen_drafts.items():
+                items[index] = frozen_item
+            return _copy_frozen_collection(base, items)
+
+        items = []
+        for item in list.__iter__(self):
+            items.append((yield item))
+        if not self._gelidum_modified and all(item is base_item for item, base_item in zip(items, base)):
+            return base
+        return _copy_frozen_collection(base, items)
+
+
+class _SetDraft(set, _Draft):
+    """
+    Draft of a frozenzet. Until it is modified, its items are read from the frozenzet,
+    so drafts that are only read are not copied.
+    """
+
+    def __init__(self, base: frozenzet):
+        super().__init__()
+        self._gelidum_base = base
+        self._gelidum_copied = False
+        self._gelidum_modified = False
+
+    def _gelidum_copy(self) -> None:
+        if not self._gelidum_copied:
+            set.update(self, self._gelidum_base)
+            self._gelidum_copied = True
+
+    def __contains__(self, item: Any) -> bool:
+        return set.__contains__(self, item) if self._gelidum_copied else item in self._gelidum_base
+
+    def __iter__(self) -> Iterator[Any]:
+        return set.__iter__(self) if self._gelidum_copied else iter(self._gelidum_base)
+
+    def __len__(self) -> int:
+        return set.__len__(self) if self._gelidum_copied else len(self._gelidum_base)
+
+    __eq__ = _copier(set.__eq__)
+    __ne__ = _copier(set.__ne__)
+    __lt__ = _copier(set.__lt__)
+    __le__ = _copier(set.__le__)
+    __gt__ = _copier(set.__gt__)
+    __ge__ = _copier(set.__ge__)
+    __repr__ = _copier(set.__repr__)
+    __reduce__ = _copier(set.__reduce__)
+    __and__ = _copier(set.__and__)
+    __or__ = _copier(set.__or__)
+    __sub__ = _copier(set.__sub__)
+    __xor__ = _copier(set.__xor__)
+    __rand__ = _copier(set.__rand__)
+    __ror__ = _copier(set.__ror__)
+    __rsub__ = _copier(set.__rsub__)
+    __rxor__ = _copier(set.__rxor__)
+    copy = _copier(set.copy)
+    difference = _copier(set.difference)
+    intersection = _copier(set.intersection)
+    isdisjoint = _copier(set.isdisjoint)
+    issubset = _copier(set.issubset)
+    issuperset = _copier(set.issuperset)
+    symmetric_difference = _copier(set.symmetric_difference)
+    union = _copier(set.union)
+
+    __iand__ = _modifier(set.__iand__)
+    __ior__ = _modifier(set.__ior__)
+    __isub__ = _modifier(set.__isub__)
+    __ixor__ = _modifier(set.__ixor__)
+    add = _modifier(set.add)
+    clear = _modifier(set.clear)
+    difference_update = _modifier(set.difference_update)
+    discard = _modifier(set.discard)
+    intersection_update = _modifier(set.intersection_update)
+    pop = _modifier(set.pop)
+    remove = _modifier(set.remove)
+    symmetric_difference_update = _modifier(set.symmetric_difference_update)
+    update = _modifier(set.update)
+
+    def _gelidum_finalize(self) -> _FinalizeType:
+        base = self._gelidum_base
+        if not self._gelidum_modified or set.__eq__(self, base):
+            return base
+        frozen_items = []
+        for item in set.__iter__(self):
+            frozen_items.append((yield item))
+        return type(base)(frozen_items, freeze_func=_identity)
+
+
+def _identity(item: FrozenType) -> FrozenType:
+    return item
+
+
+class _ObjectDraft(_Draft):
+    """
+    Draft of a frozen object. It records the attributes that are assigned
+    or deleted, and reads the rest of the attributes from the frozen object.
+    The special methods of the class of the object (e.g. __len__ or __eq__)
+    are called by the draft too, and the draft passes the isinstance checks of that class.
+    """
+
+    def __new__(cls, base: FrozenBase, make_draft: Callable[[Any], Any]) -> '_ObjectDraft':
+        return object.__new__(_object_draft_class(type(base)))
+
+    def __init__(self, base: FrozenBase, make_draft: Callable[[Any], Any]):
+        object.__setattr__(self, '_gelidum_base', base)
+        object.__setattr__(self, '_gelidum_make_draft', make_draft)
+        object.__setattr__(self, '_gelidum_modified', False)
+        # Attributes that have been drafted or assigned
+        object.__setattr__(self, '_gelidum_attrs', {})
+        object.__setattr__(self, '_gelidum_deleted_attrs', set())
+
+    @property
+    def __class__(self) -> type:
+        # The original class of the frozen object (compact frozen objects have none)
+        return _original_class(type(self._gelidum_base)) or type(self)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_gelidum_'):
+            # Draft without frozen object (e.g. not initialized yet)
+            raise AttributeError(name)
+        attrs: Dict[str, Any] = self._gelidum_attrs
+        if name in attrs:
+            return attrs[name]
+        if name in self._gelidum_deleted_attrs:
+            raise AttributeError(f"'{type(self._gelidum_base).__name__}' object has no attribute '{name}'")
+        class_attr = _get_class_attr(type(self._gelidum_base), name)
+        if isinstance(class_attr, (FunctionType, property)):
+            # The methods (and properties) of the class read and assign the attributes of the draft
+            return class_attr.__get__(self, type(self._gelidum_base))
+        value = getattr(self._gelidum_base, name)
+        draft = self._gelidum_make_draft(value)
+        if draft is not value:
+            attrs[name] = draft
+        return draft
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        class_attr = _get_class_attr(type(self._gelidum_base), name)
+        if isinstance(class_attr, property) and class_attr.fset is not None:
+            class_attr.fset(self, value)
+            return
+        self._gelidum_attrs[name] = value
+        self._gelidum_deleted_attrs.discard(name)
+        object.__setattr__(self, '_gelidum_modified', True)
+
+    def __delattr__(self, name: str) -> None:
+        deleted_attrs: Set[str] = self._gelidum_deleted_attrs
+        if name in deleted_attrs or (name not in self._gelidum_attrs and not hasattr(self._gelidum_base, name)):
+            raise AttributeError(name)
+        self._gelidum_attrs.pop(name, None)
+        deleted_attrs.add(name)
+        object.__setattr__(self, '_gelidum_modified', True)
+
+    def _gelidum_finalize(self) -> _FinalizeType:
+        values = {}
+        for name, value in self._gelidum_attrs.items():
+            values[name] = yield value
+        base = self._gelidum_base
+        if not self._gelidum_modified and all(value is getattr(base, name) for name, value in values.items()):
+            return base
+        # The copy shares the values of the attributes of the frozen object
+        frozen_obj = copy.copy(base)
+        for name, value in values.items():
+            object.__setattr__(frozen_obj, name, value)
+        for name in self._gelidum_deleted_attrs:
+            try:
+                object.__delattr__(frozen_obj, name)
+            except AttributeError:
+                # Attribute only assigned in the draft
+                pass
+        return frozen_obj
+
+
+def _original_class(frozen_class: type) -> Optional[type]:
+    # Frozen classes derive from FrozenBase (or FrozenSlotsBase) and their original classes,
+    # but compact frozen classes, that only derive from FrozenSlotsBase
+    bases = frozen_class.__bases__
+    return bases[1] if len(bases) > 1 else None
+
+
+def _get_class_attr(frozen_class: type, name: str) -> Any:
+    """
+    Attribute of the frozen class, but the ones of FrozenBase and FrozenSlotsBase
+    (i.e. the attribute of the original class, or the one copied to the compact frozen class).
+    """
+    for klass in frozen_class.__mro__:
+        if klass is not FrozenBase and klass is not FrozenSlotsBase and name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+
+# Special methods forwarded to the classes of the frozen objects by their drafts, besides the ones of the views
+_FORWARDED_DRAFT_METHOD_NAMES = _FORWARDED_METHOD_NAMES + ('__repr__', '__eq__', '__ne__', '__hash__')
+
+# The draft classes are not kept alive by the frozen classes
+_OBJECT_DRAFT_CLASSES: 'weakref.WeakKeyDictionary[type, Type[_ObjectDraft]]' = weakref.WeakKeyDictionary()
+_OBJECT_DRAFT_CLASSES_LOCK = threading.Lock()
+
+
+def _object_draft_class(frozen_class: type) -> Type[_ObjectDraft]:
+    """
+    Class of the drafts of the objects of a frozen class: _ObjectDraft, or a subclass of it with the
+    special methods that the original class defines. Created only the first time for each frozen class.
+    """
+    draft_class = _OBJECT_DRAFT_CLASSES.get(frozen_class)
+    if draft_class is not None:
+        return draft_class
+
+    with _OBJECT_DRAFT_CLASSES_LOCK:
+        draft_class = _OBJECT_DRAFT_CLASSES.get(frozen_class)
+        if draft_class is None:
+            methods = {}
+            for name in _FORWARDED_DRAFT_METHOD_NAMES:
+                class_attr = _get_class_attr(frozen_class, name)
+                if class_attr is not None and class_attr is not object.__dict__.get(name):
+                    # Unhashable classes have None as __hash__
+                    methods[name] = _forwarded_method(name) if callable(class_attr) else class_attr
+            draft_class = type('_ObjectDraft', (_ObjectDraft,), methods) if methods else _ObjectDraft
+            _OBJECT_DRAFT_CLASSES[frozen_class] = draft_class
+    return draft_class
+
+
+def __freeze_draft(draft: _Draft, **kwargs) -> _FinalizeType:
+    # Drafts (e.g. the values returned by thaw) are frozen reusing the frozen values they were made from.
+    # Their values are yielded, so they are frozen without recursion by freeze
+    return (yield from draft._gelidum_finalize())
+
+
+register_freezer(_DictDraft, __freeze_draft)
+register_freezer(_ListDraft, __freeze_draft)
+register_freezer(_SetDraft, __freeze_draft)
+register_freezer(_ObjectDraft, __freeze_draft)
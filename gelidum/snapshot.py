@@ -0,0 +1,470 @@
+import threading
+import weakref
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from gelidum.collections import frozendict, frozenlist, frozenzet
+from gelidum.exceptions import FrozenException
+from gelidum.freeze import freeze, register_freezer
+from gelidum.frozen import isfrozen, make_frozen_class
+from gelidum.on_update import on_update_func_creator
+from gelidum.typing import FrozenType, OnUpdateFuncType, T
+from gelidum.utils import isbuiltin
+
+__all__ = ['snapshot', 'track', 'trackeddict', 'trackedlist', 'trackedset']
+
+
+class _Tracking(object):
+    """
+    Tracking state of a tracked value: if it has been modified since its last snapshot,
+    the frozen version made by that snapshot, and the tracked values that reference it,
+    that are modified (i.e. their frozen versions are outdated) when it is modified.
+    """
+
+    __slots__ = ('owner', 'modified', 'frozen', 'on_update', 'parents')
+
+    def __init__(self, owner: Any):
+        self.owner = weakref.ref(owner)
+        self.modified: bool = True
+        self.frozen: Optional[FrozenType] = None
+        self.on_update: Optional[OnUpdateFuncType] = None
+        # Weak references to the parents by their ids, as tracked values are not hashable
+        self.parents: Dict[int, weakref.ref] = {}
+
+
+class _Tracked(object):
+    """
+    Base class of the tracked values.
+    """
+
+
+def __get_tracking(value: _Tracked) -> Optional[_Tracking]:
+    tracking = value.__dict__.get('_gelidum_tracking')
+    # Copies of tracked values share the tracking of the original value, but are tracked apart
+    if tracking is None or tracking.owner() is not value:
+        return None
+    return tracking
+
+
+def __tracking(value: _Tracked) -> _Tracking:
+    tracking = __get_tracking(value)
+    if tracking is None:
+        tracking = _Tracking(value)
+        object.__setattr__(value, '_gelidum_tracking', tracking)
+    return tracking
+
+
+def _mark_modified(value: _Tracked) -> None:
+    """
+    Mark a tracked value and the tracked values that reference it (directly or not) as modified.
+    """
+    values = [value]
+    while values:
+        tracking = __get_tracking(values.pop())
+        if tracking is not None and not tracking.modified:
+            tracking.modified = True
+            for parent_ref in tracking.parents.values():
+                parent = parent_ref()
+                if parent is not None:
+                    values.append(parent)
+
+
+def _modifier(method: Callable, track_args: Optional[Callable[..., Tuple[tuple, dict]]] = None) -> Callable:
+    """
+    Method that marks the tracked value as modified before calling the method.
+    track_args returns the arguments with the values that are inserted by the method tracked.
+    """
+
+    def modifier_method(self, *args, **kwargs):
+        _mark_modified(self)
+        if track_args is not None:
+            args, kwargs = track_args(*args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    modifier_method.__name__ = method.__name__
+    return modifier_method
+
+
+def _track_value(*args) -> Tuple[tuple, dict]:
+    # The value is the last argument (e.g. list.insert(index, value))
+    return args[:-1] + (track(args[-1]),), {}
+
+
+def _track_list_items(*args) -> Tuple[tuple, dict]:
+    # The items are in the last argument, that could be an iterable of items or an item of the list
+    if len(args) == 1 or isinstance(args[0], slice):
+        return args[:-1] + ([track(item) for item in args[-1]],), {}
+    return _track_value(*args)
+
+
+def _track_set_items(*others) -> Tuple[tuple, dict]:
+    return tuple({track(item) for item in other} for other in others), {}
+
+
+def _track_dict_items(*args, **kwargs) -> Tuple[tuple, dict]:
+    return ({key: track(value) for key, value in dict(*args, **kwargs).items()},), {}
+
+
+class trackeddict(dict, _Tracked):  # noqa
+    """
+    dict whose modifications are tracked by snapshot.
+    """
+
+    __setitem__ = _modifier(dict.__setitem__, track_args=_track_value)
+    __delitem__ = _modifier(dict.__delitem__)
+    if hasattr(dict, '__ior__'):
+        # Python version >= 3.9
+        __ior__ = _modifier(dict.__ior__, track_args=_track_dict_items)
+    clear = _modifier(dict.clear)
+    pop = _modifier(dict.pop)
+    popitem = _modifier(dict.popitem)
+    update = _modifier(dict.update, track_args=_track_dict_items)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return dict.__getitem__(self, key)
+        _mark_modified(self)
+        return dict.setdefault(self, key, track(default))
+
+
+class trackedlist(list, _Tracked):  # noqa
+    """
+    list whose modifications are tracked by snapshot.
+    """
+
+    __setitem__ = _modifier(list.__setitem__, track_args=_track_list_items)
+    __delitem__ = _modifier(list.__delitem__)
+    __iadd__ = _modifier(list.__iadd__, track_args=_track_list_items)
+    __imul__ = _modifier(list.__imul__)
+    append = _modifier(list.append, track_args=_track_value)
+    clear = _modifier(list.clear)
+    extend = _modifier(list.extend, track_args=_track_list_items)
+    insert = _modifier(list.insert, track_args=_track_value)
+    pop = _modifier(list.pop)
+    remove = _modifier(list.remove)
+    reverse = _modifier(list.reverse)
+    sort = _modifier(list.sort)
+
+
+class trackedset(set, _Tracked):  # noqa
+    """
+    set whose modifications are tracked by snapshot.
+    """
+
+    __iand__ = _modifier(set.__iand__)
+    __ior__ = _modifier(set.__ior__, track_args=_track_set_items)
+    __isub__ = _modifier(set.__isub__)
+    __ixor__ = _modifier(set.__ixor__, track_args=_track_set_items)
+    add = _modifier(set.add, track_args=_track_value)
+    clear = _modifier(set.clear)
+    difference_update = _modifier(set.difference_update)
+    discard = _modifier(set.discard)
+    intersection_update = _modifier(set.intersection_update)
+    pop = _modifier(set.pop)
+    remove = _modifier(set.remove)
+    symmetric_difference_update = _modifier(set.symmetric_difference_update, track_args=_track_set_items)
+    update = _modifier(set.update, track_args=_track_set_items)
+
+
+__TRACKED_CLASSES: Dict[type, Type[_Tracked]] = dict()
+__TRACKED_CLASSES_LOCK = threading.Lock()
+
+
+def __tracked_class(klass: type) -> Type[_Tracked]:
+    """
+    Subclass of the class whose objects track the assignments and deletions of their attributes.
+    """
+    tracked_class = __TRACKED_CLASSES.get(klass)
+    if tracked_class is not None:
+        return tracked_class
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _mark_modified(self)
+        super(tracked_class, self).__setattr__(name, track(value))
+
+    def __delattr__(self, name: str) -> None:
+        _mark_modified(self)
+        super(tracked_class, self).__delattr__(name)
+
+    with __TRACKED_CLASSES_LOCK:
+        if klass not in __TRACKED_CLASSES:
+            __TRACKED_CLASSES[klass] = type(
+                f'Tracked{klass.__name__}',
+                (klass, _Tracked),
+                {'__setattr__': __setattr__, '__delattr__': __delattr__, '__module__': klass.__module__},
+            )
+        tracked_class = __TRACKED_CLASSES[klass]
+    return tracked_class
+
+
+def track(obj: T) -> T:
+    """
+    Tracked version of a value, whose modifications are known by snapshot.
+    Dicts, lists and sets are copied to trackeddict, trackedlist and trackedset objects,
+    while objects are tracked in place by changing their classes to tracked subclasses.
+    The values, items and attributes of the tracked values are tracked too.
+    Objects of classes with __slots__ and the rest of values are returned as they are.
+    """
+    return __track(obj, tracked_values={})
+
+
+def __track(value: Any, tracked_values: Dict[int, Any]) -> Any:
+    # The values are tracked without recursion to support any depth:
+    # the values whose items must be tracked are kept in this stack
+    values: List[Any] = []
+
+    def track_item(item: Any) -> Any:
+        tracked_item, is_new = __start_tracking(item, tracked_values=tracked_values)
+        if is_new:
+            values.append(item)
+        return tracked_item
+
+    tracked_value = track_item(value)
+    while values:
+        value = values.pop()
+        if type(value) is dict:
+            dict.update(tracked_values[id(value)], {key: track_item(item) for key, item in value.items()})
+        elif type(value) is list:
+            list.extend(tracked_values[id(value)], [track_item(item) for item in value])
+        else:
+            for attr, attr_value in list(vars(value).items()):
+                object.__setattr__(value, attr, track_item(attr_value))
+    return tracked_value
+
+
+def __start_tracking(value: Any, tracked_values: Dict[int, Any]) -> Tuple[Any, bool]:
+    """
+    Tracked version of a value (without its items, values or attributes tracked)
+    and whether its items, values or attributes must be tracked.
+    """
+    if isbuiltin(value) or isfrozen(value) or isinstance(value, _Tracked):
+        return value, False
+
+    tracked_value = tracked_values.get(id(value))
+    if tracked_value is not None:
+        return tracked_value, False
+
+    klass = type(value)
+    if klass is dict:
+        tracked_value = trackeddict()
+    elif klass is list:
+        tracked_value = trackedlist()
+    elif klass is set:
+        tracked_values[id(value)] = trackedset(value)
+        return tracked_values[id(value)], False
+    elif (
+        hasattr(value, '__dict__')
+        and not hasattr(klass, '__slots__')
+        and not isinstance(value, (type, FunctionType, BuiltinFunctionType, MethodType, ModuleType))
+    ):
+        try:
+            value.__class__ = __tracked_class(klass)
+        except TypeError:
+            # Objects of builtin classes
+            return value, False
+        tracked_value = value
+    else:
+        return value, False
+    tracked_values[id(value)] = tracked_value
+    return tracked_value, True
+
+
+def snapshot(obj: T, on_update: Union[str, OnUpdateFuncType] = 'exception') -> FrozenType:
+    """
+    Frozen version of a value, like freeze with on_freeze='copy', made incrementally:
+    the tracked values (see track) that have not been modified since the last snapshot
+    are not frozen again, their frozen versions of that snapshot are reused instead.
+    So, only the modified tracked values and the tracked values that reference them
+    are copied, and the rest of frozen values keep their identity between snapshots.
+    Values that are not tracked are frozen in every snapshot.
+    """
+    on_update_func: OnUpdateFuncType = on_update_func_creator(on_update=on_update)
+    frozen_obj, _ = __snapshot(obj, on_update=on_update_func, snapshots={}, memo={})
+    return frozen_obj
+
+
+# Snapshot of a trackedlist whose frozenlist does not exist yet
+_IN_PROGRESS = (None, False)
+
+_SnapshotType = Tuple[FrozenType, bool]
+
+
+class _Snapshotting(NamedTuple):
+    value: _Tracked
+    snapshotting: Generator[Any, _SnapshotType, _SnapshotType]
+
+
+def __snapshot(
+    value: Any, on_update: OnUpdateFuncType, snapshots: Dict[int, _SnapshotType], memo: Dict[int, Any]
+) -> _SnapshotType:
+    """
+    Frozen version of a value and whether it can be reused by the next snapshots,
+    that is not the case if it contains values that are not tracked.
+    """
+    # Values are frozen without recursion to support any depth: the tracked values
+    # being frozen are kept in this stack with the generators that freeze them,
+    # that yield their items and receive the snapshots of those items
+    stack: List[_Snapshotting] = []
+    value_snapshot = __start_snapshot(
+        value, parent=None, on_update=on_update, snapshots=snapshots, memo=memo, stack=stack
+    )
+    while stack:
+        snapshotting = stack[-1]
+        try:
+            item = snapshotting.snapshotting.send(value_snapshot)
+        except StopIteration as stop:
+            stack.pop()
+            value_snapshot = stop.value
+        else:
+            value_snapshot = __start_snapshot(
+                item, parent=snapshotting.value, on_update=on_update, snapshots=snapshots, memo=memo, stack=stack
+            )
+    return value_snapshot
+
+
+def __start_snapshot(
+    value: Any,
+    parent: Optional[_Tracked],
+    on_update: OnUpdateFuncType,
+    snapshots: Dict[int, _SnapshotType],
+    memo: Dict[int, Any],
+    stack: List[_Snapshotting],
+) -> Optional[_SnapshotType]:
+    """
+    Start the snapshot of a value.
+    If the snapshot can be made right away, return it. Otherwise, push the generator that makes it
+    to the stack and return None, that is the value that must be sent to that new generator to start it.
+    """
+    if isbuiltin(value) or isfrozen(value):
+        return value, True
+    if not isinstance(value, _Tracked):
+        return freeze(value, on_update=on_update, memo=memo), False
+
+    tracking = __tracking(value)
+    if parent is not None:
+        tracking.parents[id(parent)] = weakref.ref(parent)
+
+    value_snapshot = snapshots.get(id(value))
+    if value_snapshot is _IN_PROGRESS:
+        raise FrozenException(f'{type(value).__name__} object references itself and cannot be frozen')
+    if value_snapshot is not None:
+        return value_snapshot
+
+    if not tracking.modified and tracking.frozen is not None and tracking.on_update is on_update:
+        snapshots[id(value)] = (tracking.frozen, True)
+        return tracking.frozen, True
+
+    stack.append(
+        _Snapshotting(value=value, snapshotting=__snapshot_tracked(value, on_update=on_update, snapshots=snapshots))
+    )
+    return None
+
+
+def __snapshot_tracked(
+    value: _Tracked, on_update: OnUpdateFuncType, snapshots: Dict[int, _SnapshotType]
+) -> Generator[Any, _SnapshotType, _SnapshotType]:
+    frozen_value, item_snapshots = yield from __snapshot_items(value, on_update=on_update, snapshots=snapshots)
+    stable = all(item_stable for _, item_stable in item_snapshots)
+    tracking = __tracking(value)
+    tracking.modified = False
+    tracking.frozen = frozen_value if stable else None
+    tracking.on_update = on_update
+    if not stable:
+        # The frozen versions of the values that reference this one cannot be reused
+        _mark_modified(value)
+    snapshots[id(value)] = (frozen_value, stable)
+    return frozen_value, stable
+
+
+def __snapshot_items(
+    value: _Tracked, on_update: OnUpdateFuncType, snapshots: Dict[int, _SnapshotType]
+) -> Generator[Any, _SnapshotType, Tuple[FrozenType, Iterable[_SnapshotType]]]:
+    """
+    Frozen version of a tracked value made from the snapshots of its items (or values),
+    that are yielded, and those snapshots.
+    """
+    item_snapshots: List[_SnapshotType] = []
+    if isinstance(value, list):
+        snapshots[id(value)] = _IN_PROGRESS
+        for item in list.__iter__(value):
+            item_snapshots.append((yield item))
+        return frozenlist([item for item, _ in item_snapshots], freeze_func=__frozen_item), item_snapshots
+    if isinstance(value, set):
+        for item in set.__iter__(value):
+            item_snapshots.append((yield item))
+        return frozenzet([item for item, _ in item_snapshots], freeze_func=__frozen_item), item_snapshots
+
+    # Dicts and objects are memoized before their values are frozen, so values that reference them
+    # reference their frozen versions. Their stability is only known when they are frozen
+    frozen_value, values = __frozen_shell(value, on_update=on_update)
+    snapshots[id(value)] = (frozen_value, True)
+    value_snapshots: Dict[Any, _SnapshotType] = {}
+    for name, item in values.items():
+        value_snapshots[name] = yield item
+    if isinstance(value, dict):
+        dict.update(frozen_value, {key: item for key, (item, _) in value_snapshots.items()})
+    else:
+        for attr, (item, _) in value_snapshots.items():
+            object.__setattr__(frozen_value, attr, item)
+    return frozen_value, value_snapshots.values()
+
+
+def __frozen_item(item: FrozenType) -> FrozenType:
+    return item
+
+
+def __frozen_shell(value: _Tracked, on_update: OnUpdateFuncType) -> Tuple[FrozenType, Dict[Any, Any]]:
+    """
+    Frozen version of a trackeddict or a tracked object without its values,
+    and the values that must be frozen and added to it.
+    """
+    if isinstance(value, dict):
+        return frozendict(), dict(dict.items(value))
+    attrs = {attr: attr_value for attr, attr_value in vars(value).items() if attr != '_gelidum_tracking'}
+    # The class of a tracked object is a subclass of its original class
+    frozen_class = make_frozen_class(klass=type(value).__bases__[0], attrs=tuple(attrs), on_update=on_update)
+    return frozen_class.__new__(frozen_class), attrs
+
+
+def __freeze_tracked(
+    obj: _Tracked, on_update: OnUpdateFuncType, memo: Dict[int, Any], **kwargs
+) -> Generator[Any, FrozenType, FrozenType]:
+    """
+    Freezer of the tracked values, that are frozen like the values they track.
+    """
+    if isinstance(obj, list):
+        frozen_items = []
+        for item in list.__iter__(obj):
+            frozen_items.append((yield item))
+        return frozenlist(frozen_items, freeze_func=__frozen_item)
+    if isinstance(obj, set):
+        frozen_items = []
+        for item in set.__iter__(obj):
+            frozen_items.append((yield item))
+        return frozenzet(frozen_items, freeze_func=__frozen_item)
+    frozen_obj, values = __frozen_shell(obj, on_update=on_update)
+    memo[id(obj)] = frozen_obj
+    frozen_values = {}
+    for name, value in values.items():
+        frozen_values[name] = yield value
+    if isinstance(obj, dict):
+        dict.update(frozen_obj, frozen_values)
+    else:
+        for attr, value in frozen_values.items():
+            object.__setattr__(frozen_obj, attr, value)
+    return frozen_obj
+
+
+register_freezer(_Tracked, __freeze_tracked)
@@ -0,0 +1,58 @@
+import array
+import copy
+import pickle
+import unittest
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozenarray
+
+
+class TestFrozenarray(unittest.TestCase):  # noqa
+    def test_freeze_array(self) -> None:
+        numbers = array.array('d', [1.0, 2.5])
+
+        frozen_numbers = freeze(numbers)
+
+        self.assertIsInstance(frozen_numbers, frozenarray)
+        self.assertIsInstance(frozen_numbers, array.array)
+        self.assertTrue(isfrozen(frozen_numbers))
+        self.assertEqual('d', frozen_numbers.typecode)
+        self.assertEqual(numbers, frozen_numbers)
+        self.assertEqual(frozenarray('d', [2.5]), frozen_numbers[1:])
+        self.assertIsInstance(frozen_numbers[1:], frozenarray)
+        self.assertEqual('array', frozen_numbers.get_gelidum_hot_class_name())
+
+    def test_hash(self) -> None:
+        self.assertEqual(hash(frozenarray('i', [1, 2])), hash(frozenarray('l', [1, 2])))
+        self.assertEqual(hash((1, 2)), hash(frozenarray('i', [1, 2])))
+
+    def test_copy_and_pickle(self) -> None:
+        frozen_numbers = frozenarray('i', [1, 2])
+
+        self.assertIs(frozen_numbers, copy.copy(frozen_numbers))
+        self.assertIs(frozen_numbers, copy.deepcopy(frozen_numbers))
+        self.assertEqual(frozen_numbers, pickle.loads(pickle.dumps(frozen_numbers)))
+        self.assertIsInstance(pickle.loads(pickle.dumps(frozen_numbers)), frozenarray)
+
+    def test_immutability(self) -> None:
+        frozen_numbers = frozenarray('i', [1, 2])
+
+        modifications = (
+            lambda: frozen_numbers.__setitem__(0, 3),
+            lambda: frozen_numbers.__delitem__(0),
+            lambda: frozen_numbers.__iadd__(array.array('i', [3])),
+            lambda: frozen_numbers.append(3),
+            lambda: frozen_numbers.extend([3]),
+            lambda: frozen_numbers.insert(0, 3),
+            lambda: frozen_numbers.pop(),
+            lambda: frozen_numbers.remove(1),
+            lambda: frozen_numbers.reverse(),
+            lambda: frozen_numbers.byteswap(),
+            lambda: frozen_numbers.frombytes(b'0000'),
+            lambda: frozen_numbers.fromlist([3]),
+        )
+        for modification in modifications:
+            with self.assertRaises(FrozenException) as context:
+                modification()
+            self.assertEqual("'frozenarray' object is immutable", str(context.exception))
+        self.assertEqual(array.array('i', [1, 2]), frozen_numbers)
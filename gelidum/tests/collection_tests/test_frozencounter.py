@@ -0,0 +1,47 @@
+import unittest
+from collections import Counter
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozencounter
+
+
+class TestFrozencounter(unittest.TestCase):  # noqa
+    def test_freeze_counter(self) -> None:
+        counter = Counter('abracadabra')
+
+        frozen_counter = freeze(counter)
+
+        self.assertIsInstance(frozen_counter, frozencounter)
+        self.assertTrue(isfrozen(frozen_counter))
+        self.assertEqual(counter, frozen_counter)
+        self.assertEqual('Counter', frozen_counter.get_gelidum_hot_class_name())
+
+    def test_counter_methods(self) -> None:
+        frozen_counter = frozencounter(Counter('abracadabra'))
+
+        self.assertEqual(5, frozen_counter['a'])
+        self.assertEqual(0, frozen_counter['z'])
+        self.assertNotIn('z', frozen_counter)
+        self.assertEqual(11, frozen_counter.total())
+        self.assertEqual([('a', 5), ('b', 2)], frozen_counter.most_common(2))
+        self.assertEqual(sorted('abracadabra'), sorted(frozen_counter.elements()))
+
+    def test_arithmetic_operations(self) -> None:
+        frozen_counter = frozencounter(a=3, b=1)
+        counter = Counter(a=1, b=2)
+
+        self.assertEqual(frozencounter(a=4, b=3), frozen_counter + counter)
+        self.assertEqual(frozencounter(a=2), frozen_counter - counter)
+        self.assertEqual(frozencounter(a=3, b=2), frozen_counter | counter)
+        self.assertEqual(frozencounter(a=1, b=1), frozen_counter & frozencounter(counter))
+        self.assertIsInstance(frozen_counter + counter, frozencounter)
+
+    def test_immutability(self) -> None:
+        frozen_counter = frozencounter(a=1)
+
+        with self.assertRaises(FrozenException) as context_subtract:
+            frozen_counter.subtract(a=1)
+        with self.assertRaises(FrozenException):
+            frozen_counter['a'] = 2
+
+        self.assertEqual("'frozencounter' object is immutable", str(context_subtract.exception))
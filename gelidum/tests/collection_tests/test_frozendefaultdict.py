@@ -0,0 +1,49 @@
+import pickle
+import unittest
+from collections import defaultdict
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozendefaultdict, frozenlist
+
+
+class TestFrozendefaultdict(unittest.TestCase):  # noqa
+    def test_freeze_defaultdict(self) -> None:
+        default_dict = defaultdict(list, one=[1])
+
+        frozen_default_dict = freeze(default_dict)
+
+        self.assertIsInstance(frozen_default_dict, frozendefaultdict)
+        self.assertTrue(isfrozen(frozen_default_dict))
+        self.assertIs(list, frozen_default_dict.default_factory)
+        self.assertEqual(frozenlist([1]), frozen_default_dict['one'])
+        self.assertEqual('defaultdict', frozen_default_dict.get_gelidum_hot_class_name())
+
+    def test_missing_keys_are_not_stored(self) -> None:
+        frozen_default_dict = frozendefaultdict(list, {'one': 1})
+
+        self.assertEqual(frozenlist(), frozen_default_dict['two'])
+        self.assertTrue(isfrozen(frozen_default_dict['two']))
+        self.assertNotIn('two', frozen_default_dict)
+        with self.assertRaises(KeyError):
+            frozendefaultdict(None, {'one': 1})['two']
+
+    def test_immutability(self) -> None:
+        frozen_default_dict = frozendefaultdict(list, {'one': 1})
+
+        with self.assertRaises(FrozenException) as context:
+            frozen_default_dict['two'] = 2
+        with self.assertRaises(FrozenException):
+            frozen_default_dict.default_factory = dict
+
+        self.assertEqual("'frozendefaultdict' object is immutable", str(context.exception))
+
+    def test_pickle(self) -> None:
+        frozen_default_dict = frozendefaultdict(list, {'one': [1]})
+        hash(frozen_default_dict)
+
+        unpickled_frozen_default_dict = pickle.loads(pickle.dumps(frozen_default_dict))
+
+        self.assertIs(frozendefaultdict, type(unpickled_frozen_default_dict))
+        self.assertEqual(frozen_default_dict, unpickled_frozen_default_dict)
+        self.assertIs(list, unpickled_frozen_default_dict.default_factory)
+        self.assertNotIn('_gelidum_hash', unpickled_frozen_default_dict.__dict__)
@@ -0,0 +1,36 @@
+import pickle
+import unittest
+from collections import deque
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozendeque, frozenlist
+
+
+class TestFrozendeque(unittest.TestCase):  # noqa
+    def test_freeze_deque(self) -> None:
+        frozen_deque = freeze(deque([[1], 2, 3], maxlen=3))
+
+        self.assertIsInstance(frozen_deque, frozendeque)
+        self.assertTrue(isfrozen(frozen_deque))
+        self.assertEqual(3, frozen_deque.maxlen)
+        self.assertEqual(frozenlist([1]), frozen_deque[0])
+        self.assertEqual((frozenlist([1]), 2, 3), frozen_deque)
+        self.assertEqual('deque', frozen_deque.get_gelidum_hot_class_name())
+        self.assertEqual('frozendeque([(1,), 2, 3], maxlen=3)', repr(frozen_deque))
+
+    def test_maxlen(self) -> None:
+        frozen_deque = frozendeque([1, 2, 3], maxlen=2)
+
+        self.assertEqual((2, 3), frozen_deque)
+        self.assertIsNone(frozendeque([1]).maxlen)
+        self.assertEqual(2, pickle.loads(pickle.dumps(frozen_deque)).maxlen)
+
+    def test_immutability(self) -> None:
+        frozen_deque = frozendeque([1, 2])
+
+        for method, args in (('appendleft', (0,)), ('extendleft', ([0],)), ('popleft', ()), ('rotate', ())):
+            with self.assertRaises(FrozenException) as context:
+                getattr(frozen_deque, method)(*args)
+            self.assertEqual("'frozendeque' object is immutable", str(context.exception))
+        with self.assertRaises(FrozenException):
+            frozen_deque.maxlen = 3
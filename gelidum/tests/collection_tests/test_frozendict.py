@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from collections.abc import KeysView, ValuesView
 from typing import Any, Tuple
@@ -142,6 +143,19 @@ class TestFrozendict(unittest.TestCase):  # noqa
         self.assertTrue(isinstance(frozen_dict['three'], FrozenBase))
         self.assertEqual(3, frozen_dict['three'].value)
 
+    def test_construction_with_shared_values(self) -> None:
+        class Dummy:
+            def __init__(self, value: Any) -> None:
+                self.value = value
+
+        dummy = Dummy(1)
+        values = {'dummy': dummy}
+        frozen_dict = frozendict({'one': dummy, 'two': values, 'three': values})
+
+        self.assertIsNot(dummy, frozen_dict['one'])
+        self.assertIs(frozen_dict['one'], frozen_dict['two']['dummy'])
+        self.assertIs(frozen_dict['two'], frozen_dict['three'])
+
     def test_add(self) -> None:
         class Dummy:
             def __init__(self, value: Any) -> None:
@@ -199,6 +213,38 @@ class TestFrozendict(unittest.TestCase):  # noqa
 
         self.assertTrue(isinstance(hash(frozen_dict), int))
 
+    def test_hash_does_not_depend_on_order(self) -> None:
+        frozen_dict1 = frozendict({'one': 1, 'two': (2, 2), 'three': frozendict(a=1)})
+        frozen_dict2 = frozendict({'three': frozendict(a=1), 'two': (2, 2), 'one': 1})
+
+        self.assertEqual(frozen_dict1, frozen_dict2)
+        self.assertEqual(hash(frozen_dict1), hash(frozen_dict2))
+        self.assertEqual('value', {frozen_dict1: 'value'}[frozen_dict2])
+
+    def test_hash_is_computed_once(self) -> None:
+        class HashCounter(object):
+            calls = 0
+
+            def __hash__(self) -> int:
+                HashCounter.calls += 1
+                return 1
+
+        frozen_dict = frozendict({'one': HashCounter()}, freeze_func=lambda value: value)
+
+        self.assertEqual(hash(frozen_dict), hash(frozen_dict))
+        self.assertEqual(1, HashCounter.calls)
+
+    def test_pickle_does_not_keep_the_hash(self) -> None:
+        frozen_dict = frozendict({'one': 1, 'two': [2]})
+        hash(frozen_dict)
+
+        unpickled_frozen_dict = pickle.loads(pickle.dumps(frozen_dict))
+
+        self.assertIs(frozendict, type(unpickled_frozen_dict))
+        self.assertEqual(frozen_dict, unpickled_frozen_dict)
+        self.assertNotIn('_gelidum_hash', unpickled_frozen_dict.__dict__)
+        self.assertNotIn('_gelidum_hash', str(pickle.dumps(frozen_dict)))
+
     def test_setitem(self) -> None:
         class Dummy:
             def __init__(self, value: Any) -> None:
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from typing import Any, Iterator
 
@@ -59,6 +60,18 @@ class TestFrozenlist(unittest.TestCase):  # noqa
         self.assertTrue(isinstance(frozen_list[2], FrozenBase))
         self.assertEqual(3, frozen_list[2].value)
 
+    def test_construction_with_shared_items(self) -> None:
+        class Dummy:
+            def __init__(self, value: Any) -> None:
+                self.value = value
+
+        dummy = Dummy(1)
+        frozen_list = frozenlist([dummy, [dummy], dummy])
+
+        self.assertIsNot(dummy, frozen_list[0])
+        self.assertIs(frozen_list[0], frozen_list[1][0])
+        self.assertIs(frozen_list[0], frozen_list[2])
+
     def test_setattr_exception(self) -> None:
         frozen_list = frozenlist([1, 2, 3])
 
@@ -106,6 +119,36 @@ class TestFrozenlist(unittest.TestCase):  # noqa
 
         self.assertTrue(isinstance(hash(frozen_list), int))
 
+    def test_hash_is_the_tuple_hash(self) -> None:
+        frozen_list = frozenlist([1, 2, [3, 4]])
+
+        self.assertEqual(hash((1, 2, (3, 4))), hash(frozen_list))
+        self.assertEqual('value', {(1, 2, (3, 4)): 'value'}[frozen_list])
+
+    def test_hash_is_computed_once(self) -> None:
+        class HashCounter(object):
+            calls = 0
+
+            def __hash__(self) -> int:
+                HashCounter.calls += 1
+                return 1
+
+        frozen_list = frozenlist([HashCounter()], freeze_func=lambda item: item)
+
+        self.assertEqual(hash(frozen_list), hash(frozen_list))
+        self.assertEqual(1, HashCounter.calls)
+
+    def test_pickle_does_not_keep_the_hash(self) -> None:
+        frozen_list = frozenlist([1, [2, 3]])
+        hash(frozen_list)
+
+        unpickled_frozen_list = pickle.loads(pickle.dumps(frozen_list))
+
+        self.assertIs(frozenlist, type(unpickled_frozen_list))
+        self.assertEqual(frozen_list, unpickled_frozen_list)
+        self.assertNotIn('_gelidum_hash', unpickled_frozen_list.__dict__)
+        self.assertNotIn('_gelidum_hash', str(pickle.dumps(frozen_list)))
+
     def test_mul(self) -> None:
         frozen_list = frozenlist([1, 2, 3])
         frozen_list2 = frozen_list * 2
@@ -0,0 +1,179 @@
+import pickle
+import random
+import unittest
+from typing import Any
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozendict, frozenlist, frozenmap
+from gelidum.frozen import FrozenBase
+
+
+class CollidingKey(object):
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return self.value % 3
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+
+class TestFrozenmap(unittest.TestCase):  # noqa
+    def test_empty_construction(self) -> None:
+        frozen_map = frozenmap()
+
+        self.assertEqual(0, len(frozen_map))
+        self.assertEqual({}, dict(frozen_map))
+
+    def test_construction_from_dict_and_kwargs(self) -> None:
+        class Dummy:
+            def __init__(self, value: Any) -> None:
+                self.value = value
+
+        frozen_map = frozenmap({'one': 1, 'two': [2]}, three=Dummy(3))
+
+        self.assertTrue(isinstance(frozen_map, FrozenBase))
+        self.assertEqual(3, len(frozen_map))
+        self.assertEqual(1, frozen_map['one'])
+        self.assertEqual(frozenlist([2]), frozen_map['two'])
+        self.assertTrue(isinstance(frozen_map['three'], FrozenBase))
+        self.assertEqual(3, frozen_map['three'].value)
+
+    def test_construction_from_list_of_pairs(self) -> None:
+        frozen_map = frozenmap([('one', 1), ('two', 2), ('one', 3)])
+
+        self.assertEqual(2, len(frozen_map))
+        self.assertEqual(3, frozen_map['one'])
+        self.assertEqual(2, frozen_map['two'])
+
+    def test_getitem(self) -> None:
+        frozen_map = frozenmap({'one': 1, 'none': None})
+
+        self.assertEqual(1, frozen_map['one'])
+        self.assertIsNone(frozen_map['none'])
+        self.assertTrue('none' in frozen_map)
+        self.assertFalse('two' in frozen_map)
+        self.assertFalse([] in frozen_map)
+        self.assertEqual(2, frozen_map.get('two', 2))
+        with self.assertRaises(KeyError):
+            frozen_map['two']  # noqa
+
+    def test_set(self) -> None:
+        frozen_map = frozenmap({'one': 1})
+
+        new_frozen_map = frozen_map.set('two', [2]).set('one', 'uno')
+
+        self.assertEqual({'one': 1}, dict(frozen_map))
+        self.assertEqual({'one': 'uno', 'two': frozenlist([2])}, dict(new_frozen_map))
+        self.assertTrue(isfrozen(new_frozen_map['two']))
+        self.assertIs(frozen_map, frozen_map.set('one', 1))
+
+    def test_delete(self) -> None:
+        frozen_map = frozenmap({'one': 1, 'two': 2})
+
+        new_frozen_map = frozen_map.delete('one')
+
+        self.assertEqual({'one': 1, 'two': 2}, dict(frozen_map))
+        self.assertEqual({'two': 2}, dict(new_frozen_map))
+        self.assertEqual(0, len(new_frozen_map.delete('two')))
+        with self.assertRaises(KeyError):
+            frozen_map.delete('three')
+
+    def test_update(self) -> None:
+        frozen_map = frozenmap({'one': 1, 'two': 2})
+
+        new_frozen_map = frozen_map.update({'two': 'dos'}, three={'a': 3})
+
+        self.assertEqual({'one': 1, 'two': 2}, dict(frozen_map))
+        self.assertEqual({'one': 1, 'two': 'dos', 'three': frozendict(a=3)}, dict(new_frozen_map))
+        self.assertIs(frozen_map, frozen_map.update(one=1))
+
+    def test_add_or_and_sub(self) -> None:
+        frozen_map = frozenmap({'one': 1, 'two': 2})
+
+        self.assertEqual(frozenmap(one=1, two=2, three=3), frozen_map + {'three': 3})
+        self.assertEqual(frozenmap(one=1, two=22), frozen_map | frozendict(two=22))
+        self.assertEqual(frozenmap(two=2), frozen_map - {'one': None, 'four': None})
+
+    def test_updates_share_structure(self) -> None:
+        frozen_map = frozenmap({key: key for key in range(10_000)})
+
+        new_frozen_map = frozen_map.set(10_000, 10_000)
+
+        root = frozen_map._frozenmap__root
+        new_root = new_frozen_map._frozenmap__root
+        shared_children = [child for child in new_root.children if any(child is old for old in root.children)]
+        self.assertEqual(len(root.children) - 1, len(shared_children))
+
+    def test_colliding_keys(self) -> None:
+        keys = [CollidingKey(value) for value in range(30)]
+        frozen_map = frozenmap()
+        for key in keys:
+            frozen_map = frozen_map.set(key, key.value)
+
+        self.assertEqual(30, len(frozen_map))
+        self.assertEqual(list(range(30)), sorted(frozen_map.values()))
+        for key in keys:
+            frozen_map = frozen_map.delete(key)
+            self.assertFalse(key in frozen_map)
+        self.assertEqual(0, len(frozen_map))
+
+    def test_random_updates_like_dict(self) -> None:
+        rng = random.Random(0)
+        frozen_map = frozenmap()
+        expected_dict = {}
+        for _ in range(5_000):
+            key = rng.randrange(-1_000, 1_000)
+            if key in expected_dict and rng.random() < 0.4:
+                frozen_map = frozen_map.delete(key)
+                del expected_dict[key]
+            else:
+                frozen_map = frozen_map.set(key, rng.random())
+                expected_dict[key] = frozen_map[key]
+
+        self.assertEqual(len(expected_dict), len(frozen_map))
+        self.assertEqual(expected_dict, dict(frozen_map.items()))
+
+    def test_interoperability_with_frozendict(self) -> None:
+        frozen_map = frozenmap({'one': 1, 'two': [2]})
+        frozen_dict = frozendict(frozen_map)
+
+        self.assertEqual(frozen_dict, frozen_map)
+        self.assertEqual(frozen_map, frozen_dict)
+        self.assertEqual(hash(frozen_dict), hash(frozen_map))
+        self.assertIs(frozen_map['two'], frozen_dict['two'])
+        self.assertEqual(frozen_map, frozenmap(frozen_dict))
+
+    def test_freeze(self) -> None:
+        frozen_map = frozenmap({'one': 1})
+
+        self.assertIs(frozen_map, freeze(frozen_map))
+        self.assertIs(frozen_map, freeze([frozen_map])[0])
+
+    def test_hash(self) -> None:
+        frozen_map1 = frozenmap({'one': 1, 'two': 2})
+        frozen_map2 = frozenmap({'two': 2}).set('one', 1)
+
+        self.assertEqual(frozen_map1, frozen_map2)
+        self.assertEqual(hash(frozen_map1), hash(frozen_map2))
+        self.assertEqual('value', {frozen_map1: 'value'}[frozen_map2])
+
+    def test_pickle(self) -> None:
+        frozen_map = frozenmap({'one': 1, 'two': (2, 2)})
+
+        self.assertEqual(frozen_map, pickle.loads(pickle.dumps(frozen_map)))
+
+    def test_setitem_and_del(self) -> None:
+        frozen_map = frozenmap({'one': 1})
+
+        with self.assertRaises(FrozenException) as context_setitem:
+            frozen_map['four'] = 4
+        with self.assertRaises(FrozenException) as context_del:
+            del frozen_map['one']
+        with self.assertRaises(FrozenException) as context_setattr:
+            frozen_map.attr = 1
+
+        self.assertEqual("'frozenmap' object is immutable", str(context_setitem.exception))
+        self.assertEqual("'frozenmap' object is immutable", str(context_del.exception))
+        self.assertEqual("'frozenmap' object is immutable", str(context_setattr.exception))
@@ -0,0 +1,42 @@
+import unittest
+from collections import OrderedDict
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozendict, frozenlist, frozenordereddict
+
+
+class TestFrozenordereddict(unittest.TestCase):  # noqa
+    def test_freeze_ordered_dict(self) -> None:
+        ordered_dict = OrderedDict([('two', [2]), ('one', 1)])
+
+        frozen_ordered_dict = freeze(ordered_dict)
+
+        self.assertIsInstance(frozen_ordered_dict, frozenordereddict)
+        self.assertTrue(isfrozen(frozen_ordered_dict))
+        self.assertEqual(['two', 'one'], list(frozen_ordered_dict))
+        self.assertEqual(frozenlist([2]), frozen_ordered_dict['two'])
+        self.assertEqual(['two', 'one'], list(reversed(list(reversed(frozen_ordered_dict)))))
+        self.assertEqual(['one', 'two'], list(reversed(frozen_ordered_dict)))
+        self.assertEqual('OrderedDict', frozen_ordered_dict.get_gelidum_hot_class_name())
+        self.assertEqual("frozenordereddict([('two', (2,)), ('one', 1)])", repr(frozen_ordered_dict))
+
+    def test_equality_depends_on_order_with_ordered_dicts(self) -> None:
+        frozen_ordered_dict = frozenordereddict([('two', 2), ('one', 1)])
+
+        self.assertEqual(frozen_ordered_dict, OrderedDict([('two', 2), ('one', 1)]))
+        self.assertNotEqual(frozen_ordered_dict, OrderedDict([('one', 1), ('two', 2)]))
+        self.assertNotEqual(frozenordereddict([('one', 1), ('two', 2)]), frozen_ordered_dict)
+        self.assertEqual({'one': 1, 'two': 2}, frozen_ordered_dict)
+        self.assertEqual(frozendict(one=1, two=2), frozen_ordered_dict)
+        self.assertEqual(hash(frozendict(one=1, two=2)), hash(frozen_ordered_dict))
+
+    def test_immutability(self) -> None:
+        frozen_ordered_dict = frozenordereddict([('one', 1)])
+
+        with self.assertRaises(FrozenException) as context_move_to_end:
+            frozen_ordered_dict.move_to_end('one')
+        with self.assertRaises(FrozenException) as context_setitem:
+            frozen_ordered_dict['two'] = 2
+
+        self.assertEqual("'frozenordereddict' object is immutable", str(context_move_to_end.exception))
+        self.assertEqual("'frozenordereddict' object is immutable", str(context_setitem.exception))
@@ -0,0 +1,149 @@
+import pickle
+import random
+import unittest
+from typing import Any
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozendict, frozenlist, frozenvector
+from gelidum.frozen import FrozenBase
+
+
+class TestFrozenvector(unittest.TestCase):  # noqa
+    def test_empty_construction(self) -> None:
+        frozen_vector = frozenvector()
+
+        self.assertEqual(0, len(frozen_vector))
+        self.assertEqual([], list(frozen_vector))
+
+    def test_construction(self) -> None:
+        class Dummy:
+            def __init__(self, value: Any) -> None:
+                self.value = value
+
+        frozen_vector = frozenvector([1, [2], {'three': 3}, Dummy(4)])
+
+        self.assertTrue(isinstance(frozen_vector, FrozenBase))
+        self.assertEqual(4, len(frozen_vector))
+        self.assertEqual(1, frozen_vector[0])
+        self.assertEqual(frozenlist([2]), frozen_vector[1])
+        self.assertEqual(frozendict(three=3), frozen_vector[2])
+        self.assertTrue(isinstance(frozen_vector[3], FrozenBase))
+        self.assertEqual(4, frozen_vector[-1].value)
+
+    def test_construction_of_big_vector(self) -> None:
+        items = list(range(100_000))
+
+        frozen_vector = frozenvector(items)
+
+        self.assertEqual(items, list(frozen_vector))
+        self.assertEqual(31_337, frozen_vector[31_337])
+        with self.assertRaises(IndexError) as context:
+            frozen_vector[100_000]  # noqa
+        self.assertEqual('frozenvector index out of range', str(context.exception))
+
+    def test_append(self) -> None:
+        frozen_vector = frozenvector()
+        frozen_vectors = []
+        for item in range(2_000):
+            frozen_vectors.append(frozen_vector)
+            frozen_vector = frozen_vector.append(item)
+
+        self.assertEqual(list(range(2_000)), list(frozen_vector))
+        for size, old_frozen_vector in enumerate(frozen_vectors):
+            self.assertEqual(list(range(size)), list(old_frozen_vector))
+        self.assertTrue(isfrozen(frozen_vector.append([1])[-1]))
+
+    def test_set(self) -> None:
+        frozen_vector = frozenvector(range(100))
+
+        new_frozen_vector = frozen_vector.set(5, 'five').set(-1, [99])
+
+        self.assertEqual(list(range(100)), list(frozen_vector))
+        self.assertEqual('five', new_frozen_vector[5])
+        self.assertEqual(frozenlist([99]), new_frozen_vector[99])
+        with self.assertRaises(IndexError):
+            frozen_vector.set(100, 100)
+
+    def test_pop(self) -> None:
+        frozen_vector = frozenvector(range(1_100))
+
+        new_frozen_vector = frozen_vector
+        for _ in range(1_090):
+            new_frozen_vector = new_frozen_vector.pop()
+
+        self.assertEqual(list(range(1_100)), list(frozen_vector))
+        self.assertEqual(list(range(10)), list(new_frozen_vector))
+        with self.assertRaises(IndexError) as context:
+            frozenvector().pop()
+        self.assertEqual('pop from empty frozenvector', str(context.exception))
+
+    def test_slice(self) -> None:
+        frozen_vector = frozenvector(range(100))
+
+        frozen_slice = frozen_vector[10:20]
+
+        self.assertIsInstance(frozen_slice, frozenvector)
+        self.assertEqual(list(range(10, 20)), list(frozen_slice))
+        self.assertEqual(list(range(10, 20, 3)), list(frozen_vector[10:20:3]))
+        self.assertEqual([10, 11, 'new'], list(frozen_slice[:2].append('new')))
+        self.assertEqual(list(range(100)), list(frozen_vector))
+        self.assertEqual(list(range(10, 20)), list(frozen_slice))
+
+    def test_add_and_mul(self) -> None:
+        frozen_vector = frozenvector([1, 2])
+
+        self.assertEqual(frozenvector([1, 2, 3, 4]), frozen_vector + frozenvector([3, 4]))
+        self.assertEqual(frozenvector([1, 2, 3]), frozen_vector + [3])
+        self.assertEqual(frozenvector([1, 2, 1, 2]), frozen_vector * 2)
+        self.assertEqual(frozenvector(), frozen_vector * 0)
+
+    def test_random_updates_like_list(self) -> None:
+        rng = random.Random(0)
+        frozen_vector = frozenvector()
+        expected_list = []
+        for _ in range(5_000):
+            operation = rng.random()
+            if operation < 0.6 or not expected_list:
+                item = rng.random()
+                frozen_vector = frozen_vector.append(item)
+                expected_list.append(item)
+            elif operation < 0.8:
+                index = rng.randrange(len(expected_list))
+                frozen_vector = frozen_vector.set(index, -index)
+                expected_list[index] = -index
+            else:
+                frozen_vector = frozen_vector.pop()
+                expected_list.pop()
+
+        self.assertEqual(expected_list, list(frozen_vector))
+
+    def test_equality_and_hash(self) -> None:
+        frozen_vector = frozenvector([1, 2, [3]])
+
+        self.assertEqual(frozenlist([1, 2, [3]]), frozen_vector)
+        self.assertEqual(frozen_vector, (1, 2, (3,)))
+        self.assertNotEqual(frozen_vector, [1, 2, [3]])
+        self.assertEqual(hash((1, 2, (3,))), hash(frozen_vector))
+        self.assertEqual(hash(frozen_vector), hash(frozenvector([1]).extend([2, [3]])))
+
+    def test_freeze(self) -> None:
+        frozen_vector = frozenvector([1])
+
+        self.assertIs(frozen_vector, freeze(frozen_vector))
+        self.assertIs(frozen_vector, freeze({'a': frozen_vector})['a'])
+
+    def test_pickle(self) -> None:
+        frozen_vector = frozenvector(range(1_000))
+
+        self.assertEqual(frozen_vector, pickle.loads(pickle.dumps(frozen_vector)))
+
+    def test_setitem_and_del(self) -> None:
+        frozen_vector = frozenvector([1])
+
+        with self.assertRaises(FrozenException) as context_setitem:
+            frozen_vector[0] = 4
+        with self.assertRaises(FrozenException) as context_del:
+            del frozen_vector[0]
+
+        self.assertEqual("'frozenvector' object is immutable", str(context_setitem.exception))
+        self.assertEqual("'frozenvector' object is immutable", str(context_del.exception))
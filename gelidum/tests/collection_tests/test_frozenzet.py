@@ -137,6 +137,14 @@ class TestFrozenzet(unittest.TestCase):  # noqa
 
         self.assertTrue(isinstance(hash(frozen_zet), int))
 
+    def test_hash_does_not_depend_on_order(self) -> None:
+        frozen_zet1 = frozenzet(range(100))
+        frozen_zet2 = frozenzet(reversed(range(100)))
+
+        self.assertEqual(frozen_zet1, frozen_zet2)
+        self.assertEqual(hash(frozen_zet1), hash(frozen_zet2))
+        self.assertEqual(hash(frozenset(range(100))), hash(frozen_zet1))
+
     def test_contains(self) -> None:
         frozen_zet = frozenzet([1, 2, 3])
 
@@ -0,0 +1,154 @@
+import unittest
+from typing import Any, List, Optional
+
+from gelidum import compact, freeze
+from gelidum.frozen import clear_frozen_classes
+
+
+class Node(object):
+    def __init__(self, value: int, children: List['Node'], parent: Optional['Node'] = None) -> None:
+        self.value = value
+        self.children = children
+        self.parent = parent
+
+
+class Link(object):
+    def __init__(self, value: int, next_link: Optional['Link'] = None) -> None:
+        self.value = value
+        self.next_link = next_link
+
+
+def make_chain(length: int, last_value: int = 0) -> Link:
+    chain = Link(last_value)
+    for value in range(length):
+        chain = Link(value, chain)
+    return chain
+
+
+class Account(object):
+    def __init__(self, account_id: int, balance: float) -> None:
+        self.account_id = account_id
+        self.balance = balance
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Account) and self.account_id == other.account_id
+
+    def __hash__(self) -> int:
+        return hash(self.account_id)
+
+
+class Money(object):
+    def __init__(self, amount: float) -> None:
+        self.amount = amount
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Money) and self.amount == other.amount
+
+
+class TestFrozenEquality(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_frozen_objects_with_equal_attributes_are_equal(self) -> None:
+        frozen_node = freeze(Node(1, [Node(2, [])]))
+
+        self.assertEqual(freeze(Node(1, [Node(2, [])])), frozen_node)
+        self.assertEqual(hash(freeze(Node(1, [Node(2, [])]))), hash(frozen_node))
+        self.assertNotEqual(freeze(Node(1, [Node(3, [])])), frozen_node)
+        self.assertNotEqual(freeze(Node(1, [Node(2, [])], parent=Node(0, []))), frozen_node)
+        self.assertEqual(1, len({frozen_node, freeze(Node(1, [Node(2, [])]))}))
+
+    def test_frozen_objects_are_not_equal_to_other_objects(self) -> None:
+        node = Node(1, [])
+        frozen_node = freeze(node)
+
+        self.assertNotEqual(node, frozen_node)
+        self.assertNotEqual(frozen_node, node)
+        self.assertNotEqual(frozen_node, freeze(Account(1, 1.0)))
+        self.assertNotEqual(freeze(node, on_update='warning'), frozen_node)
+
+    def test_identity_and_hash_short_circuits(self) -> None:
+        shared_children = freeze([Node(2, [])])
+        frozen_node = freeze(Node(1, shared_children))
+        other_frozen_node = freeze(Node(1, shared_children))
+        different_frozen_node = freeze(Node(5, shared_children))
+        hash(frozen_node)
+        hash(different_frozen_node)
+
+        self.assertIs(frozen_node.children, other_frozen_node.children)
+        self.assertEqual(frozen_node, frozen_node)
+        self.assertEqual(frozen_node, other_frozen_node)
+        self.assertNotEqual(frozen_node, different_frozen_node)
+
+    def test_frozen_objects_with_cycles(self) -> None:
+        def make_tree(value: int) -> Node:
+            root = Node(value, [])
+            root.children.append(Node(value + 1, [], parent=root))
+            return root
+
+        frozen_tree = freeze(make_tree(1))
+
+        self.assertIs(frozen_tree, frozen_tree.children[0].parent)
+        self.assertEqual(freeze(make_tree(1)), frozen_tree)
+        self.assertNotEqual(freeze(make_tree(2)), frozen_tree)
+        self.assertEqual(hash(freeze(make_tree(1))), hash(frozen_tree))
+
+    def test_lazy_and_compact_frozen_objects(self) -> None:
+        frozen_node = freeze(Node(1, [Node(2, [])]))
+
+        self.assertEqual(frozen_node, freeze(Node(1, [Node(2, [])]), on_freeze='lazy'))
+        self.assertEqual(freeze(Node(1, [Node(2, [])]), on_freeze='lazy'), frozen_node)
+        self.assertEqual(compact(Node(1, [])), compact(Node(1, [])))
+        self.assertEqual(hash(compact(Node(1, []))), hash(compact(Node(1, []))))
+
+    def test_frozen_objects_keep_the_equality_of_their_classes(self) -> None:
+        frozen_account = freeze(Account(1, 10.0))
+
+        self.assertEqual(freeze(Account(1, 20.0)), frozen_account)
+        self.assertEqual(Account(1, 20.0), frozen_account)
+        self.assertEqual(hash(1), hash(frozen_account))
+
+    def test_objects_frozen_inplace_keep_their_equality_and_hash(self) -> None:
+        node = Node(1, [])
+        nodes = {node}
+        node_hash = hash(node)
+
+        frozen_node = freeze(node, on_freeze='inplace')
+
+        self.assertIs(node, frozen_node)
+        self.assertIn(frozen_node, nodes)
+        self.assertEqual(node_hash, hash(frozen_node))
+        self.assertNotEqual(freeze(Node(1, [])), frozen_node)
+        self.assertNotEqual(frozen_node, freeze(Node(1, [])))
+        self.assertEqual({'value': 1, 'children': frozen_node.children, 'parent': None}, vars(frozen_node))
+
+    def test_frozen_objects_with_unhashable_attributes(self) -> None:
+        frozen_node = freeze(Node(1, [], parent=Money(1.0)))
+        other_frozen_node = freeze(Node(1, [], parent=Money(1.0)))
+        frozen_tree = freeze(Node(0, [frozen_node]))
+
+        # Objects with unhashable attributes are hashed by identity, so they are only equal to themselves
+        self.assertEqual(hash(frozen_node), hash(frozen_node))
+        self.assertEqual(frozen_node, frozen_node)
+        self.assertNotEqual(other_frozen_node, frozen_node)
+        self.assertEqual(2, len({frozen_node, other_frozen_node}))
+        self.assertNotEqual(freeze(Node(0, [other_frozen_node])), frozen_tree)
+        self.assertEqual(freeze(Node(0, [frozen_node])), frozen_tree)
+        self.assertEqual(hash(freeze(Node(0, [frozen_node]))), hash(frozen_tree))
+
+    def test_frozen_objects_hashed_by_identity(self) -> None:
+        frozen_node = freeze(Node(1, [Money(1.0)]))
+        other_frozen_node = freeze(Node(1, [Money(1.0)]))
+
+        # The unhashable values of the children are found when the objects are hashed
+        self.assertNotEqual(hash(other_frozen_node), hash(frozen_node))
+        self.assertNotEqual(other_frozen_node, frozen_node)
+        self.assertEqual(frozen_node, frozen_node)
+
+    def test_deeply_nested_frozen_objects(self) -> None:
+        frozen_chain = freeze(make_chain(5_000))
+
+        self.assertEqual(freeze(make_chain(5_000)), frozen_chain)
+        self.assertNotEqual(freeze(make_chain(5_000, last_value=1)), frozen_chain)
+        self.assertEqual(hash(freeze(make_chain(5_000))), hash(frozen_chain))
+        self.assertIn(frozen_chain, freeze({freeze(make_chain(5_000))}))
@@ -1,10 +1,17 @@
+import dataclasses
+import datetime
+import decimal
+import enum
+import fractions
+import pathlib
 import unittest
+import uuid
 
 from gelidum import (
     freeze,
     isfrozen,
 )
-from gelidum.frozen import clear_frozen_classes
+from gelidum.frozen import clear_frozen_classes, isimmutableclass
 
 
 class TestIsFrozen(unittest.TestCase):
@@ -73,3 +80,65 @@ class TestIsFrozen(unittest.TestCase):
         frozen_dummy1 = freeze(dummy1, on_freeze='copy')
 
         self.assertTrue(isfrozen(frozen_dummy1))
+
+    def test_immutable_objects(self) -> None:
+        class Color(enum.Enum):
+            RED = 'red'
+
+        class Stateless(object):
+            __slots__ = ()
+
+        immutable_objects = (
+            datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+            datetime.date(2024, 1, 1),
+            datetime.timedelta(days=1),
+            decimal.Decimal('1.5'),
+            fractions.Fraction(1, 3),
+            uuid.UUID(int=1),
+            Color.RED,
+            pathlib.PurePosixPath('/tmp'),
+            pathlib.Path('/tmp'),
+            range(3),
+            frozenset({1}),
+            Stateless(),
+        )
+        for immutable_object in immutable_objects:
+            self.assertTrue(isfrozen(immutable_object), immutable_object)
+            self.assertTrue(isimmutableclass(type(immutable_object)))
+            self.assertIs(immutable_object, freeze(immutable_object))
+
+    def test_mutable_objects_of_immutable_classes(self) -> None:
+        class Date(datetime.date):
+            pass
+
+        @dataclasses.dataclass
+        class Point(object):
+            x: int
+            y: int
+
+        @dataclasses.dataclass(frozen=True)
+        class FrozenPoint(object):
+            x: int
+            y: int
+
+        class WithSlots(object):
+            __slots__ = ('value',)
+
+        class DecimalWithSlots(decimal.Decimal):
+            __slots__ = ('unit',)
+
+        class UUIDWithSlots(uuid.UUID):
+            __slots__ = ('version_name',)
+
+        class StatelessDecimal(decimal.Decimal):
+            __slots__ = ()
+
+        self.assertFalse(isfrozen(Date(2024, 1, 1)))
+        self.assertFalse(isimmutableclass(DecimalWithSlots))
+        self.assertFalse(isimmutableclass(UUIDWithSlots))
+        self.assertTrue(isimmutableclass(StatelessDecimal))
+        self.assertFalse(isfrozen(Point(x=1, y=2)))
+        # The values of the fields of frozen dataclasses can be mutable
+        self.assertFalse(isimmutableclass(FrozenPoint))
+        self.assertFalse(isfrozen(WithSlots()))
+        self.assertFalse(isimmutableclass(bytearray))
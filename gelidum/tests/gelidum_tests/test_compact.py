@@ -0,0 +1,100 @@
+import copy
+import pickle
+import unittest
+import warnings
+from typing import List
+
+from gelidum import FrozenException, compact, freeze, isfrozen
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import clear_frozen_classes, get_frozen_classes
+
+
+class Record(object):
+    kind = 'record'
+
+    def __init__(self, record_id: int, tags: List[str]) -> None:
+        self.record_id = record_id
+        self.tags = tags
+
+    @property
+    def first_tag(self) -> str:
+        return self.tags[0]
+
+    def describe(self) -> str:
+        return f'{self.kind} {self.record_id}'
+
+
+class TestCompact(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_compact_frozen_object(self) -> None:
+        frozen_record = freeze(Record(1, ['new']))
+
+        compact_record = compact(frozen_record)
+
+        self.assertTrue(isfrozen(compact_record))
+        self.assertFalse(hasattr(compact_record, '__dict__'))
+        self.assertEqual(('record_id', 'tags'), type(compact_record).__slots__)
+        self.assertEqual(1, compact_record.record_id)
+        self.assertIs(frozen_record.tags, compact_record.tags)
+        self.assertEqual('new', compact_record.first_tag)
+        self.assertEqual('record 1', compact_record.describe())
+        self.assertEqual('Record', compact_record.get_gelidum_hot_class_name())
+        self.assertNotIsInstance(compact_record, Record)
+        with self.assertRaises(FrozenException) as context_setattr:
+            compact_record.record_id = 2
+        with self.assertRaises(FrozenException) as context_delattr:
+            del compact_record.tags
+        self.assertEqual("Can't assign attribute 'record_id' on immutable instance", str(context_setattr.exception))
+        self.assertEqual("Can't delete attribute 'tags' on immutable instance", str(context_delattr.exception))
+
+    def test_compact_mutable_object(self) -> None:
+        record = Record(1, ['new'])
+
+        compact_record = compact(record, on_update='warning')
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            compact_record.record_id = 2
+
+        self.assertEqual(frozenlist(['new']), compact_record.tags)
+        self.assertEqual(1, compact_record.record_id)
+        self.assertEqual(1, len(caught_warnings))
+        self.assertEqual(['new'], record.tags)
+
+    def test_compact_frozen_class_is_created_once(self) -> None:
+        compact_record1 = compact(Record(1, ['new']))
+        compact_record2 = compact(Record(2, ['sale']))
+        other_record = Record(3, [])
+        other_record.price = 1.5
+        compact_other_record = compact(other_record)
+
+        self.assertIs(type(compact_record1), type(compact_record2))
+        self.assertIsNot(type(compact_record1), type(compact_other_record))
+        self.assertEqual(1.5, compact_other_record.price)
+        self.assertEqual(3, len(get_frozen_classes()))
+
+    def test_compact_copy_and_pickle(self) -> None:
+        compact_record = compact(Record(1, ['new']))
+
+        unpickled_compact_record = pickle.loads(pickle.dumps(compact_record))
+
+        self.assertIs(compact_record, copy.deepcopy(compact_record))
+        self.assertEqual('record 1', copy.copy(compact_record).describe())
+        self.assertIs(type(compact_record), type(unpickled_compact_record))
+        self.assertEqual(frozenlist(['new']), unpickled_compact_record.tags)
+
+    def test_compact_other_values(self) -> None:
+        class RecordWithSlots(object):
+            __slots__ = ('record_id',)
+
+            def __init__(self, record_id: int) -> None:
+                self.record_id = record_id
+
+        frozen_dict = frozendict(one=1)
+        frozen_record_with_slots = freeze(RecordWithSlots(1))
+
+        self.assertIs(frozen_dict, compact(frozen_dict))
+        self.assertEqual(frozendict(one=1), compact({'one': 1}))
+        self.assertEqual(1, compact(1))
+        self.assertIs(frozen_record_with_slots, compact(frozen_record_with_slots))
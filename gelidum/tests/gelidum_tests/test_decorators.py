@@ -1,8 +1,19 @@
 import concurrent.futures
+import dataclasses
 import unittest
-from typing import Any, Dict, List, Tuple
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
 
-from gelidum import Freezable, FrozenException, freeze_freezable, freeze_params
+from gelidum import (
+    Freezable,
+    FrozenException,
+    freeze_freezable,
+    freeze_params,
+    immutable,
+    isfrozen,
+)
+from gelidum.collections import frozenlist
+from gelidum.decorators import frozen
 
 
 class TestDecorators(unittest.TestCase):
@@ -128,3 +139,94 @@ class TestDecorators(unittest.TestCase):
             "Can't assign attribute 'value' on immutable instance", str(context_some_named_arguments.exception)
         )
         self.assertEqual("Can't assign attribute 'value' on immutable instance", str(context_named_arguments.exception))
+
+    def test_immutable_class(self) -> None:
+        @immutable
+        class Point(object):
+            tags: List[str]
+
+            def __init__(self, x: int, y: int, tags: List[str]) -> None:
+                self.x = x
+                self.y = y
+                self.tags = tags
+
+            def move(self, x: int) -> None:
+                self.x = x
+
+        tags = ['origin']
+        point = Point(0, 0, tags)
+
+        self.assertTrue(isfrozen(point))
+        self.assertIsInstance(point, Point)
+        self.assertEqual(frozenlist(['origin']), point.tags)
+        self.assertIs(type(point), type(Point(1, 1, [])))
+        with self.assertRaises(FrozenException) as context:
+            point.move(1)
+        self.assertEqual("Can't assign attribute 'x' on immutable instance", str(context.exception))
+        self.assertEqual(['origin'], tags)
+
+    def test_immutable_class_with_parameters(self) -> None:
+        @frozen(on_update='warning', validate=True)
+        class Node(object):
+            name: str
+            parent: Optional['Node']
+
+            def __init__(self, name: Any, parent: Optional['Node'] = None) -> None:
+                self.name = name
+                self.parent = parent if parent is not None else self
+
+        node = Node('root')
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            node.name = 'leaf'
+
+        self.assertIs(node, node.parent)
+        self.assertEqual('root', node.name)
+        self.assertEqual(1, len(caught_warnings))
+        with self.assertRaises(TypeError) as context:
+            Node(['root'])
+        self.assertEqual("'list' object does not match the type hint <class 'str'>", str(context.exception))
+
+    def test_immutable_dataclass(self) -> None:
+        @immutable
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            tags: List[str]
+
+        point = Point(1, ['origin'])
+        moved_point = dataclasses.replace(point, x=2)
+
+        self.assertTrue(isfrozen(moved_point))
+        self.assertIs(type(point), type(moved_point))
+        self.assertEqual(2, moved_point.x)
+        self.assertIs(point.tags, moved_point.tags)
+        self.assertEqual(Point(1, ['origin']), point)
+
+    def test_immutable_subclass(self) -> None:
+        @immutable
+        class Point(object):
+            def __init__(self, x: int) -> None:
+                self.x = x
+
+        class ColoredPoint(Point):
+            def __init__(self, x: int, color: str) -> None:
+                super().__init__(x)
+                self.color = color
+
+        @immutable
+        class ImmutableColoredPoint(ColoredPoint):
+            pass
+
+        self.assertFalse(isfrozen(ColoredPoint(1, 'red')))
+        self.assertTrue(isfrozen(ImmutableColoredPoint(1, 'red')))
+        self.assertEqual('red', ImmutableColoredPoint(1, 'red').color)
+
+    def test_immutable_class_with_slots(self) -> None:
+        class Point(object):
+            __slots__ = ('x',)
+
+        with self.assertRaises(FrozenException) as context:
+            immutable(Point)
+
+        self.assertEqual('Objects of classes with __slots__ cannot be frozen inplace', str(context.exception))
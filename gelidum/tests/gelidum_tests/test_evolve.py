@@ -0,0 +1,219 @@
+import dataclasses
+import unittest
+from collections import defaultdict, deque, namedtuple
+from typing import Dict, List
+
+from gelidum import (
+    FrozenException,
+    assoc_in,
+    compact,
+    evolve,
+    freeze,
+    isfrozen,
+    update_in,
+)
+from gelidum.collections import (
+    frozendefaultdict,
+    frozendeque,
+    frozendict,
+    frozenlist,
+    frozenmap,
+    frozenvector,
+    frozenzet,
+)
+from gelidum.frozen import clear_frozen_classes
+
+
+class State(object):
+    def __init__(self, name: str, history: List[str], context: Dict[str, int]) -> None:
+        self.name = name
+        self.history = history
+        self.context = context
+
+
+@dataclasses.dataclass
+class Transition:
+    source: str
+    target: str
+    guards: List[str]
+
+
+class Profile(object):
+    def __init__(self, email: str, languages: List[str]) -> None:
+        self.email = email
+        self.languages = languages
+
+
+class User(object):
+    def __init__(self, name: str, profile: Profile) -> None:
+        self.name = name
+        self.profile = profile
+
+
+Position = namedtuple('Position', ['x', 'y'])
+
+
+class TestEvolve(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_evolve_frozen_object(self) -> None:
+        frozen_state = freeze(State(name='idle', history=['start'], context={'retries': 0}))
+
+        running_state = evolve(frozen_state, name='running', context={'retries': 1})
+
+        self.assertIs(type(frozen_state), type(running_state))
+        self.assertTrue(isfrozen(running_state))
+        self.assertEqual('running', running_state.name)
+        self.assertEqual(frozendict({'retries': 1}), running_state.context)
+        self.assertIs(frozen_state.history, running_state.history)
+        self.assertEqual('idle', frozen_state.name)
+        self.assertEqual(frozendict({'retries': 0}), frozen_state.context)
+        with self.assertRaises(FrozenException):
+            running_state.name = 'stopped'
+
+    def test_evolve_frozen_dataclass(self) -> None:
+        frozen_transition = freeze(Transition(source='idle', target='running', guards=['ready']))
+
+        evolved_transition = evolve(frozen_transition, target='stopped')
+
+        self.assertIs(type(frozen_transition), type(evolved_transition))
+        self.assertIsInstance(evolved_transition, Transition)
+        self.assertEqual('stopped', evolved_transition.target)
+        self.assertIs(frozen_transition.guards, evolved_transition.guards)
+        self.assertEqual(dataclasses.replace(frozen_transition, target='stopped'), evolved_transition)
+
+    def test_evolve_frozendict(self) -> None:
+        frozen_dict = frozendict({'states': ['idle'], 'current': 'idle'})
+
+        evolved_dict = evolve(frozen_dict, current='running', events={'start'})
+
+        self.assertIs(frozendict, type(evolved_dict))
+        self.assertEqual('running', evolved_dict['current'])
+        self.assertEqual(frozenzet({'start'}), evolved_dict['events'])
+        self.assertIs(frozen_dict['states'], evolved_dict['states'])
+        self.assertEqual(frozendict({'states': ['idle'], 'current': 'idle'}), frozen_dict)
+
+    def test_evolve_compact_and_lazy_frozen_objects(self) -> None:
+        compact_state = compact(State(name='idle', history=['start'], context={}))
+        lazy_state = freeze(State(name='idle', history=['start'], context={}), on_freeze='lazy')
+
+        evolved_compact_state = evolve(compact_state, name='running')
+        evolved_lazy_state = evolve(lazy_state, name='running')
+
+        self.assertIs(type(compact_state), type(evolved_compact_state))
+        self.assertEqual('running', evolved_compact_state.name)
+        self.assertIs(compact_state.history, evolved_compact_state.history)
+        self.assertEqual('running', evolved_lazy_state.name)
+        self.assertEqual(frozenlist(['start']), evolved_lazy_state.history)
+        self.assertEqual(frozenlist(['start']), lazy_state.history)
+        self.assertEqual('idle', lazy_state.name)
+
+    def test_evolve_without_changes(self) -> None:
+        frozen_state = freeze(State(name='idle', history=[], context={}))
+        frozen_dict = frozendict(current='idle')
+
+        self.assertIs(frozen_state, evolve(frozen_state))
+        self.assertIs(frozen_state, evolve(frozen_state, name='idle'))
+        self.assertIs(frozen_dict, evolve(frozen_dict, current='idle'))
+
+    def test_evolve_errors(self) -> None:
+        frozen_state = freeze(State(name='idle', history=[], context={}))
+
+        with self.assertRaises(AttributeError) as context_attribute:
+            evolve(frozen_state, nmae='running')
+        with self.assertRaises(TypeError) as context_type:
+            evolve(frozenlist([1, 2]), first=3)
+
+        self.assertEqual("'State' object has no attribute 'nmae'", str(context_attribute.exception))
+        self.assertEqual("'frozenlist' objects cannot be evolved", str(context_type.exception))
+
+
+class TestUpdateIn(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_assoc_in_copies_only_the_path(self) -> None:
+        frozen_state = freeze(
+            {
+                'users': [User('Alice', Profile('alice@example.com', ['en'])), User('Bob', Profile('bob@b.com', []))],
+                'config': {'debug': False},
+            }
+        )
+
+        new_frozen_state = assoc_in(frozen_state, ['users', 0, 'profile', 'email'], 'alicia@example.com')
+
+        self.assertIsInstance(new_frozen_state, frozendict)
+        self.assertIsInstance(new_frozen_state['users'], frozenlist)
+        self.assertEqual('alicia@example.com', new_frozen_state['users'][0].profile.email)
+        self.assertEqual('alice@example.com', frozen_state['users'][0].profile.email)
+        self.assertIs(frozen_state['config'], new_frozen_state['config'])
+        self.assertIs(frozen_state['users'][1], new_frozen_state['users'][1])
+        self.assertIs(frozen_state['users'][0].name, new_frozen_state['users'][0].name)
+        self.assertIs(frozen_state['users'][0].profile.languages, new_frozen_state['users'][0].profile.languages)
+
+    def test_update_in(self) -> None:
+        frozen_state = freeze({'counters': [0, 1], 'position': Position(x=0, y=0), 'pair': (1, 2)})
+
+        new_frozen_state = update_in(frozen_state, ['counters', -1], lambda counter: counter + 1)
+        moved_frozen_state = update_in(frozen_state, ['position', 'y'], lambda y: y + 1)
+        swapped_frozen_state = update_in(frozen_state, ['pair', 0], lambda _: [3])
+
+        self.assertEqual(frozenlist([0, 2]), new_frozen_state['counters'])
+        self.assertIs(frozen_state['position'], new_frozen_state['position'])
+        self.assertEqual(Position(x=0, y=1), moved_frozen_state['position'])
+        self.assertIs(Position, type(moved_frozen_state['position']))
+        self.assertEqual((frozenlist([3]), 2), swapped_frozen_state['pair'])
+        self.assertEqual(frozenlist([0, 1]), frozen_state['counters'])
+
+    def test_assoc_in_persistent_collections(self) -> None:
+        frozen_map = frozenmap({'vector': frozenvector([{'name': 'Alice'}])})
+
+        new_frozen_map = assoc_in(frozen_map, ['vector', 0, 'name'], 'Alicia')
+
+        self.assertEqual('Alicia', new_frozen_map['vector'][0]['name'])
+        self.assertEqual('Alice', frozen_map['vector'][0]['name'])
+
+    def test_assoc_in_adds_last_key(self) -> None:
+        frozen_state = freeze({'config': {'debug': False}})
+
+        new_frozen_state = assoc_in(frozen_state, ['config', 'levels'], ['info'])
+
+        self.assertEqual(frozendict({'debug': False, 'levels': ['info']}), new_frozen_state['config'])
+        self.assertEqual(frozendict({'debug': False}), frozen_state['config'])
+
+    def test_assoc_in_keeps_default_factory_and_maxlen(self) -> None:
+        frozen_state = freeze({'d': defaultdict(list, {'a': 1}), 'q': deque([1, 2], maxlen=2)})
+        hash(frozen_state['d'])
+
+        new_frozen_state = assoc_in(frozen_state, ['d', 'b'], 2)
+        new_frozen_state = assoc_in(new_frozen_state, ['q', 0], 3)
+
+        self.assertIsInstance(new_frozen_state['d'], frozendefaultdict)
+        self.assertIs(list, new_frozen_state['d'].default_factory)
+        self.assertEqual(frozenlist(), new_frozen_state['d']['c'])
+        self.assertNotEqual(hash(frozen_state['d']), hash(new_frozen_state['d']))
+        self.assertIsInstance(new_frozen_state['q'], frozendeque)
+        self.assertEqual(2, new_frozen_state['q'].maxlen)
+        self.assertEqual(frozenlist([3, 2]), new_frozen_state['q'])
+
+    def test_update_in_without_changes(self) -> None:
+        frozen_state = freeze({'config': {'debug': False}})
+
+        self.assertIs(frozen_state, assoc_in(frozen_state, ['config', 'debug'], False))
+        self.assertIs(frozen_state, update_in(frozen_state, ['config'], lambda config: config))
+        self.assertEqual(frozendict(debug=True), assoc_in(frozen_state, [], {'debug': True}))
+
+    def test_update_in_errors(self) -> None:
+        frozen_state = freeze({'users': [User('Alice', Profile('alice@example.com', []))], 'version': 1})
+
+        with self.assertRaises(IndexError):
+            assoc_in(frozen_state, ['users', 1, 'name'], 'Bob')
+        with self.assertRaises(KeyError):
+            update_in(frozen_state, ['groups', 0], lambda group: group)
+        with self.assertRaises(AttributeError):
+            assoc_in(frozen_state, ['users', 0, 'nmae'], 'Alicia')
+        with self.assertRaises(TypeError) as context_type:
+            assoc_in(frozen_state, ['version', 'major'], 2)
+
+        self.assertEqual("'int' objects cannot be updated", str(context_type.exception))
@@ -0,0 +1,104 @@
+import gc
+import unittest
+from typing import Dict
+
+from gelidum import FreezeCache, FrozenException, OnFreezeCopier, freeze
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import clear_frozen_classes
+
+
+class Settings(object):
+    def __init__(self, flags: Dict[str, bool]) -> None:
+        self.flags = flags
+
+
+class TestFreezeCache(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_freeze_with_cache(self) -> None:
+        cache = FreezeCache()
+        settings = Settings(flags={'debug': False})
+
+        frozen_settings = freeze(settings, on_freeze=OnFreezeCopier(cache=cache))
+
+        self.assertEqual(1, len(cache))
+        self.assertIs(frozen_settings, freeze(settings, on_freeze=OnFreezeCopier(cache=cache)))
+        self.assertIs(frozen_settings, cache.get(settings))
+        self.assertIsNone(cache.get(settings, on_update='warning'))
+        self.assertIsNot(frozen_settings, freeze(settings))
+        self.assertEqual(frozendict({'debug': False}), frozen_settings.flags)
+        with self.assertRaises(FrozenException):
+            frozen_settings.flags = {}
+
+    def test_freeze_with_cache_and_different_on_update(self) -> None:
+        on_freeze = OnFreezeCopier(cache=FreezeCache())
+        settings = Settings(flags={'debug': False})
+
+        frozen_settings = freeze(settings, on_freeze=on_freeze)
+        frozen_settings_without_exceptions = freeze(settings, on_update='nothing', on_freeze=on_freeze)
+        frozen_settings_without_exceptions.flags = {}
+
+        self.assertIsNot(frozen_settings, frozen_settings_without_exceptions)
+        self.assertIs(frozen_settings_without_exceptions, freeze(settings, on_update='nothing', on_freeze=on_freeze))
+        self.assertEqual(2, len(on_freeze.cache))
+
+    def test_invalidate(self) -> None:
+        on_freeze = OnFreezeCopier(cache=FreezeCache())
+        settings = {'flags': ['debug']}
+        frozen_settings = freeze(settings, on_freeze=on_freeze)
+
+        settings['flags'].append('trace')
+        outdated_frozen_settings = freeze(settings, on_freeze=on_freeze)
+        on_freeze.cache.invalidate(settings)
+        new_frozen_settings = freeze(settings, on_freeze=on_freeze)
+
+        self.assertIs(frozen_settings, outdated_frozen_settings)
+        self.assertEqual(frozenlist(['debug', 'trace']), new_frozen_settings['flags'])
+        self.assertIs(new_frozen_settings, freeze(settings, on_freeze=on_freeze))
+
+    def test_clear(self) -> None:
+        on_freeze = OnFreezeCopier(cache=FreezeCache())
+        settings = {'flags': ['debug']}
+        frozen_settings = freeze(settings, on_freeze=on_freeze)
+
+        on_freeze.cache.clear()
+
+        self.assertEqual(0, len(on_freeze.cache))
+        self.assertIsNot(frozen_settings, freeze(settings, on_freeze=on_freeze))
+
+    def test_least_recently_used_objects_are_evicted(self) -> None:
+        on_freeze = OnFreezeCopier(cache=FreezeCache(maxsize=2))
+        settings = [{'index': index} for index in range(3)]
+        frozen_settings = [freeze(settings[index], on_freeze=on_freeze) for index in range(2)]
+
+        freeze(settings[0], on_freeze=on_freeze)
+        freeze(settings[2], on_freeze=on_freeze)
+
+        self.assertEqual(2, len(on_freeze.cache))
+        self.assertIs(frozen_settings[0], freeze(settings[0], on_freeze=on_freeze))
+        self.assertIsNot(frozen_settings[1], freeze(settings[1], on_freeze=on_freeze))
+
+    def test_garbage_collected_objects_are_removed(self) -> None:
+        on_freeze = OnFreezeCopier(cache=FreezeCache())
+        settings = Settings(flags={'debug': False})
+        freeze(settings, on_freeze=on_freeze)
+
+        del settings
+        gc.collect()
+
+        self.assertEqual(0, len(on_freeze.cache))
+
+    def test_frozen_and_builtin_values_are_not_cached(self) -> None:
+        on_freeze = OnFreezeCopier(cache=FreezeCache())
+
+        freeze(1, on_freeze=on_freeze)
+        freeze(frozendict(one=1), on_freeze=on_freeze)
+
+        self.assertEqual(0, len(on_freeze.cache))
+
+    def test_invalid_maxsize(self) -> None:
+        with self.assertRaises(ValueError) as context:
+            FreezeCache(maxsize=0)
+
+        self.assertEqual('maxsize must be greater than 0', str(context.exception))
@@ -1,8 +1,12 @@
+import dataclasses
+import pickle
 import unittest
-from typing import List
+import warnings
+from typing import List, Optional
 
-from gelidum import FrozenException, freeze
-from gelidum.frozen import clear_frozen_classes
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozenlist
+from gelidum.frozen import clear_frozen_classes, get_frozen_classes
 
 
 class TestFreezeDataclasses(unittest.TestCase):
@@ -82,3 +86,175 @@ class TestFreezeDataclasses(unittest.TestCase):
         self.assertEqual("Can't assign attribute 'attr2' on immutable instance", str(context_inplace.exception))
         self.assertEqual(id(dummy_database), id(frozen_dummy_inplace))
         self.assertNotEqual(id(dummy_database), id(frozen_dummy_on_freeze_copy))
+
+    def test_freeze_dataclass_to_frozen_dataclass_with_slots(self) -> None:
+        @dataclasses.dataclass
+        class Item:
+            name: str
+
+            def describe(self) -> str:
+                return f'item {self.name}'
+
+        @dataclasses.dataclass
+        class Product(Item):
+            tags: List[str] = dataclasses.field(default_factory=list)
+            price: float = 1.0
+
+            @property
+            def first_tag(self) -> str:
+                return self.tags[0]
+
+            def with_discount(self, discount: float) -> float:
+                return self.price * (1 - discount)
+
+            def describe(self) -> str:
+                return f'{super().describe()} of {self.price}'
+
+        product = Product(name='book', tags=['paper'], price=10.0)
+        frozen_product = freeze(product)
+
+        self.assertTrue(isfrozen(frozen_product))
+        self.assertTrue(dataclasses.is_dataclass(frozen_product))
+        self.assertTrue(frozen_product.__dataclass_params__.frozen)
+        self.assertEqual(('name', 'tags', 'price'), type(frozen_product).__slots__)
+        self.assertIsInstance(frozen_product, Product)
+        self.assertIsInstance(frozen_product, Item)
+        # The fields are stored in the slots, not in the __dict__
+        self.assertEqual({}, frozen_product.__dict__)
+        self.assertEqual(['name', 'tags', 'price'], [field.name for field in dataclasses.fields(frozen_product)])
+        self.assertEqual(frozenlist(['paper']), frozen_product.tags)
+        self.assertEqual('paper', frozen_product.first_tag)
+        self.assertEqual(9.0, frozen_product.with_discount(0.1))
+        self.assertEqual('item book of 10.0', frozen_product.describe())
+        self.assertEqual('Product', frozen_product.get_gelidum_hot_class_name())
+        self.assertEqual(['paper'], product.tags)
+
+    def test_frozen_dataclass_is_created_once(self) -> None:
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            y: int
+
+        frozen_point1 = freeze(Point(1, 2))
+        frozen_point2 = freeze(Point(3, 4))
+
+        self.assertIs(type(frozen_point1), type(frozen_point2))
+        self.assertEqual({type(frozen_point1)}, get_frozen_classes())
+
+    def test_frozen_dataclass_eq_repr_and_hash(self) -> None:
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            y: int
+            label: str = dataclasses.field(default='', compare=False, repr=False)
+
+        frozen_point = freeze(Point(1, 2, 'a'))
+
+        self.assertEqual(freeze(Point(1, 2, 'b')), frozen_point)
+        self.assertNotEqual(freeze(Point(2, 1)), frozen_point)
+        self.assertEqual(hash(freeze(Point(1, 2, 'b'))), hash(frozen_point))
+        self.assertEqual(f'{type(frozen_point).__qualname__}(x=1, y=2)', repr(frozen_point))
+
+    def test_frozen_dataclass_replace(self) -> None:
+        @dataclasses.dataclass
+        class Product:
+            name: str
+            tags: List[str]
+
+        frozen_product = freeze(Product(name='book', tags=['paper']))
+
+        replaced_frozen_product = dataclasses.replace(frozen_product, tags=['paper', 'new'])
+
+        self.assertIs(type(frozen_product), type(replaced_frozen_product))
+        self.assertEqual('book', replaced_frozen_product.name)
+        self.assertEqual(frozenlist(['paper', 'new']), replaced_frozen_product.tags)
+        self.assertEqual(frozenlist(['paper']), frozen_product.tags)
+        with self.assertRaises(FrozenException):
+            replaced_frozen_product.name = 'pen'
+
+    def test_frozen_dataclass_update_policy(self) -> None:
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        frozen_point = freeze(Point(1), on_update='warning')
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            frozen_point.x = 2
+            del frozen_point.x
+
+        self.assertEqual(
+            ["Can't assign attribute 'x' on immutable instance", "Can't delete attribute 'x' on immutable instance"],
+            [str(caught_warning.message) for caught_warning in caught_warnings],
+        )
+        self.assertEqual(1, frozen_point.x)
+
+    def test_frozen_dataclass_with_cycles_and_pickle(self) -> None:
+        @dataclasses.dataclass
+        class Node:
+            name: str
+            parent: Optional['Node'] = None
+
+        node = Node('root')
+        node.parent = node
+
+        frozen_node = freeze(node)
+        unpickled_frozen_node = pickle.loads(pickle.dumps(freeze(Node('leaf'))))
+
+        self.assertIs(frozen_node, frozen_node.parent)
+        self.assertEqual('leaf', unpickled_frozen_node.name)
+        self.assertIsNone(unpickled_frozen_node.parent)
+
+    def test_freeze_dataclasses_not_converted(self) -> None:
+        @dataclasses.dataclass
+        class WithoutInit:
+            value: int
+            double: int = dataclasses.field(init=False)
+
+            def __post_init__(self) -> None:
+                self.double = self.value * 2
+
+        @dataclasses.dataclass
+        class WithExtraAttributes:
+            value: int
+
+        with_extra_attributes = WithExtraAttributes(1)
+        with_extra_attributes.extra = 2
+
+        frozen_without_init = freeze(WithoutInit(1))
+        frozen_with_extra_attributes = freeze(with_extra_attributes)
+
+        self.assertIsInstance(frozen_without_init, WithoutInit)
+        self.assertEqual(2, frozen_without_init.double)
+        self.assertIsInstance(frozen_with_extra_attributes, WithExtraAttributes)
+        self.assertEqual(2, frozen_with_extra_attributes.extra)
+
+    def test_freeze_frozen_dataclass(self) -> None:
+        @dataclasses.dataclass(frozen=True)
+        class Point:
+            x: int
+            y: int
+
+        @dataclasses.dataclass(frozen=True)
+        class Polygon:
+            name: str
+            points: List[Point]
+
+        point = Point(x=1, y=2)
+        polygon = Polygon(name='triangle', points=[point, Point(x=3, y=4), Point(x=5, y=6)])
+
+        frozen_polygon = freeze(polygon)
+        frozen_polygon_inplace = freeze(Polygon(name='line', points=[point]), on_freeze='inplace')
+
+        self.assertIs(point, freeze(point))
+        self.assertIsNot(polygon, frozen_polygon)
+        self.assertIs(Polygon, type(frozen_polygon))
+        self.assertIsInstance(frozen_polygon.points, frozenlist)
+        self.assertIs(point, frozen_polygon.points[0])
+        self.assertEqual([point, Point(x=3, y=4), Point(x=5, y=6)], polygon.points)
+        self.assertEqual(Polygon(name='triangle', points=frozenlist(polygon.points)), frozen_polygon)
+        self.assertIs(frozen_polygon, freeze(frozen_polygon))
+        self.assertEqual(frozenlist([point]), frozen_polygon_inplace.points)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            frozen_polygon.name = 'square'
@@ -0,0 +1,61 @@
+import sys
+import unittest
+
+from gelidum import freeze, isfrozen
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import FrozenBase, clear_frozen_classes
+
+
+class TestFreezeDeepObjects(unittest.TestCase):
+    DEPTH = 10 * sys.getrecursionlimit()
+
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_freeze_deep_list(self) -> None:
+        deep_list = []
+        for _ in range(self.DEPTH):
+            deep_list = [1, deep_list]
+
+        frozen_list = freeze(deep_list)
+
+        depth = 0
+        while frozen_list:
+            self.assertIsInstance(frozen_list, frozenlist)
+            self.assertEqual(1, frozen_list[0])
+            frozen_list = frozen_list[1]
+            depth += 1
+        self.assertEqual(self.DEPTH, depth)
+
+    def test_freeze_deep_dict(self) -> None:
+        deep_dict = {}
+        for index in range(self.DEPTH):
+            deep_dict = {'index': index, 'next': deep_dict, 'set': {index}}
+
+        frozen_dict = freeze(deep_dict)
+
+        for index in reversed(range(self.DEPTH)):
+            self.assertIsInstance(frozen_dict, frozendict)
+            self.assertEqual(index, frozen_dict['index'])
+            self.assertTrue(isfrozen(frozen_dict['set']))
+            frozen_dict = frozen_dict['next']
+        self.assertEqual(frozendict(), frozen_dict)
+
+    def test_freeze_deep_object(self) -> None:
+        class Node(object):
+            def __init__(self, value: int, next_node: 'Node') -> None:
+                self.value = value
+                self.next = next_node
+
+        node = None
+        for value in range(self.DEPTH):
+            node = Node(value=value, next_node=node)
+
+        for on_freeze in ('copy', 'inplace'):
+            frozen_node = freeze(node, on_freeze=on_freeze)
+
+            for value in reversed(range(self.DEPTH)):
+                self.assertIsInstance(frozen_node, FrozenBase)
+                self.assertEqual(value, frozen_node.value)
+                frozen_node = frozen_node.next
+            self.assertIsNone(frozen_node)
@@ -2,7 +2,7 @@ import unittest
 import warnings
 
 from gelidum import FrozenException, freeze
-from gelidum.frozen import clear_frozen_classes
+from gelidum.frozen import clear_frozen_classes, get_frozen_classes
 
 
 class TestFreezeFunctions(unittest.TestCase):
@@ -42,7 +42,7 @@ class TestFreezeFunctions(unittest.TestCase):
         with self.assertRaises(FrozenException) as context:
             frozen_times.factor = 10
 
-        self.assertEqual('Can\'t assign attribute \'factor\' on immutable instance', str(context.exception))
+        self.assertEqual("Can't assign attribute 'factor' on immutable instance", str(context.exception))
 
     def test_freeze_function_and_writing_frozen_attributes_with_exception(self) -> None:
         def times() -> None:
@@ -72,3 +72,33 @@ class TestFreezeFunctions(unittest.TestCase):
             ["Can't assign attribute 'factor' on immutable instance"],
             [str(warn.message) for warn in caught_warnings],
         )
+
+    def test_freeze_several_functions(self) -> None:
+        def double(x: int) -> int:
+            return 2 * x
+
+        def triple(x: int) -> int:
+            return 3 * x
+
+        frozen_double = freeze(double)
+        frozen_triple = freeze(triple)
+
+        self.assertEqual(4, frozen_double(2))
+        self.assertEqual(6, frozen_triple(2))
+
+    def test_freeze_functions_share_their_frozen_class(self) -> None:
+        def double(x: int) -> int:
+            return 2 * x  # pragma: no cover
+
+        double.factor = 2
+
+        frozen_double = freeze(double)
+        other_frozen_double = freeze(double)
+        frozen_lambda = freeze(lambda x: x)
+
+        self.assertIs(type(frozen_double), type(other_frozen_double))
+        self.assertIs(type(frozen_double), type(frozen_lambda))
+        self.assertEqual(1, len(get_frozen_classes()))
+        self.assertEqual(frozen_double, other_frozen_double)
+        self.assertEqual(hash(frozen_double), hash(other_frozen_double))
+        self.assertNotEqual(frozen_double, frozen_lambda)
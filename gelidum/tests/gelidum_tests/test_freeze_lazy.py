@@ -0,0 +1,160 @@
+import threading
+import unittest
+from typing import Any, Dict, List
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import FrozenBase, clear_frozen_classes
+from gelidum.lazy import lazyfrozendict, lazyfrozenlist
+
+
+class TestFreezeLazy(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_freeze_dict_lazily(self) -> None:
+        graph = {'nodes': [{'id': 1, 'edges': [2]}, {'id': 2, 'edges': []}], 'name': 'graph'}
+
+        frozen_graph = freeze(graph, on_freeze='lazy')
+
+        self.assertIsInstance(frozen_graph, lazyfrozendict)
+        self.assertIsInstance(frozen_graph, frozendict)
+        self.assertTrue(isfrozen(frozen_graph))
+        # Values are not frozen until they are read
+        self.assertIs(graph['nodes'], dict.__getitem__(frozen_graph, 'nodes'))
+
+        frozen_nodes = frozen_graph['nodes']
+
+        self.assertIsInstance(frozen_nodes, lazyfrozenlist)
+        self.assertIsInstance(frozen_nodes, frozenlist)
+        self.assertIs(frozen_nodes, frozen_graph['nodes'])
+        self.assertIs(frozen_nodes[0], frozen_graph['nodes'][0])
+        self.assertEqual(frozenlist([2]), frozen_nodes[0]['edges'])
+        self.assertEqual('graph', frozen_graph['name'])
+        self.assertEqual(freeze(graph), frozen_graph)
+        self.assertEqual(frozen_graph, freeze(graph))
+        self.assertEqual(hash(freeze(graph)), hash(frozen_graph))
+
+    def test_lazily_frozen_collections_are_immutable(self) -> None:
+        frozen_graph = freeze({'nodes': [1, 2]}, on_freeze='lazy')
+
+        with self.assertRaises(FrozenException) as context_setitem:
+            frozen_graph['edges'] = []
+        with self.assertRaises(FrozenException) as context_append:
+            frozen_graph['nodes'].append(3)
+
+        self.assertEqual("'lazyfrozendict' object is immutable", str(context_setitem.exception))
+        self.assertEqual("'lazyfrozenlist' object is immutable", str(context_append.exception))
+
+    def test_lazily_frozen_collections_are_fully_frozen_when_read_as_a_whole(self) -> None:
+        frozen_graph = freeze({'nodes': [[1], {'id': 2}]}, on_freeze='lazy')
+
+        self.assertEqual({'nodes': ((1,), {'id': 2})}, dict(frozen_graph))
+        self.assertTrue(all(isfrozen(node) for node in frozen_graph['nodes']))
+        self.assertTrue(all(isfrozen(value) for value in frozen_graph.values()))
+        self.assertEqual([(1,), {'id': 2}], list(frozen_graph['nodes']))
+        self.assertEqual(frozenlist([{'id': 2}]), frozen_graph['nodes'][1:])
+        self.assertEqual(1, frozen_graph['nodes'].index({'id': 2}))
+        self.assertTrue((1,) in frozen_graph['nodes'])
+
+    def test_freeze_object_lazily(self) -> None:
+        class Node(object):
+            def __init__(self, node_id: int, edges: List[int], data: Dict[str, Any]) -> None:
+                self.node_id = node_id
+                self.edges = edges
+                self.__data = data
+
+            @property
+            def data(self) -> Dict[str, Any]:
+                return self.__data
+
+            def add_edge(self, edge: int) -> None:
+                self.edges.append(edge)
+
+        node = Node(node_id=1, edges=[2], data={'weight': [1]})
+
+        frozen_node = freeze(node, on_freeze='lazy')
+
+        self.assertIsInstance(frozen_node, Node)
+        self.assertIsInstance(frozen_node, FrozenBase)
+        self.assertNotIn('edges', vars(frozen_node))
+        self.assertEqual(frozenlist([2]), frozen_node.edges)
+        self.assertIn('edges', vars(frozen_node))
+        self.assertIs(frozen_node.edges, frozen_node.edges)
+        self.assertEqual(frozendict(weight=[1]), frozen_node.data)
+        self.assertEqual(1, frozen_node.node_id)
+        with self.assertRaises(FrozenException) as context_setattr:
+            frozen_node.node_id = 2
+        with self.assertRaises(FrozenException):
+            frozen_node.add_edge(3)
+        self.assertEqual("Can't assign attribute 'node_id' on immutable instance", str(context_setattr.exception))
+        self.assertEqual([2], node.edges)
+
+    def test_freeze_object_with_slots_lazily(self) -> None:
+        class NodeWithSlots(object):
+            __slots__ = ('edges', 'weight')
+
+            def __init__(self, edges: List[int]) -> None:
+                self.edges = edges
+
+        frozen_node = freeze(NodeWithSlots(edges=[2]), on_freeze='lazy')
+
+        self.assertEqual(frozenlist([2]), frozen_node.edges)
+        self.assertFalse(hasattr(frozen_node, 'weight'))
+
+    def test_freeze_shared_references_and_cycles_lazily(self) -> None:
+        class Node(object):
+            def __init__(self) -> None:
+                self.next = None
+
+        node1 = Node()
+        node2 = Node()
+        node1.next = node2
+        node2.next = node1
+        graph = {'nodes': [node1, node2]}
+        graph['graph'] = graph
+
+        frozen_graph = freeze(graph, on_freeze='lazy')
+
+        self.assertIs(frozen_graph, frozen_graph['graph'])
+        self.assertIs(frozen_graph['nodes'][0], frozen_graph['nodes'][1].next)
+        self.assertIs(frozen_graph['nodes'][0], frozen_graph['nodes'][0].next.next)
+
+    def test_read_lazily_frozen_values_concurrently(self) -> None:
+        class Node(object):
+            def __init__(self, edges: List[int]) -> None:
+                self.edges = edges
+
+        shared_values = ([1, 2], {'id': 3})
+        graph = {
+            'nodes': [Node(edges=[index]) for index in range(50)],
+            'values': [shared_values for _ in range(50)],
+        }
+        frozen_graph = freeze(graph, on_freeze='lazy')
+        barrier = threading.Barrier(8)
+        read_values = []
+
+        def read_graph() -> None:
+            barrier.wait()
+            read_values.append(
+                (
+                    frozen_graph['nodes'],
+                    [node.edges for node in frozen_graph['nodes']],
+                    [values for values in frozen_graph['values']],
+                )
+            )
+
+        threads = [threading.Thread(target=read_graph) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(8, len(read_values))
+        frozen_nodes, frozen_edges, frozen_values = read_values[0]
+        for other_frozen_nodes, other_frozen_edges, other_frozen_values in read_values[1:]:
+            self.assertIs(frozen_nodes, other_frozen_nodes)
+            self.assertTrue(all(edges is other for edges, other in zip(frozen_edges, other_frozen_edges)))
+            self.assertTrue(all(values is other for values, other in zip(frozen_values, other_frozen_values)))
+        self.assertEqual(1, len({id(values) for values in frozen_values}))
+        self.assertEqual(freeze(shared_values), frozen_values[0])
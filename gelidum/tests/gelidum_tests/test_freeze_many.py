@@ -0,0 +1,131 @@
+import copy
+import gc
+import unittest
+import warnings
+import weakref
+from typing import Iterator, List
+
+from gelidum import FrozenException, freeze, freeze_many, isfrozen
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import clear_frozen_classes, get_frozen_classes
+from gelidum.views import frozendictview
+
+
+class Record(object):
+    def __init__(self, record_id: int, tags: List[str]) -> None:
+        self.record_id = record_id
+        self.tags = tags
+
+
+class RecordWithSlots(object):
+    __slots__ = ('record_id',)
+
+    def __init__(self, record_id: int) -> None:
+        self.record_id = record_id
+
+
+class TestFreezeMany(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_freeze_many(self) -> None:
+        records = [Record(record_id=record_id, tags=['new']) for record_id in range(3)]
+
+        frozen_records = freeze_many(records)
+
+        self.assertIsInstance(frozen_records, frozenlist)
+        self.assertEqual(3, len(frozen_records))
+        self.assertEqual(1, len(get_frozen_classes()))
+        self.assertIs(type(freeze(records[0])), type(frozen_records[0]))
+        for record_id, frozen_record in enumerate(frozen_records):
+            self.assertTrue(isfrozen(frozen_record))
+            self.assertIsNot(records[record_id], frozen_record)
+            self.assertEqual(record_id, frozen_record.record_id)
+            self.assertEqual(frozenlist(['new']), frozen_record.tags)
+        with self.assertRaises(FrozenException):
+            frozen_records[0].record_id = 4
+        self.assertEqual(['new'], records[0].tags)
+        self.assertIsInstance(records[0].tags, list)
+
+    def test_freeze_many_generator(self) -> None:
+        frozen_records = freeze_many((Record(record_id=record_id, tags=[]) for record_id in range(3)), generator=True)
+
+        self.assertNotIsInstance(frozen_records, frozenlist)
+        self.assertEqual([0, 1, 2], [frozen_record.record_id for frozen_record in frozen_records])
+
+    def test_freeze_many_generator_does_not_keep_frozen_objects_alive(self) -> None:
+        record_refs = []
+
+        def make_records() -> Iterator[Record]:
+            for record_id in range(3):
+                record = Record(record_id=record_id, tags=['new'])
+                record_refs.append(weakref.ref(record))
+                yield record
+
+        tags = ['shared']
+        memo = {}
+        frozen_records = freeze_many(make_records(), generator=True)
+        shared_frozen_records = freeze_many([Record(1, tags), Record(2, tags)], memo=memo, generator=True)
+
+        next(frozen_records)
+        next(frozen_records)
+        gc.collect()
+
+        self.assertIsNone(record_refs[0]())
+        self.assertIsNotNone(record_refs[1]())
+        self.assertIs(next(shared_frozen_records).tags, next(shared_frozen_records).tags)
+
+    def test_freeze_many_different_values(self) -> None:
+        class RecordWithCopy(Record):
+            def __copy__(self) -> 'RecordWithCopy':
+                return RecordWithCopy(record_id=self.record_id * 10, tags=self.tags)
+
+        values = [Record(record_id=1, tags=[]), RecordWithSlots(record_id=2), RecordWithCopy(record_id=3, tags=[])]
+        values += [{'one': [1]}, [1], 1, 'one', None, frozendict(two=2)]
+
+        frozen_values = freeze_many(values)
+
+        self.assertEqual([1, 2, 30], [frozen_value.record_id for frozen_value in frozen_values[:3]])
+        self.assertEqual(frozendict({'one': frozenlist([1])}), frozen_values[3])
+        self.assertEqual(frozenlist([1]), frozen_values[4])
+        self.assertEqual((1, 'one', None), frozen_values[5:8])
+        self.assertIs(values[8], frozen_values[8])
+
+    def test_freeze_many_shared_references_and_cycles(self) -> None:
+        tags = ['shared']
+        records = [Record(record_id=record_id, tags=tags) for record_id in range(2)]
+        records[0].next = records[1]
+        records[1].next = records[0]
+
+        frozen_records = freeze_many(records + [records[0]])
+
+        self.assertIs(frozen_records[0].tags, frozen_records[1].tags)
+        self.assertIs(frozen_records[1], frozen_records[0].next)
+        self.assertIs(frozen_records[0], frozen_records[1].next)
+        self.assertIs(frozen_records[0], frozen_records[2])
+
+    def test_freeze_many_inplace(self) -> None:
+        records = [Record(record_id=record_id, tags=[]) for record_id in range(2)]
+
+        frozen_records = freeze_many(records, on_freeze='inplace')
+
+        self.assertIs(records[0], frozen_records[0])
+        self.assertTrue(isfrozen(records[1]))
+        with self.assertRaises(FrozenException) as context:
+            freeze_many([RecordWithSlots(record_id=1)], on_freeze='inplace')
+        self.assertEqual('Objects of classes with __slots__ cannot be frozen inplace', str(context.exception))
+
+    def test_freeze_many_with_on_update_and_on_freeze(self) -> None:
+        records = [Record(record_id=record_id, tags=[]) for record_id in range(2)]
+
+        frozen_records = freeze_many(records, on_update='warning')
+        views = freeze_many([{'one': 1}], on_freeze='view')
+        copies = freeze_many(records, on_freeze=copy.copy)
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            frozen_records[1].record_id = 2
+        self.assertEqual(1, len(caught_warnings))
+        self.assertIsInstance(views[0], frozendictview)
+        self.assertEqual([0, 1], [frozen_record.record_id for frozen_record in copies])
+        self.assertIsNot(records[0], copies[0])
@@ -199,7 +199,8 @@ class TestFreezeObjects(unittest.TestCase):
         obj2 = ClassWithSlots(attr1=3, attr2=4)
         frozen_obj2 = freeze(obj2, on_update='warning', on_freeze='copy')
 
-        self.assertNotEqual(id(frozen_obj1.__class__), id(frozen_obj2.__class__))
+        self.assertIs(frozen_obj1.__class__, frozen_obj2.__class__)
+        self.assertEqual({frozen_obj1.__class__}, get_frozen_classes())
         self.assertEqual((FrozenBase, ClassWithSlots), frozen_obj1.__class__.__bases__)
         self.assertEqual((FrozenBase, ClassWithSlots), frozen_obj2.__class__.__bases__)
         self.assertEqual(1, frozen_obj1.attr1)
@@ -240,6 +241,54 @@ class TestFreezeObjects(unittest.TestCase):
             [str(warn.message) for warn in caught_warnings],
         )
 
+    def test_freeze_object_of_class_with_inherited_and_private_slots(self):
+        class BaseClassWithSlots(object):
+            __slots__ = 'attr1'
+
+            def __init__(self, attr1: int):
+                self.attr1 = attr1
+
+        class ClassWithSlots(BaseClassWithSlots):
+            __slots__ = ('__attr2', 'attr3', '__weakref__')
+
+            def __init__(self, attr1: int, attr2: List[int]):
+                super().__init__(attr1)
+                self.__attr2 = attr2
+
+            @property
+            def attr2(self) -> List[int]:
+                return self.__attr2
+
+        obj = ClassWithSlots(attr1=1, attr2=[2])
+        frozen_obj = freeze(obj)
+
+        self.assertEqual(1, frozen_obj.attr1)
+        self.assertEqual([2], list(frozen_obj.attr2))
+        self.assertIsInstance(frozen_obj.attr2, FrozenBase)
+        self.assertFalse(hasattr(frozen_obj, 'attr3'))
+        self.assertEqual([2], obj.attr2)
+
+    def test_pickle_object_of_class_with_slots(self) -> None:
+        class DummyWithSlotsForPickle(object):
+            __slots__ = ('attr1', 'attr2')
+
+            def __init__(self, attr1: int, attr2: str):
+                self.attr1 = attr1
+                self.attr2 = attr2
+
+        setattr(sys.modules[__name__], DummyWithSlotsForPickle.__name__, DummyWithSlotsForPickle)
+
+        frozen_dummy = freeze(DummyWithSlotsForPickle(attr1=1, attr2='two'))
+        unpickled_frozen_dummy = pickle.loads(pickle.dumps(frozen_dummy))
+
+        with self.assertRaises(FrozenException) as context:
+            unpickled_frozen_dummy.attr1 = 8
+
+        self.assertEqual("Can't assign attribute 'attr1' on immutable instance", str(context.exception))
+        self.assertIs(frozen_dummy.__class__, unpickled_frozen_dummy.__class__)
+        self.assertEqual(1, unpickled_frozen_dummy.attr1)
+        self.assertEqual('two', unpickled_frozen_dummy.attr2)
+
     def test_freeze_object_of_class_with_slots_inplace(self):
         class ClassWithSlots(object):
             __slots__ = ('attr1', '_attr2')
@@ -944,6 +993,93 @@ class TestFreezeObjects(unittest.TestCase):
         self.assertSetEqual({frozen_dummy1.__class__}, frozen_classes)
         self.assertEqual(frozen_dummy1.__class__, frozen_dummy2.__class__, frozen_dummy3.__class__)
 
+    def test_frozen_classes_by_update_policy(self) -> None:
+        class Dummy(object):
+            def __init__(self, attr: int) -> None:
+                self.attr = attr
+
+        frozen_dummy_exception = freeze(Dummy(1), on_update='exception')
+        frozen_dummy_warning = freeze(Dummy(2), on_update='warning')
+        frozen_dummy_nothing1 = freeze(Dummy(3), on_update='nothing')
+        frozen_dummy_nothing2 = freeze(Dummy(4), on_update='nothing')
+
+        with self.assertRaises(FrozenException):
+            frozen_dummy_exception.attr = 99
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            frozen_dummy_warning.attr = 99
+
+        frozen_dummy_nothing1.attr = 99
+
+        self.assertEqual(
+            ["Can't assign attribute 'attr' on immutable instance"], [str(warn.message) for warn in caught_warnings]
+        )
+        self.assertEqual(3, frozen_dummy_nothing1.attr)
+        self.assertIs(frozen_dummy_nothing1.__class__, frozen_dummy_nothing2.__class__)
+        self.assertEqual(
+            {frozen_dummy_exception.__class__, frozen_dummy_warning.__class__, frozen_dummy_nothing1.__class__},
+            get_frozen_classes(),
+        )
+
+    def test_pickle_objects_of_same_class_with_different_update_policies(self) -> None:
+        class DummyForPickleWithPolicies(object):
+            def __init__(self, attr: int):
+                self.attr = attr
+
+        setattr(sys.modules[__name__], DummyForPickleWithPolicies.__name__, DummyForPickleWithPolicies)
+
+        frozen_dummy_exception = freeze(DummyForPickleWithPolicies(attr=1), on_update='exception')
+        frozen_dummy_warning = freeze(DummyForPickleWithPolicies(attr=2), on_update='warning')
+        unpickled_frozen_dummy_exception = pickle.loads(pickle.dumps(frozen_dummy_exception))
+        unpickled_frozen_dummy_warning = pickle.loads(pickle.dumps(frozen_dummy_warning))
+
+        self.assertIsNot(frozen_dummy_exception.__class__, frozen_dummy_warning.__class__)
+        self.assertIs(frozen_dummy_exception.__class__, unpickled_frozen_dummy_exception.__class__)
+        self.assertIs(frozen_dummy_warning.__class__, unpickled_frozen_dummy_warning.__class__)
+        self.assertEqual(1, unpickled_frozen_dummy_exception.attr)
+        self.assertEqual(2, unpickled_frozen_dummy_warning.attr)
+
+    def test_frozen_class_names_by_update_policy(self) -> None:
+        class Dummy(object):
+            def __init__(self, attr: int) -> None:
+                self.attr = attr
+
+        # The names do not depend on the order in which the frozen classes are created
+        frozen_dummy_warning = freeze(Dummy(1), on_update='warning')
+        frozen_dummy_nothing = freeze(Dummy(2), on_update='nothing')
+        frozen_dummy_exception = freeze(Dummy(3), on_update='exception')
+        frozen_dummy_custom1 = freeze(Dummy(4), on_update=lambda *args, **kwargs: None)
+        frozen_dummy_custom2 = freeze(Dummy(5), on_update=lambda *args, **kwargs: None)
+
+        module_name = Dummy.__module__.title().replace('.', '').replace('_', '')
+        self.assertEqual(f'FrozenDummyFrom{module_name}', type(frozen_dummy_exception).__name__)
+        self.assertEqual(f'FrozenDummyFrom{module_name}OnUpdateWarning', type(frozen_dummy_warning).__name__)
+        self.assertEqual(f'FrozenDummyFrom{module_name}OnUpdateNothing', type(frozen_dummy_nothing).__name__)
+        self.assertEqual(f'FrozenDummyFrom{module_name}OnUpdateCustom', type(frozen_dummy_custom1).__name__)
+        self.assertEqual(f'FrozenDummyFrom{module_name}OnUpdateCustom2', type(frozen_dummy_custom2).__name__)
+
+    def test_freeze_objects_of_same_class_concurrently(self) -> None:
+        class Dummy(object):
+            def __init__(self, attr: int) -> None:
+                self.attr = attr
+
+        barrier = threading.Barrier(8)
+        frozen_dummies = []
+
+        def freeze_dummies() -> None:
+            barrier.wait()
+            frozen_dummies.extend(freeze(Dummy(attr)) for attr in range(100))
+
+        threads = [threading.Thread(target=freeze_dummies) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(800, len(frozen_dummies))
+        self.assertEqual({frozen_dummies[0].__class__}, {frozen_dummy.__class__ for frozen_dummy in frozen_dummies})
+        self.assertEqual({frozen_dummies[0].__class__}, get_frozen_classes())
+
     def test_invalid_str_for_on_freeze_parameter(self) -> None:
         with self.assertRaises(AttributeError) as context:
             freeze(('one', 2, 'three'), on_freeze='invalid')
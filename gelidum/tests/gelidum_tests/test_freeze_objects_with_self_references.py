@@ -1,6 +1,6 @@
 import unittest
 
-from gelidum import freeze, isfrozen
+from gelidum import FrozenException, freeze, isfrozen
 from gelidum.frozen import FrozenBase
 
 
@@ -18,3 +18,112 @@ class TestFreezeObjectsWithSelfReferences(unittest.TestCase):
         self.assertIsInstance(frozen_dummy.ref, FrozenBase)
         self.assertIs(frozen_dummy.ref, frozen_dummy)
         self.assertTrue(isfrozen(frozen_dummy))
+
+    def test_freeze_objects_with_cycle_of_references(self):
+        class Dummy(object):
+            def __init__(self, name: str):
+                self.name = name
+                self.next = None
+
+        dummy1 = Dummy('1')
+        dummy2 = Dummy('2')
+        dummy3 = Dummy('3')
+        dummy1.next = dummy2
+        dummy2.next = dummy3
+        dummy3.next = dummy1
+
+        frozen_dummy1 = freeze(dummy1)
+
+        self.assertIsNot(dummy1, frozen_dummy1)
+        self.assertEqual('2', frozen_dummy1.next.name)
+        self.assertEqual('3', frozen_dummy1.next.next.name)
+        self.assertIs(frozen_dummy1, frozen_dummy1.next.next.next)
+        self.assertTrue(isfrozen(frozen_dummy1.next))
+        self.assertTrue(isfrozen(frozen_dummy1.next.next))
+
+    def test_freeze_objects_with_cycle_of_references_through_collections(self):
+        class Dummy(object):
+            def __init__(self):
+                self.children = []
+                self.index = {}
+
+        dummy = Dummy()
+        dummy.children.append(dummy)
+        dummy.index['self'] = dummy
+        dummy.index['index'] = dummy.index
+
+        frozen_dummy = freeze(dummy)
+
+        self.assertIs(frozen_dummy, frozen_dummy.children[0])
+        self.assertIs(frozen_dummy, frozen_dummy.index['self'])
+        self.assertIs(frozen_dummy.index, frozen_dummy.index['index'])
+
+    def test_freeze_list_with_cycle_of_references_through_object(self):
+        class Dummy(object):
+            def __init__(self, items: list):
+                self.items = items
+
+        items = []
+        items.append(Dummy(items))
+
+        frozen_items = freeze(items)
+
+        self.assertIs(frozen_items, frozen_items[0].items)
+
+    def test_freeze_list_that_contains_itself(self):
+        items = [1]
+        items.append([items])
+
+        with self.assertRaises(FrozenException) as context:
+            freeze(items)
+
+        self.assertEqual('list object references itself and cannot be frozen', str(context.exception))
+
+    def test_freeze_shared_references(self):
+        class Child(object):
+            def __init__(self, value: int):
+                self.value = value
+
+        class Parent(object):
+            def __init__(self, child: Child):
+                self.child = child
+
+        child = Child(1)
+        shared_list = [child]
+        parents = [Parent(child) for _ in range(100)]
+
+        frozen_parents, frozen_shared_list = freeze([parents, shared_list])
+
+        self.assertEqual(1, len({id(frozen_parent.child) for frozen_parent in frozen_parents}))
+        self.assertIs(frozen_parents[0].child, frozen_shared_list[0])
+        self.assertIsNot(child, frozen_shared_list[0])
+
+    def test_freeze_shared_references_with_memo(self):
+        class Dummy(object):
+            def __init__(self, value: int):
+                self.value = value
+
+        dummy = Dummy(1)
+        memo = {}
+
+        frozen_dummy1 = freeze(dummy, memo=memo)
+        frozen_dummy2 = freeze([dummy], memo=memo)[0]
+        frozen_dummy3 = freeze(dummy)
+
+        self.assertIs(frozen_dummy1, frozen_dummy2)
+        self.assertIsNot(frozen_dummy1, frozen_dummy3)
+        # The memo only has the frozen objects
+        self.assertNotIn(id(memo), memo)
+        self.assertTrue(all(isfrozen(frozen_obj) for frozen_obj in memo.values()))
+
+    def test_freeze_self_referencing_list_with_memo(self):
+        self_referencing_list = []
+        self_referencing_list.append(self_referencing_list)
+        # The cycles are detected regardless of the entries of the memo
+        memo = {1: frozenset(), 2: frozenset()}
+
+        with self.assertRaises(FrozenException) as context:
+            freeze([1, [self_referencing_list]], memo=memo)
+
+        self.assertEqual('list object references itself and cannot be frozen', str(context.exception))
+        self.assertEqual(2, len(memo))
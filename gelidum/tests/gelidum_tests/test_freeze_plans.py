@@ -0,0 +1,153 @@
+import dataclasses
+import unittest
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from gelidum import (
+    Freezable,
+    FrozenException,
+    compile_freeze_plan,
+    freeze,
+    freeze_typed,
+    isfrozen,
+)
+from gelidum.collections import frozendict, frozenlist, frozenzet
+from gelidum.frozen import clear_frozen_classes
+
+
+class Tag(object):
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Product(object):
+    name: str
+    codes: Tuple[str, ...]
+    prices: List[float]
+    stock: Dict[str, int]
+    tag_names: Set[str]
+    tags: List[Tag]
+    main_tag: Optional[Tag]
+    ratings: Freezable[List[int]]
+    related: List['Product']
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.codes = ('A1', 'B2')
+        self.prices = [10.0, 9.5]
+        self.stock = {'madrid': 1}
+        self.tag_names = {'paper'}
+        self.tags = [Tag('paper')]
+        self.main_tag = None
+        self.ratings = [5, 4]
+        self.related = []
+        self.notes = ['not annotated']
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+    labels: List[str]
+
+
+class TestFreezePlans(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_freeze_typed(self) -> None:
+        product = Product('book')
+
+        frozen_product = freeze_typed(product)
+
+        self.assertTrue(isfrozen(frozen_product))
+        self.assertIsInstance(frozen_product, Product)
+        self.assertEqual('book', frozen_product.name)
+        self.assertIs(product.codes, frozen_product.codes)
+        self.assertEqual(frozenlist([10.0, 9.5]), frozen_product.prices)
+        self.assertIsInstance(frozen_product.prices, frozenlist)
+        self.assertEqual(frozendict({'madrid': 1}), frozen_product.stock)
+        self.assertIsInstance(frozen_product.stock, frozendict)
+        self.assertIsInstance(frozen_product.tag_names, frozenzet)
+        self.assertTrue(isfrozen(frozen_product.tags[0]))
+        self.assertEqual('paper', frozen_product.tags[0].name)
+        self.assertIsNone(frozen_product.main_tag)
+        self.assertEqual(frozenlist([5, 4]), frozen_product.ratings)
+        self.assertEqual(frozenlist(['not annotated']), frozen_product.notes)
+        self.assertEqual(type(freeze(product)), type(frozen_product))
+        with self.assertRaises(FrozenException) as context:
+            frozen_product.name = 'pen'
+        self.assertEqual("Can't assign attribute 'name' on immutable instance", str(context.exception))
+        self.assertEqual([10.0, 9.5], product.prices)
+
+    def test_compile_freeze_plan(self) -> None:
+        freeze_product = compile_freeze_plan(Product)
+        product = Product('book')
+        product.main_tag = product.tags[0]
+
+        frozen_product = freeze_product(product, on_update='nothing')
+        frozen_product.name = 'pen'
+
+        self.assertEqual('book', frozen_product.name)
+        self.assertIs(frozen_product.tags[0], frozen_product.main_tag)
+        self.assertEqual('paper', freeze_product(Product('book')).tags[0].name)
+
+    def test_freeze_typed_with_cycles(self) -> None:
+        product = Product('book')
+        other_product = Product('pen')
+        product.related.append(other_product)
+        other_product.related.append(product)
+
+        frozen_product = freeze_typed(product)
+
+        self.assertEqual('pen', frozen_product.related[0].name)
+        self.assertIs(frozen_product, frozen_product.related[0].related[0])
+
+    def test_freeze_typed_values_of_other_classes(self) -> None:
+        product = Product('book')
+        product.prices = frozenzet([10.0, 9.5])
+        product.main_tag = 'paper'
+
+        frozen_product = freeze_typed(product)
+
+        self.assertIs(product.prices, frozen_product.prices)
+        self.assertEqual('paper', frozen_product.main_tag)
+        self.assertEqual(frozendict(one=1), freeze_typed({'one': 1}))
+
+    def test_freeze_typed_with_validation(self) -> None:
+        product = Product('book')
+        product.prices = (10.0, 9.5)
+        tag = Tag('paper')
+        tag.name = ['paper']
+
+        with self.assertRaises(TypeError) as context_prices:
+            freeze_typed(product, validate=True)
+        with self.assertRaises(TypeError) as context_name:
+            compile_freeze_plan(Tag, validate=True)(tag)
+
+        self.assertEqual(
+            "'tuple' object does not match the type hint typing.List[float]", str(context_prices.exception)
+        )
+        self.assertEqual("'list' object does not match the type hint <class 'str'>", str(context_name.exception))
+        self.assertEqual('book', freeze_typed(Product('book'), validate=True).name)
+
+    def test_freeze_typed_dataclass(self) -> None:
+        point = Point(x=1, y=2, labels=['origin'])
+
+        frozen_point = freeze_typed(point)
+
+        self.assertEqual(type(freeze(point)), type(frozen_point))
+        self.assertEqual(freeze(point), frozen_point)
+        self.assertEqual(frozenlist(['origin']), frozen_point.labels)
+
+    def test_freeze_typed_without_type_hints(self) -> None:
+        class Dummy(object):
+            value: 'UnknownClass'  # noqa
+
+            def __init__(self, value: Any) -> None:
+                self.value = value
+
+        frozen_dummy = freeze_typed(Dummy([1]))
+
+        self.assertEqual(frozenlist([1]), frozen_dummy.value)
@@ -0,0 +1,180 @@
+import copy
+import unittest
+import warnings
+from typing import Any, Dict, Iterator, List
+
+from gelidum import FrozenException, freeze, isfrozen
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import FrozenBase, clear_frozen_classes
+from gelidum.views import (
+    frozendictview,
+    frozenlistview,
+    frozenobjectview,
+    frozensetview,
+)
+
+
+class TestFreezeViews(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_view_of_dict(self) -> None:
+        catalog = {'products': [{'name': 'book', 'tags': ['paper']}], 'currencies': {'EUR', 'USD'}, 'version': 1}
+
+        frozen_catalog = freeze(catalog, on_freeze='view')
+
+        self.assertIsInstance(frozen_catalog, frozendictview)
+        self.assertIsInstance(frozen_catalog['products'], frozenlistview)
+        self.assertIsInstance(frozen_catalog['products'][0], frozendictview)
+        self.assertIsInstance(frozen_catalog['currencies'], frozensetview)
+        self.assertTrue(isfrozen(frozen_catalog))
+        self.assertTrue(isfrozen(frozen_catalog['products'][0]['tags']))
+        self.assertEqual(1, frozen_catalog['version'])
+        self.assertEqual('paper', frozen_catalog['products'][-1]['tags'][0])
+        self.assertTrue('EUR' in frozen_catalog['currencies'])
+        self.assertEqual(['products', 'currencies', 'version'], list(frozen_catalog))
+        self.assertEqual(freeze(catalog), frozen_catalog)
+
+    def test_view_does_not_copy_nor_modify(self) -> None:
+        tags = ['paper']
+        catalog = {'tags': tags}
+
+        frozen_catalog = freeze(catalog, on_freeze='view')
+        tags.append('new')
+
+        self.assertIs(dict, type(catalog))
+        self.assertEqual(['paper', 'new'], list(frozen_catalog['tags']))
+        self.assertIs(frozen_catalog['tags'], frozen_catalog['tags'])
+
+    def test_view_cannot_be_modified(self) -> None:
+        frozen_catalog = freeze({'products': [{'name': 'book'}]}, on_freeze='view')
+
+        with self.assertRaises(FrozenException) as context_setitem:
+            frozen_catalog['products'][0]['name'] = 'pen'
+        with self.assertRaises(FrozenException) as context_delitem:
+            del frozen_catalog['products']
+        with self.assertRaises(AttributeError):
+            frozen_catalog['products'].append({})
+
+        self.assertEqual("Can't set key 'name' on immutable instance", str(context_setitem.exception))
+        self.assertEqual("Can't delete key 'products' on immutable instance", str(context_delitem.exception))
+
+    def test_view_of_object(self) -> None:
+        class Product(object):
+            def __init__(self, name: str, tags: List[str], prices: Dict[str, float]) -> None:
+                self.name = name
+                self.tags = tags
+                self.prices = prices
+
+            @property
+            def first_tag(self) -> str:
+                return self.tags[0]
+
+            def rename(self, name: str) -> None:
+                self.name = name
+
+        product = Product(name='book', tags=['paper'], prices={'EUR': 10.0})
+
+        frozen_product = freeze(product, on_freeze='view')
+
+        self.assertIsInstance(frozen_product, frozenobjectview)
+        self.assertIsInstance(frozen_product, Product)
+        self.assertIsInstance(frozen_product, FrozenBase)
+        self.assertEqual('book', frozen_product.name)
+        self.assertEqual('paper', frozen_product.first_tag)
+        self.assertEqual(10.0, frozen_product.prices['EUR'])
+        self.assertEqual(frozen_product, product)
+        self.assertEqual(hash(product), hash(frozen_product))
+        with self.assertRaises(FrozenException) as context_setattr:
+            frozen_product.name = 'pen'
+        with self.assertRaises(FrozenException) as context_method:
+            frozen_product.rename('pen')
+        self.assertEqual("Can't assign attribute 'name' on immutable instance", str(context_setattr.exception))
+        self.assertEqual("Can't assign attribute 'name' on immutable instance", str(context_method.exception))
+        self.assertEqual('book', product.name)
+
+    def test_view_of_object_with_slots(self) -> None:
+        class ProductWithSlots(object):
+            __slots__ = ('name', 'tags')
+
+            def __init__(self, name: str, tags: List[str]) -> None:
+                self.name = name
+                self.tags = tags
+
+        frozen_product = freeze(ProductWithSlots(name='book', tags=['paper']), on_freeze='view')
+
+        self.assertEqual('book', frozen_product.name)
+        self.assertEqual(frozenlist(['paper']), frozen_product.tags)
+        with self.assertRaises(FrozenException):
+            frozen_product.name = 'pen'
+
+    def test_view_with_on_update_policy(self) -> None:
+        catalog = {'products': [1, 2]}
+        frozen_catalog = freeze(catalog, on_update='warning', on_freeze='view')
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            frozen_catalog['products'][0] = 3
+
+        self.assertEqual(1, len(caught_warnings))
+        self.assertEqual("Can't set key '0' on immutable instance", str(caught_warnings[0].message))
+        self.assertEqual([1, 2], catalog['products'])
+
+    def test_view_of_frozen_and_other_values(self) -> None:
+        def dummy_function(value: Any) -> Any:
+            return value
+
+        frozen_dict = frozendict(one=1)
+
+        self.assertIs(frozen_dict, freeze(frozen_dict, on_freeze='view'))
+        self.assertEqual(1, freeze(1, on_freeze='view'))
+        self.assertEqual(b'bytes', freeze(bytearray(b'bytes'), on_freeze='view'))
+        self.assertEqual(2, freeze(dummy_function, on_freeze='view')(2))
+
+    def test_view_is_not_copied(self) -> None:
+        frozen_catalog = freeze({'products': []}, on_freeze='view')
+
+        self.assertIs(frozen_catalog, copy.copy(frozen_catalog))
+        self.assertIs(frozen_catalog, copy.deepcopy(frozen_catalog))
+
+    def test_view_of_object_with_special_methods(self) -> None:
+        class Basket(object):
+            def __init__(self, products: List[Dict[str, Any]]) -> None:
+                self.products = products
+
+            def __len__(self) -> int:
+                return len(self.products)
+
+            def __iter__(self) -> Iterator[Dict[str, Any]]:
+                return iter(self.products)
+
+            def __getitem__(self, index: int) -> Dict[str, Any]:
+                return self.products[index]
+
+            def __contains__(self, product: Dict[str, Any]) -> bool:
+                return product in self.products
+
+            def __iadd__(self, product: Dict[str, Any]) -> 'Basket':
+                self.products = list(self.products) + [product]
+                return self
+
+        class Product(object):
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+        basket = Basket(products=[{'name': 'book'}])
+
+        frozen_basket = freeze(basket, on_freeze='view')
+
+        self.assertIsInstance(frozen_basket, frozenobjectview)
+        self.assertIsInstance(frozen_basket, Basket)
+        self.assertEqual(1, len(frozen_basket))
+        self.assertTrue(frozen_basket)
+        self.assertIsInstance(list(frozen_basket)[0], frozendictview)
+        self.assertEqual('book', frozen_basket[0]['name'])
+        self.assertIn({'name': 'book'}, frozen_basket)
+        self.assertIs(type(frozen_basket), type(freeze(Basket(products=[]), on_freeze='view')))
+        self.assertIs(frozenobjectview, type(freeze(Product(name='book'), on_freeze='view')))
+        with self.assertRaises(FrozenException):
+            frozen_basket += {'name': 'pen'}
+        self.assertEqual([{'name': 'book'}], basket.products)
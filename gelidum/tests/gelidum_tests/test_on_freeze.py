@@ -1,5 +1,6 @@
 import logging
 import unittest
+from collections import deque
 from typing import Any, List
 from unittest import mock
 from unittest.mock import call
@@ -161,3 +162,19 @@ class TestOnFreeze(unittest.TestCase):
         self.assertIsNot(frozen_dummy1.attr2.__class__, DummyAttr2)
         self.assertEqual(1, frozen_dummy1.attr1.attr)
         self.assertEqual(2, frozen_dummy1.attr2.attr)
+
+    def test_on_freeze_copier_copies_container_subclasses(self) -> None:
+        class History(deque):
+            pass
+
+        history = History([['start']], maxlen=2)
+        history.name = 'history'
+
+        frozen_history = freeze(history, on_freeze=OnFreezeCopier())
+
+        self.assertIsNot(history[0], frozen_history[0])
+        self.assertEqual(['start'], frozen_history[0])
+        self.assertEqual(2, frozen_history.maxlen)
+        self.assertEqual('history', frozen_history.name)
+        history[0].append('stop')
+        self.assertEqual(['start'], frozen_history[0])
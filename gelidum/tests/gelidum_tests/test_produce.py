@@ -0,0 +1,343 @@
+import dataclasses
+import unittest
+from collections import defaultdict, deque
+from typing import Any, Dict, List
+
+from gelidum import FrozenException, freeze, isfrozen, produce, thaw
+from gelidum.collections import (
+    frozendefaultdict,
+    frozendeque,
+    frozendict,
+    frozenlist,
+    frozenmap,
+    frozenzet,
+)
+from gelidum.frozen import clear_frozen_classes
+
+
+class TestProduce(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_produce_frozendict(self) -> None:
+        frozen_dict = freeze({'one': 1, 'nested': {'two': 2}, 'untouched': {'three': [3]}})
+
+        def recipe(draft: Dict[str, Any]) -> None:
+            draft['one'] = [1]
+            draft['nested']['two'] = 'dos'
+            draft['new'] = {'four': 4}
+            self.assertEqual('dos', draft.get('nested')['two'])
+
+        new_frozen_dict = produce(frozen_dict, recipe)
+
+        self.assertIsInstance(new_frozen_dict, frozendict)
+        self.assertEqual({'one': 1, 'nested': {'two': 2}, 'untouched': {'three': (3,)}}, frozen_dict)
+        self.assertEqual(
+            {'one': (1,), 'nested': {'two': 'dos'}, 'untouched': {'three': (3,)}, 'new': {'four': 4}}, new_frozen_dict
+        )
+        self.assertIs(frozen_dict['untouched'], new_frozen_dict['untouched'])
+        self.assertTrue(isfrozen(new_frozen_dict['one']))
+        self.assertTrue(isfrozen(new_frozen_dict['new']))
+
+    def test_produce_frozenlist(self) -> None:
+        frozen_list = freeze([[1], [2], {'three': 3}])
+
+        def recipe(draft: List[Any]) -> None:
+            draft[0].append(1)
+            draft[2]['three'] = 'tres'
+            draft.append([4])
+
+        new_frozen_list = produce(frozen_list, recipe)
+
+        self.assertIsInstance(new_frozen_list, frozenlist)
+        self.assertEqual(frozenlist([[1], [2], {'three': 3}]), frozen_list)
+        self.assertEqual(frozenlist([[1, 1], [2], {'three': 'tres'}, [4]]), new_frozen_list)
+        self.assertIs(frozen_list[1], new_frozen_list[1])
+
+    def test_produce_frozenzet(self) -> None:
+        frozen_zet = frozenzet([1, 2])
+
+        new_frozen_zet = produce(frozen_zet, lambda draft: draft.add(3))
+
+        self.assertEqual(frozenzet([1, 2]), frozen_zet)
+        self.assertEqual(frozenzet([1, 2, 3]), new_frozen_zet)
+        self.assertIs(frozen_zet, produce(frozen_zet, lambda draft: draft.add(1)))
+
+    def test_produce_frozen_object(self) -> None:
+        class Dummy(object):
+            def __init__(self, value: int, items: List[int], config: Dict[str, Any]) -> None:
+                self.value = value
+                self.items = items
+                self.config = config
+                self.comment = 'comment'
+
+        frozen_dummy = freeze(Dummy(value=1, items=[1], config={'debug': False}))
+
+        def recipe(draft: Dummy) -> None:
+            draft.value = 2
+            draft.items.append(2)
+            del draft.comment
+
+        new_frozen_dummy = produce(frozen_dummy, recipe)
+
+        self.assertIs(type(frozen_dummy), type(new_frozen_dummy))
+        self.assertEqual(1, frozen_dummy.value)
+        self.assertEqual(frozenlist([1]), frozen_dummy.items)
+        self.assertEqual('comment', frozen_dummy.comment)
+        self.assertEqual(2, new_frozen_dummy.value)
+        self.assertEqual(frozenlist([1, 2]), new_frozen_dummy.items)
+        self.assertNotIn('comment', vars(new_frozen_dummy))
+        self.assertIs(frozen_dummy.config, new_frozen_dummy.config)
+        with self.assertRaises(FrozenException):
+            new_frozen_dummy.value = 3
+
+    def test_produce_frozen_object_with_slots(self) -> None:
+        class DummyWithSlots(object):
+            __slots__ = ('value', 'items')
+
+            def __init__(self, value: int, items: List[int]) -> None:
+                self.value = value
+                self.items = items
+
+        frozen_dummy = freeze(DummyWithSlots(value=1, items=[1]))
+
+        new_frozen_dummy = produce(frozen_dummy, lambda draft: draft.items.append(2))
+
+        self.assertEqual(frozenlist([1]), frozen_dummy.items)
+        self.assertEqual(frozenlist([1, 2]), new_frozen_dummy.items)
+        self.assertEqual(1, new_frozen_dummy.value)
+
+    def test_produce_frozendefaultdict_and_frozendeque(self) -> None:
+        frozen_dict = freeze({'counters': defaultdict(int, {'a': 1}), 'events': deque([1, 2], maxlen=2)})
+
+        def recipe(draft: Dict[str, Any]) -> None:
+            draft['counters']['b'] = 2
+            draft['events'].append(3)
+
+        new_frozen_dict = produce(frozen_dict, recipe)
+
+        self.assertIsInstance(new_frozen_dict['counters'], frozendefaultdict)
+        self.assertIs(int, new_frozen_dict['counters'].default_factory)
+        self.assertEqual(0, new_frozen_dict['counters']['c'])
+        self.assertIsInstance(new_frozen_dict['events'], frozendeque)
+        self.assertEqual(2, new_frozen_dict['events'].maxlen)
+        self.assertEqual(frozenlist([2, 3]), new_frozen_dict['events'])
+
+    def test_produce_deeply_nested_values(self) -> None:
+        nested_value: Any = {'leaf': [0]}
+        for _ in range(5_000):
+            nested_value = {'child': [nested_value]}
+        frozen_value = freeze(nested_value)
+
+        def recipe(draft: Dict[str, Any]) -> None:
+            while 'child' in draft:
+                draft = draft['child'][0]
+            draft['leaf'].append(1)
+
+        new_frozen_value = produce(frozen_value, recipe)
+
+        while 'child' in new_frozen_value:
+            new_frozen_value = new_frozen_value['child'][0]
+        self.assertEqual(frozenlist([0, 1]), new_frozen_value['leaf'])
+
+    def test_produce_without_modifications(self) -> None:
+        frozen_dict = freeze({'one': [1], 'two': {'three': 3}})
+
+        def recipe(draft: Dict[str, Any]) -> None:
+            self.assertEqual(1, draft['one'][0])
+            self.assertEqual(3, draft['two']['three'])
+
+        self.assertIs(frozen_dict, produce(frozen_dict, recipe))
+
+    def test_produce_returning_value(self) -> None:
+        frozen_dict = freeze({'one': [1]})
+
+        def recipe(draft: Dict[str, Any]) -> List[int]:
+            draft['one'].append(2)
+            return draft['one']
+
+        self.assertEqual(frozenlist([1, 2]), produce(frozen_dict, recipe))
+        self.assertEqual(frozenlist([1]), produce(frozen_dict, lambda draft: [1]))
+
+    def test_produce_values_that_cannot_be_drafted(self) -> None:
+        with self.assertRaises(ValueError) as context:
+            produce(frozenmap(one=1), lambda draft: None)
+
+        self.assertEqual('frozenmap objects cannot be drafted', str(context.exception))
+
+
+class TestThaw(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_thaw_and_freeze_again(self) -> None:
+        frozen_state = freeze({'users': [{'name': 'Alice'}, {'name': 'Bob'}], 'config': {'debug': False}})
+
+        state = thaw(frozen_state)
+        state['users'][0]['name'] = 'Alicia'
+        state['users'].append({'name': 'Carol'})
+        new_frozen_state = freeze(state)
+
+        self.assertIsInstance(state, dict)
+        self.assertIsInstance(state['users'], list)
+        self.assertIsInstance(new_frozen_state, frozendict)
+        self.assertEqual(
+            {'users': ({'name': 'Alicia'}, {'name': 'Bob'}, {'name': 'Carol'}), 'config': {'debug': False}},
+            new_frozen_state,
+        )
+        self.assertEqual({'users': ({'name': 'Alice'}, {'name': 'Bob'}), 'config': {'debug': False}}, frozen_state)
+        self.assertIs(frozen_state['users'][1], new_frozen_state['users'][1])
+        self.assertIs(frozen_state['config'], new_frozen_state['config'])
+
+    def test_thaw_without_modifications(self) -> None:
+        frozen_state = freeze({'users': [{'name': 'Alice'}], 'tags': {'admin'}})
+
+        state = thaw(frozen_state)
+        self.assertEqual('Alice', state['users'][0]['name'])
+        self.assertTrue('admin' in state['tags'])
+
+        self.assertIs(frozen_state, freeze(state))
+
+    def test_thaw_frozen_objects(self) -> None:
+        @dataclasses.dataclass
+        class Account:
+            owner: str
+            balances: Dict[str, float]
+
+        frozen_account = freeze(Account(owner='Alice', balances={'EUR': 10.0}))
+
+        account = thaw(frozen_account)
+        account.owner = 'Alicia'
+        account.balances['USD'] = 5.0
+        new_frozen_account = freeze(account)
+
+        self.assertIs(type(frozen_account), type(new_frozen_account))
+        self.assertEqual('Alicia', new_frozen_account.owner)
+        self.assertEqual(frozendict({'EUR': 10.0, 'USD': 5.0}), new_frozen_account.balances)
+        self.assertEqual(frozendict({'EUR': 10.0}), frozen_account.balances)
+
+    def test_thaw_frozen_objects_with_methods(self) -> None:
+        class Cart(object):
+            def __init__(self, items: List[str]) -> None:
+                self.items = items
+                self.discount = 0
+
+            @property
+            def size(self) -> int:
+                return len(self.items)
+
+            @property
+            def percent_discount(self) -> int:
+                return self.discount * 100
+
+            @percent_discount.setter
+            def percent_discount(self, percent_discount: int) -> None:
+                self.discount = percent_discount / 100
+
+            def add(self, item: str) -> None:
+                self.items.append(item)
+
+            def clear(self) -> None:
+                self.items = []
+
+        frozen_cart = freeze(Cart(items=['book']))
+
+        cart = thaw(frozen_cart)
+        cart.add('pen')
+        cart.percent_discount = 10
+        new_frozen_cart = freeze(cart)
+        cart.clear()
+
+        self.assertEqual(0, cart.size)
+        self.assertEqual(frozenlist(['book', 'pen']), new_frozen_cart.items)
+        self.assertEqual(2, new_frozen_cart.size)
+        self.assertEqual(0.1, new_frozen_cart.discount)
+        self.assertEqual(frozenlist(['book']), frozen_cart.items)
+        self.assertEqual(frozenlist(), freeze(cart).items)
+
+    def test_thaw_values_read_by_iteration(self) -> None:
+        frozen_state = freeze({'groups': {'admins': ['alice']}, 'users': [{'name': 'Bob'}]})
+
+        state = thaw(frozen_state)
+        for members in state['groups'].values():
+            members.append('carol')
+        for _, members in state['groups'].items():
+            members.append('dave')
+        for user in state['users']:
+            user['name'] = 'Robert'
+        new_frozen_state = freeze(state)
+
+        self.assertEqual(frozenlist(['alice', 'carol', 'dave']), new_frozen_state['groups']['admins'])
+        self.assertEqual('Robert', new_frozen_state['users'][0]['name'])
+        self.assertEqual(frozenlist(['alice']), frozen_state['groups']['admins'])
+
+    def test_thawed_values_are_copied_when_they_are_modified(self) -> None:
+        frozen_state = freeze({'users': [{'name': 'Alice'}], 'tags': {'admin'}, 'config': {'debug': False}})
+
+        state = thaw(frozen_state)
+        self.assertEqual('Alice', state['users'][0]['name'])
+        self.assertEqual(['users', 'tags', 'config'], list(state))
+        self.assertIn('admin', state['tags'])
+        state['config']['debug'] = True
+
+        self.assertFalse(state._gelidum_copied)
+        self.assertFalse(state['users']._gelidum_copied)
+        self.assertFalse(state['tags']._gelidum_copied)
+        self.assertTrue(state['config']._gelidum_copied)
+        self.assertEqual({'users': [{'name': 'Alice'}], 'tags': {'admin'}, 'config': {'debug': True}}, state)
+        new_frozen_state = freeze(state)
+        self.assertIs(frozen_state['users'], new_frozen_state['users'])
+        self.assertEqual(frozendict({'debug': True}), new_frozen_state['config'])
+
+    def test_thaw_frozen_objects_with_special_methods(self) -> None:
+        class Playlist(object):
+            def __init__(self, songs: List[str]) -> None:
+                self.songs = songs
+
+            def __len__(self) -> int:
+                return len(self.songs)
+
+            def __iter__(self):
+                return iter(self.songs)
+
+            def __eq__(self, other: Any) -> bool:
+                return isinstance(other, Playlist) and list(self.songs) == list(other.songs)
+
+            __hash__ = None
+
+        frozen_playlist = freeze(Playlist(songs=['one']))
+
+        playlist = thaw(frozen_playlist)
+        playlist.songs.append('two')
+
+        self.assertIsInstance(playlist, Playlist)
+        self.assertEqual(2, len(playlist))
+        self.assertEqual(['one', 'two'], list(playlist))
+        self.assertEqual(Playlist(songs=['one', 'two']), playlist)
+        self.assertNotEqual(frozen_playlist, playlist)
+        self.assertEqual(frozenlist(['one', 'two']), freeze(playlist).songs)
+
+    def test_thaw_deeply_nested_values(self) -> None:
+        nested_value: Any = []
+        for _ in range(5_000):
+            nested_value = [nested_value]
+        frozen_value = freeze(nested_value)
+
+        value = thaw(frozen_value)
+        innermost_value = value
+        while innermost_value:
+            innermost_value = innermost_value[0]
+        innermost_value.append(1)
+        new_frozen_value = freeze(value)
+
+        while len(new_frozen_value) == 1 and isinstance(new_frozen_value[0], frozenlist):
+            new_frozen_value = new_frozen_value[0]
+        self.assertEqual(frozenlist([1]), new_frozen_value)
+
+    def test_thaw_immutable_values(self) -> None:
+        self.assertEqual(1, thaw(1))
+        self.assertEqual((1, 'two'), thaw((1, 'two')))
+        with self.assertRaises(ValueError) as context:
+            thaw(frozenmap(one=1))
+
+        self.assertEqual('frozenmap objects cannot be thawed', str(context.exception))
@@ -0,0 +1,124 @@
+import unittest
+from collections import namedtuple
+from typing import Any
+
+from gelidum import freeze, isfrozen, register_freezer, unregister_freezer
+from gelidum.collections import frozendict, frozenlist
+from gelidum.frozen import FrozenBase, clear_frozen_classes
+
+
+class TestRegisterFreezer(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+        self.registered_classes = []
+
+    def tearDown(self) -> None:
+        # The freezers registered by the tests must not be used by the next tests
+        for klass in self.registered_classes:
+            unregister_freezer(klass)
+
+    def _register_freezer(self, klass: type, *args, **kwargs) -> None:
+        register_freezer(klass, *args, **kwargs)
+        self.registered_classes.append(klass)
+
+    def test_register_freezer(self) -> None:
+        class Point(object):
+            def __init__(self, x: int, y: int) -> None:
+                self.x = x
+                self.y = y
+
+        def freeze_point(obj: Point, **kwargs) -> tuple:
+            return obj.x, obj.y
+
+        self._register_freezer(Point, freeze_point)
+
+        self.assertEqual((1, 2), freeze(Point(1, 2)))
+        self.assertEqual(frozenlist([(1, 2), (3, 4)]), freeze([Point(1, 2), Point(3, 4)]))
+
+    def test_register_freezer_receives_freezing_parameters(self) -> None:
+        class Box(object):
+            def __init__(self, content: Any) -> None:
+                self.content = content
+
+        def freeze_box(obj: Box, on_update: Any, on_freeze: Any, **kwargs) -> frozendict:
+            return frozendict(content=freeze(obj.content, on_update=on_update, on_freeze=on_freeze, **kwargs))
+
+        self._register_freezer(Box, freeze_box)
+
+        frozen_box = freeze(Box(content=[1, {'a': []}]))
+
+        self.assertIsInstance(frozen_box, frozendict)
+        self.assertIsInstance(frozen_box['content'], frozenlist)
+        self.assertIsInstance(frozen_box['content'][1], frozendict)
+        self.assertTrue(isfrozen(frozen_box))
+
+    def test_register_freezer_is_inherited_by_subclasses(self) -> None:
+        class Base(object):
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        class Child(Base):
+            pass
+
+        class GrandChild(Child):
+            pass
+
+        self._register_freezer(Base, lambda obj, **kwargs: ('base', obj.value))
+
+        self.assertEqual(('base', 1), freeze(GrandChild(1)))
+
+        self._register_freezer(Child, lambda obj, **kwargs: ('child', obj.value))
+
+        self.assertEqual(('base', 1), freeze(Base(1)))
+        self.assertEqual(('child', 2), freeze(Child(2)))
+        self.assertEqual(('child', 3), freeze(GrandChild(3)))
+
+    def test_register_freezer_not_inherited_by_subclasses(self) -> None:
+        class Base(object):
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        class Child(Base):
+            pass
+
+        self._register_freezer(Base, lambda obj, **kwargs: ('base', obj.value), subclasses=False)
+
+        frozen_child = freeze(Child(1))
+
+        self.assertEqual(('base', 1), freeze(Base(1)))
+        self.assertIsInstance(frozen_child, Child)
+        self.assertIsInstance(frozen_child, FrozenBase)
+        self.assertEqual(1, frozen_child.value)
+
+    def test_subclasses_of_builtin_collections_are_frozen_as_objects(self) -> None:
+        Point = namedtuple('Point', ['x', 'y'])
+
+        frozen_point = freeze(Point(1, 2))
+
+        self.assertIsInstance(frozen_point, Point)
+        self.assertEqual(1, frozen_point.x)
+        self.assertEqual(2, frozen_point.y)
+
+    def test_unregister_freezer(self) -> None:
+        class Base(object):
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        class Child(Base):
+            pass
+
+        self._register_freezer(Base, lambda obj, **kwargs: ('base', obj.value))
+        self._register_freezer(Child, lambda obj, **kwargs: ('child', obj.value))
+
+        self.assertEqual(('child', 1), freeze(Child(1)))
+
+        unregister_freezer(Child)
+
+        self.assertEqual(('base', 1), freeze(Child(1)))
+
+        unregister_freezer(Base)
+        frozen_child = freeze(Child(1))
+
+        self.assertIsInstance(frozen_child, Child)
+        self.assertIsInstance(frozen_child, FrozenBase)
+        self.assertEqual(1, frozen_child.value)
@@ -0,0 +1,207 @@
+import copy
+import unittest
+import warnings
+from typing import Any, Dict, List
+
+from gelidum import FrozenException, freeze, isfrozen, snapshot, track
+from gelidum.collections import frozendict, frozenlist, frozenzet
+from gelidum.frozen import clear_frozen_classes
+from gelidum.snapshot import trackeddict, trackedlist, trackedset
+
+
+class Order(object):
+    def __init__(self, order_id: int, lines: List[int], extra: Dict[str, Any]) -> None:
+        self.order_id = order_id
+        self.lines = lines
+        self.extra = extra
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_frozen_classes()
+
+    def test_track(self) -> None:
+        order = Order(order_id=1, lines=[1, 2], extra={'tags': {'new'}})
+        model = track({'orders': [order], 'version': 1})
+
+        self.assertIsInstance(model, trackeddict)
+        self.assertIsInstance(model['orders'], trackedlist)
+        self.assertIs(order, model['orders'][0])
+        self.assertIsInstance(order, Order)
+        self.assertIsInstance(order.lines, trackedlist)
+        self.assertIsInstance(order.extra['tags'], trackedset)
+        self.assertIs(model, track(model))
+        self.assertEqual({'orders': [order], 'version': 1}, model)
+
+    def test_snapshot(self) -> None:
+        model = track({'orders': [Order(order_id=1, lines=[1, 2], extra={'tags': {'new'}})], 'version': 1})
+
+        frozen_model = snapshot(model)
+
+        self.assertIsInstance(frozen_model, frozendict)
+        self.assertIsInstance(frozen_model['orders'], frozenlist)
+        self.assertIsInstance(frozen_model['orders'][0].extra['tags'], frozenzet)
+        self.assertTrue(isfrozen(frozen_model['orders'][0]))
+        self.assertEqual(frozenlist([1, 2]), frozen_model['orders'][0].lines)
+        self.assertNotIn('_gelidum_tracking', vars(frozen_model['orders'][0]))
+        self.assertEqual('Order', frozen_model['orders'][0].get_gelidum_hot_class_name())
+        self.assertIs(type(freeze(Order(order_id=2, lines=[], extra={}))), type(frozen_model['orders'][0]))
+        with self.assertRaises(FrozenException):
+            frozen_model['orders'][0].order_id = 2
+
+    def test_snapshot_only_copies_modified_values(self) -> None:
+        model = track({'orders': [Order(order_id=order_id, lines=[1], extra={}) for order_id in range(3)], 'meta': {}})
+        frozen_model = snapshot(model)
+
+        model['orders'][1].lines.append(2)
+        new_frozen_model = snapshot(model)
+
+        self.assertEqual(frozenlist([1]), frozen_model['orders'][1].lines)
+        self.assertEqual(frozenlist([1, 2]), new_frozen_model['orders'][1].lines)
+        self.assertIsNot(frozen_model, new_frozen_model)
+        self.assertIsNot(frozen_model['orders'], new_frozen_model['orders'])
+        self.assertIsNot(frozen_model['orders'][1], new_frozen_model['orders'][1])
+        self.assertIs(frozen_model['orders'][0], new_frozen_model['orders'][0])
+        self.assertIs(frozen_model['orders'][2], new_frozen_model['orders'][2])
+        self.assertIs(frozen_model['orders'][1].extra, new_frozen_model['orders'][1].extra)
+        self.assertIs(frozen_model['meta'], new_frozen_model['meta'])
+        self.assertIs(new_frozen_model, snapshot(model))
+
+    def test_snapshot_of_modified_attributes(self) -> None:
+        order = Order(order_id=1, lines=[1], extra={})
+        model = track([order])
+        frozen_model = snapshot(model)
+
+        order.order_id = 2
+        del order.extra
+        new_frozen_model = snapshot(model)
+
+        self.assertEqual(1, frozen_model[0].order_id)
+        self.assertEqual(2, new_frozen_model[0].order_id)
+        self.assertNotIn('extra', vars(new_frozen_model[0]))
+        self.assertIs(frozen_model[0].lines, new_frozen_model[0].lines)
+
+    def test_snapshot_of_untracked_values(self) -> None:
+        class Lines(object):
+            # Objects of classes with __slots__ are not tracked
+            __slots__ = ('lines',)
+
+            def __init__(self, lines: List[int]) -> None:
+                self.lines = lines
+
+        untracked_lines = Lines([1])
+        model = track({'orders': []})
+        model['orders'].append(untracked_lines)
+        frozen_model = snapshot(model)
+
+        untracked_lines.lines.append(2)
+        new_frozen_model = snapshot(model)
+
+        self.assertEqual(frozenlist([1]), frozen_model['orders'][0].lines)
+        self.assertEqual(frozenlist([1, 2]), new_frozen_model['orders'][0].lines)
+
+    def test_inserted_values_are_tracked(self) -> None:
+        order = Order(order_id=1, lines=[1], extra={})
+        model = track({'orders': [], 'tags': set()})
+        model['orders'].append(order)
+        model['orders'] += [{'lines': [2]}]
+        model['orders'][1:1] = [[3]]
+        model.update(customers=[{'name': 'Alice'}])
+        model['tags'].add(Order(order_id=2, lines=[], extra={}))
+        order.extra = {'notes': []}
+        notes = model.setdefault('notes', [])
+        frozen_model = snapshot(model)
+
+        order.lines.append(4)
+        new_frozen_model = snapshot(model)
+
+        self.assertIsInstance(model['orders'][0].lines, trackedlist)
+        self.assertIsInstance(model['orders'][1], trackedlist)
+        self.assertIsInstance(model['orders'][2], trackeddict)
+        self.assertIsInstance(model['customers'][0], trackeddict)
+        self.assertIsInstance(next(iter(model['tags'])).lines, trackedlist)
+        self.assertIsInstance(order.extra['notes'], trackedlist)
+        self.assertIs(notes, model['notes'])
+        self.assertIsInstance(notes, trackedlist)
+        self.assertEqual(frozenlist([1]), frozen_model['orders'][0].lines)
+        self.assertEqual(frozenlist([1, 4]), new_frozen_model['orders'][0].lines)
+        self.assertIs(frozen_model['orders'][1], new_frozen_model['orders'][1])
+        self.assertIs(frozen_model['customers'], new_frozen_model['customers'])
+        self.assertIs(frozen_model['tags'], new_frozen_model['tags'])
+
+    def test_snapshot_of_shared_references_and_cycles(self) -> None:
+        order = Order(order_id=1, lines=[1], extra={})
+        model = track({'orders': {'first': order, 'last': order}, 'self': None})
+        model['self'] = model
+        frozen_model = snapshot(model)
+
+        model['orders']['last'].lines.append(2)
+        new_frozen_model = snapshot(model)
+
+        self.assertIs(frozen_model, frozen_model['self'])
+        self.assertIs(new_frozen_model, new_frozen_model['self'])
+        self.assertIs(new_frozen_model['orders']['first'], new_frozen_model['orders']['last'])
+        self.assertEqual(frozenlist([1, 2]), new_frozen_model['orders']['first'].lines)
+
+    def test_snapshot_with_on_update_policy(self) -> None:
+        model = track(Order(order_id=1, lines=[1], extra={}))
+        frozen_model = snapshot(model, on_update='warning')
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            frozen_model.order_id = 2
+
+        self.assertEqual(1, len(caught_warnings))
+        self.assertIsNot(frozen_model, snapshot(model))
+        with self.assertRaises(FrozenException):
+            snapshot(model).order_id = 2
+
+    def test_tracked_values_are_frozen_like_untracked_ones(self) -> None:
+        model = track({'orders': [Order(order_id=1, lines=[1], extra={'tags': {'new'}})]})
+
+        frozen_model = freeze(model)
+
+        self.assertIsInstance(frozen_model, frozendict)
+        self.assertEqual(frozenlist([1]), frozen_model['orders'][0].lines)
+        self.assertEqual(frozenzet({'new'}), frozen_model['orders'][0].extra['tags'])
+        self.assertIs(type(freeze(Order(order_id=2, lines=[], extra={}))), type(frozen_model['orders'][0]))
+
+    def test_copies_of_tracked_values_are_tracked_apart(self) -> None:
+        model = track({'lines': [1]})
+        frozen_model = snapshot(model)
+        model_copy = copy.copy(model)
+
+        model_copy['lines'] = [2]
+
+        self.assertIs(frozen_model, snapshot(model))
+        self.assertEqual(frozendict({'lines': frozenlist([2])}), snapshot(model_copy))
+
+    def test_snapshot_of_self_referencing_list(self) -> None:
+        model = track([])
+        model.append(model)
+
+        with self.assertRaises(FrozenException) as context:
+            snapshot(model)
+
+        self.assertEqual('trackedlist object references itself and cannot be frozen', str(context.exception))
+
+    def test_snapshot_of_deeply_nested_values(self) -> None:
+        nested_value: Any = {'leaf': [0]}
+        for depth in range(5_000):
+            nested_value = [Order(order_id=depth, lines=[], extra=nested_value)]
+        model = track(nested_value)
+
+        frozen_model = snapshot(model)
+        leaf = model[0].extra
+        while isinstance(leaf, list):
+            leaf = leaf[0].extra
+        leaf['leaf'].append(1)
+        new_frozen_model = snapshot(model)
+
+        frozen_leaf = new_frozen_model[0].extra
+        while isinstance(frozen_leaf, frozenlist):
+            frozen_leaf = frozen_leaf[0].extra
+        self.assertEqual(frozenlist([0, 1]), frozen_leaf['leaf'])
+        self.assertIsNot(frozen_model, new_frozen_model)
+        self.assertIs(new_frozen_model, snapshot(model))
+        self.assertIsInstance(freeze(model), frozenlist)
@@ -1,8 +1,72 @@
+import copy
+import sys
 import time
+import tracemalloc
 import unittest
+from dataclasses import dataclass
+from typing import Any, Dict, List, Set, Tuple
+from unittest import mock
 
-from gelidum import freeze
-from gelidum.frozen import clear_frozen_classes
+from gelidum import (
+    FreezeCache,
+    OnFreezeCopier,
+    assoc_in,
+    compact,
+    compile_freeze_plan,
+    evolve,
+    freeze,
+    freeze_many,
+    immutable,
+    snapshot,
+    thaw,
+    track,
+)
+from gelidum.collections import frozendict, frozenlist, frozenmap, frozenvector
+from gelidum.frozen import (
+    clear_frozen_classes,
+    frozen_base,
+    get_frozen_classes,
+    isfrozen,
+)
+
+freeze_module = sys.modules['gelidum.freeze']
+
+
+def _frozenmap_nodes(frozen_map: frozenmap) -> Set[int]:
+    """
+    Ids of the nodes of the trie of a frozenmap.
+    """
+    node_ids = set()
+    nodes = [frozen_map._frozenmap__root]
+    while nodes:
+        node = nodes.pop()
+        node_ids.add(id(node))
+        nodes.extend(
+            child for child in getattr(node, 'children', ()) if hasattr(child, 'children') or hasattr(child, 'entries')
+        )
+    return node_ids
+
+
+def _frozenvector_nodes(frozen_vector: frozenvector) -> Set[int]:
+    """
+    Ids of the nodes (and the tail) of the trie of a frozenvector.
+    """
+    root, shift, tail, _ = frozen_vector._frozenvector__state
+    node_ids = {id(tail)}
+    nodes = [(root, shift)]
+    while nodes:
+        node, level = nodes.pop()
+        node_ids.add(id(node))
+        if level > 0:
+            nodes.extend((child, level - 5) for child in node)
+    return node_ids
+
+
+def _copy_counter() -> Any:
+    """
+    Mock of copy.copy that counts the copies made by freeze.
+    """
+    return mock.patch('copy.copy', wraps=copy.copy)
 
 
 class TestTimePerformance(unittest.TestCase):
@@ -56,3 +120,371 @@ class TestTimePerformance(unittest.TestCase):
         spent_time = sum(spent_times) / len(spent_times)
 
         self.assertLessEqual(spent_time, 0.4)
+
+    def test_copy_count_is_linear_on_depth(self) -> None:
+        class Node(object):
+            copies = 0
+
+            def __init__(self, child: 'Node' = None) -> None:
+                self.child = child
+                self.values = [1, 2, 3]
+
+            def __copy__(self) -> 'Node':
+                # Called by copy.copy for every copied node
+                Node.copies += 1
+                node_copy = Node.__new__(Node)
+                node_copy.__dict__.update(self.__dict__)
+                return node_copy
+
+        for depth in (10, 100, 1000):
+            node = None
+            for _ in range(depth):
+                node = Node(child=node)
+            Node.copies = 0
+
+            frozen_node = freeze(node, on_freeze='copy')
+
+            self.assertEqual(depth, Node.copies)
+            self.assertIsNot(node, frozen_node)
+
+    def test_freeze_many_objects_with_slots(self) -> None:
+        class Record(object):
+            __slots__ = ('id', 'name', 'tags')
+
+            def __init__(self, id: int) -> None:
+                self.id = id
+                self.name = f'record{id}'
+                self.tags = ('a', 'b')
+
+        records = [Record(id=record_index) for record_index in range(1_000)]
+
+        with _copy_counter() as copy_mock:
+            frozen_records = freeze(records)
+
+        # Objects with slots are frozen from their slots, without copying them
+        self.assertEqual(0, copy_mock.call_count)
+        self.assertEqual(1, len(get_frozen_classes()))
+        self.assertEqual(999, frozen_records[-1].id)
+
+    def test_hash_frozendict_many_times(self) -> None:
+        class Key(object):
+            hashes = 0
+
+            def __init__(self, key_index: int) -> None:
+                self.key_index = key_index
+
+            def __hash__(self) -> int:
+                Key.hashes += 1
+                return self.key_index
+
+        frozen_dict = frozendict({key_index: Key(key_index) for key_index in range(1_000)}, freeze_func=lambda v: v)
+
+        for _ in range(1_000):
+            hash(frozen_dict)
+
+        self.assertEqual(1_000, Key.hashes)
+
+    def test_set_many_keys_of_frozenmap(self) -> None:
+        frozen_map = frozenmap({f'key{key_index}': key_index for key_index in range(100_000)})
+        # The hashes have 32 bits, and each level of the trie uses 5 of them
+        depth = 7
+
+        for key_index in range(100):
+            new_frozen_map = frozen_map.set(f'key{key_index}', -key_index)
+            # Only the nodes of the path to the key are copied, the rest are shared
+            self.assertLessEqual(len(_frozenmap_nodes(new_frozen_map) - _frozenmap_nodes(frozen_map)), depth)
+            frozen_map = new_frozen_map
+
+        self.assertEqual(-99, frozen_map['key99'])
+        self.assertEqual(100, frozen_map['key100'])
+
+    def test_append_many_items_to_frozenvector(self) -> None:
+        frozen_vector = frozenvector(range(100_000))
+        depth = 4
+
+        for item_index in range(100):
+            new_frozen_vector = frozen_vector.append(item_index)
+            # Only the tail and the nodes of the path to it are copied, the rest are shared
+            self.assertLessEqual(
+                len(_frozenvector_nodes(new_frozen_vector) - _frozenvector_nodes(frozen_vector)), depth
+            )
+            frozen_vector = new_frozen_vector
+
+        self.assertEqual(100_100, len(frozen_vector))
+        self.assertEqual(list(range(100)), list(frozen_vector[100_000:]))
+
+    def test_freeze_view_of_big_catalog(self) -> None:
+        catalog = {f'product{product_index}': {'tags': ['tag'] * 10} for product_index in range(10_000)}
+
+        with _copy_counter() as copy_mock, mock.patch('copy.deepcopy', wraps=copy.deepcopy) as deepcopy_mock:
+            frozen_catalog = freeze(catalog, on_freeze='view')
+            frozen_tags = frozen_catalog['product9999']['tags']
+
+        # Nothing is copied, and only the values that are read are viewed
+        self.assertEqual(0, copy_mock.call_count)
+        self.assertEqual(0, deepcopy_mock.call_count)
+        self.assertEqual(1, len(frozen_catalog._gelidum_views))
+        self.assertEqual('tag', frozen_tags[9])
+        self.assertIs(frozen_tags, frozen_catalog['product9999']['tags'])
+
+    def test_freeze_lazily_and_read_a_small_part(self) -> None:
+        class Customer(object):
+            def __init__(self, customer_index: int) -> None:
+                self.name = f'customer{customer_index}'
+                self.orders = [{'id': order_index, 'lines': [1, 2, 3]} for order_index in range(10)]
+
+        customers = {f'customer{customer_index}': Customer(customer_index) for customer_index in range(1_000)}
+
+        frozen_customers = freeze(customers, on_freeze='lazy')
+        frozen_orders = frozen_customers['customer999'].orders
+
+        # Only the values that have been read are frozen
+        self.assertEqual(frozenlist([1, 2, 3]), frozen_orders[9]['lines'])
+        self.assertEqual(1, sum(1 for value in dict.values(frozen_customers) if isfrozen(value)))
+        self.assertIs(customers['customer0'], dict.__getitem__(frozen_customers, 'customer0'))
+
+    def test_snapshot_model_modified_a_little_many_times(self) -> None:
+        model = track({f'customer{customer_index}': {'orders': [[1, 2, 3]] * 10} for customer_index in range(1_000)})
+        frozen_model = snapshot(model)
+
+        for tick in range(10):
+            model[f'customer{tick}']['orders'][0].append(tick)
+            new_frozen_model = snapshot(model)
+            # Only the modified customer (and the model) are frozen again
+            self.assertEqual(
+                [f'customer{tick}'], [key for key, value in new_frozen_model.items() if value is not frozen_model[key]]
+            )
+            frozen_model = new_frozen_model
+
+        self.assertEqual(frozenlist([1, 2, 3, 9]), frozen_model['customer9']['orders'][0])
+
+    def test_freeze_same_object_many_times_with_cache(self) -> None:
+        feature_flags = {f'flag{flag_index}': {'enabled': True, 'groups': ['beta']} for flag_index in range(1_000)}
+        on_freeze = OnFreezeCopier(cache=FreezeCache())
+        frozen_feature_flags = freeze(feature_flags, on_freeze=on_freeze)
+
+        with _copy_counter() as copy_mock, mock.patch('copy.deepcopy', wraps=copy.deepcopy) as deepcopy_mock:
+            for _ in range(100):
+                self.assertIs(frozen_feature_flags, freeze(feature_flags, on_freeze=on_freeze))
+
+        self.assertEqual(0, copy_mock.call_count)
+        self.assertEqual(0, deepcopy_mock.call_count)
+        self.assertEqual(frozenlist(['beta']), frozen_feature_flags['flag999']['groups'])
+
+    def test_freeze_many_records_of_the_same_class(self) -> None:
+        class Record(object):
+            def __init__(self, record_id: int) -> None:
+                self.record_id = record_id
+                self.name = f'record{record_id}'
+                self.tags = ['new', 'sale']
+                self.price = 1.5
+
+        records = [Record(record_id) for record_id in range(1_000)]
+
+        with _copy_counter() as copy_mock:
+            frozen_records = freeze_many(records)
+        copies_many = copy_mock.call_count
+        with _copy_counter() as copy_mock:
+            frozen_records_one_by_one = [freeze(record) for record in records]
+        copies_one_by_one = copy_mock.call_count
+
+        # freeze_many makes the frozen records from the attributes of the records, without copying them
+        self.assertEqual(0, copies_many)
+        self.assertEqual(1_000, copies_one_by_one)
+        self.assertEqual('record999', frozen_records[999].name)
+        self.assertEqual('record999', frozen_records_one_by_one[999].name)
+
+    def test_freeze_many_dataclass_objects(self) -> None:
+        @dataclass
+        class Point:
+            x: int
+            y: int
+            label: str
+
+        tracemalloc.start()
+        frozen_points = [freeze(Point(x=index, y=index, label='point')) for index in range(20_000)]
+        memory_slots = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        frozen_points_inplace = [
+            freeze(Point(x=index, y=index, label='point'), on_freeze='inplace') for index in range(20_000)
+        ]
+        memory_dict = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        self.assertEqual(('x', 'y', 'label'), type(frozen_points[0]).__slots__)
+        self.assertEqual(19_999, frozen_points[-1].x)
+        self.assertEqual(19_999, frozen_points_inplace[-1].x)
+        self.assertLess(memory_slots, memory_dict)
+
+    def test_freeze_with_plan_compiled_from_type_hints(self) -> None:
+        class Reading(object):
+            sensor: str
+            location: Tuple[str, ...]
+            values: List[float]
+            limits: Dict[str, float]
+
+            def __init__(self, reading_id: int) -> None:
+                self.sensor = f'sensor{reading_id}'
+                self.location = ('building', 'floor')
+                self.values = [float(value) for value in range(20)]
+                self.limits = {'min': -10.0, 'max': 50.0}
+
+        readings = [Reading(reading_id) for reading_id in range(1_000)]
+        freeze_reading = compile_freeze_plan(Reading)
+        get_freezer = vars(freeze_module)['__get_freezer']
+
+        with mock.patch.dict(vars(freeze_module), {'__get_freezer': mock.Mock(wraps=get_freezer)}):
+            frozen_readings_plan = [freeze_reading(reading) for reading in readings]
+            freezer_lookups_plan = vars(freeze_module)['__get_freezer'].call_count
+        with mock.patch.dict(vars(freeze_module), {'__get_freezer': mock.Mock(wraps=get_freezer)}):
+            frozen_readings = [freeze(reading) for reading in readings]
+            freezer_lookups_freeze = vars(freeze_module)['__get_freezer'].call_count
+
+        # The plan knows how to freeze the attributes from their type hints, so it only looks up
+        # the freezer of the class of the objects
+        self.assertEqual(1_000, freezer_lookups_plan)
+        self.assertEqual(3_000, freezer_lookups_freeze)
+        self.assertEqual(frozen_readings[-1], frozen_readings_plan[-1])
+
+    def test_compact_many_small_frozen_records(self) -> None:
+        class Record(object):
+            def __init__(self, record_id: int) -> None:
+                self.record_id = record_id
+                self.price = 1.5
+                self.currency = 'EUR'
+
+        records = [Record(record_id) for record_id in range(20_000)]
+
+        tracemalloc.start()
+        frozen_records = [freeze(record) for record in records]
+        memory_frozen = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        compact_records = [compact(frozen_record) for frozen_record in frozen_records]
+        memory_compact = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        self.assertEqual(19_999, compact_records[-1].record_id)
+        self.assertLessEqual(memory_compact * 2, memory_frozen)
+
+    def test_create_many_objects_of_immutable_class(self) -> None:
+        class Money(object):
+            amount: float
+            currency: str
+            rates: List[float]
+
+            def __init__(self, amount: float, currency: str) -> None:
+                self.amount = amount
+                self.currency = currency
+                self.rates = [1.0, 1.1, 0.9]
+
+        @immutable
+        class ImmutableMoney(Money):
+            pass
+
+        with _copy_counter() as copy_mock:
+            immutable_moneys = [ImmutableMoney(float(index), 'EUR') for index in range(1_000)]
+        copies_immutable = copy_mock.call_count
+        with _copy_counter() as copy_mock:
+            frozen_moneys = [freeze(Money(float(index), 'EUR')) for index in range(1_000)]
+        copies_freeze = copy_mock.call_count
+
+        # The objects of immutable classes are frozen inplace
+        self.assertEqual(0, copies_immutable)
+        self.assertEqual(1_000, copies_freeze)
+        self.assertEqual(frozen_moneys[-1].rates, immutable_moneys[-1].rates)
+
+    def test_evolve_many_snapshots_of_a_frozen_object(self) -> None:
+        class Machine(object):
+            def __init__(self, state: str, transitions: Dict[str, List[str]], log: List[int]) -> None:
+                self.state = state
+                self.transitions = transitions
+                self.log = log
+
+        transitions = {f'state{index}': [f'state{index + 1}', 'idle'] for index in range(100)}
+        frozen_machine = freeze(Machine(state='idle', transitions=transitions, log=list(range(100))))
+
+        evolved_machine = frozen_machine
+        with _copy_counter() as copy_mock:
+            for index in range(1_000):
+                evolved_machine = evolve(evolved_machine, state=f'state{index}')
+
+        # The attributes that do not change are shared, not copied nor frozen again
+        self.assertEqual(0, copy_mock.call_count)
+        self.assertEqual('state999', evolved_machine.state)
+        self.assertIs(frozen_machine.transitions, evolved_machine.transitions)
+        self.assertIs(frozen_machine.log, evolved_machine.log)
+
+    def test_assoc_in_deep_value_of_big_frozen_tree(self) -> None:
+        state = {
+            'users': [{'name': f'user{index}', 'emails': [f'user{index}@example.com']} for index in range(1_000)],
+            'config': {f'option{index}': [index] for index in range(1_000)},
+        }
+        frozen_state = freeze(state)
+
+        new_frozen_state = frozen_state
+        for index in range(100):
+            new_frozen_state = assoc_in(new_frozen_state, ['users', index, 'emails', 0], f'new{index}@example.com')
+        for index in range(100):
+            state['users'][index]['emails'][0] = f'new{index}@example.com'
+
+        # Only the nodes of the paths are copied, the rest are shared
+        self.assertEqual(freeze(state), new_frozen_state)
+        self.assertIs(frozen_state['config'], new_frozen_state['config'])
+        self.assertIs(frozen_state['users'][0]['name'], new_frozen_state['users'][0]['name'])
+        for index in range(100, 1_000):
+            self.assertIs(frozen_state['users'][index], new_frozen_state['users'][index])
+
+    def test_thaw_and_freeze_big_frozen_tree_modified_a_little(self) -> None:
+        state = {
+            'users': [{'name': f'user{index}', 'emails': [f'user{index}@example.com']} for index in range(1_000)],
+            'config': {f'option{index}': [index] for index in range(1_000)},
+        }
+        frozen_state = freeze(state)
+
+        new_frozen_state = frozen_state
+        for index in range(20):
+            thawed_state = thaw(new_frozen_state)
+            thawed_state['users'][index]['name'] = f'new{index}'
+            new_frozen_state = freeze(thawed_state)
+
+        # Only the modified values (and the values that contain them) are frozen again
+        mutable_state = copy.deepcopy(state)
+        for index in range(20):
+            mutable_state['users'][index]['name'] = f'new{index}'
+        self.assertEqual(freeze(mutable_state), new_frozen_state)
+        self.assertIs(frozen_state['config'], new_frozen_state['config'])
+        self.assertIs(frozen_state['users'][0]['emails'], new_frozen_state['users'][0]['emails'])
+        for index in range(20, 1_000):
+            self.assertIs(frozen_state['users'][index], new_frozen_state['users'][index])
+
+    def test_compare_snapshots_sharing_most_of_their_frozen_objects(self) -> None:
+        class Node(object):
+            def __init__(self, value: int, children: List['Node']) -> None:
+                self.value = value
+                self.children = children
+
+        def make_tree(depth: int) -> Node:
+            if depth == 0:
+                return Node(0, [])
+            return Node(depth, [make_tree(depth - 1) for _ in range(4)])
+
+        frozen_tree = freeze(make_tree(4))
+        other_frozen_tree = freeze(make_tree(4))
+        snapshots = [assoc_in(frozen_tree, ['children', 0, 'children', 0, 'value'], index) for index in range(20)]
+
+        with mock.patch.object(frozen_base, '_structural_eq', wraps=frozen_base._structural_eq) as eq_mock:
+            shared_differences = sum(1 for snapshot in snapshots if snapshot != frozen_tree)
+        comparisons_shared = eq_mock.call_count
+        with mock.patch.object(frozen_base, '_structural_eq', wraps=frozen_base._structural_eq) as eq_mock:
+            not_shared_differences = sum(1 for _ in range(20) if other_frozen_tree != frozen_tree)
+        comparisons_not_shared = eq_mock.call_count
+
+        # Only the nodes of the path that is not shared are compared
+        self.assertEqual(19, shared_differences)
+        self.assertEqual(0, not_shared_differences)
+        self.assertEqual(19 * 3, comparisons_shared)
+        self.assertEqual(20 * (1 + 4 + 4**2 + 4**3 + 4**4), comparisons_not_shared)
@@ -1,3 +1,5 @@
+import types
+import typing
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -8,15 +10,19 @@ from typing import (
     Optional,
     Reversible,
     Sized,
+    Tuple,
     TypeVar,
     Union,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
     from gelidum.collections import (  # noqa
+        frozenarray,
         frozendict,
         frozenlist,
+        frozenmap,
         frozenndarray,
+        frozenvector,
         frozenzet,
     )
     from gelidum.frozen import FrozenBase  # noqa
@@ -29,10 +35,104 @@ class Freezable(Generic[T]):  # noqa
     pass
 
 
+# Classes of the type hints of unions (X | Y is a types.UnionType since Python 3.10)
+_UNION_TYPES: Tuple[type, ...] = (types.UnionType,) if hasattr(types, 'UnionType') else ()
+
+# Type hints of the values that are immutable (i.e. whose values do not need to be frozen)
+_IMMUTABLE_TYPE_HINTS = frozenset((bool, int, float, complex, str, bytes, type(None), None))
+
+
+def get_freezable_type_hint(type_hint: Any) -> Any:
+    """
+    Type hint of the values of a Freezable type hint (e.g. List[int] for Freezable[List[int]]),
+    or the type hint itself if it is not a Freezable one.
+    """
+    while getattr(type_hint, '__origin__', None) is Freezable:
+        type_hint = type_hint.__args__[0]
+    return type_hint
+
+
+def get_type_hint_args(type_hint: Any) -> Tuple[Any, ...]:
+    """
+    Arguments of a type hint (e.g. (str, int) for Dict[str, int]), without the TypeVars
+    of the generic type hints without arguments (e.g. List) and the empty tuples of Tuple[()].
+    """
+    return tuple(
+        arg for arg in getattr(type_hint, '__args__', None) or () if not isinstance(arg, TypeVar) and arg != ()
+    )
+
+
+def is_union_type_hint(type_hint: Any) -> bool:
+    return getattr(type_hint, '__origin__', None) is Union or isinstance(type_hint, _UNION_TYPES)
+
+
+def is_immutable_type_hint(type_hint: Any) -> bool:
+    """
+    Return if the values of a type hint are immutable, i.e. if the type hint is a builtin
+    immutable class (int, str, etc.), a frozen or immutable class (see isimmutableclass),
+    a Literal, or a tuple, frozenset or union of immutable type hints (e.g. Tuple[str, ...]).
+    """
+    from gelidum.frozen import FrozenBase, isimmutableclass
+
+    type_hint = get_freezable_type_hint(type_hint)
+    if type_hint is Any:
+        return False
+    try:
+        if type_hint in _IMMUTABLE_TYPE_HINTS:
+            return True
+    except TypeError:
+        # Unhashable type hints
+        return False
+    if isinstance(type_hint, type) and getattr(type_hint, '__origin__', None) is None:
+        return issubclass(type_hint, FrozenBase) or isimmutableclass(type_hint)
+
+    origin = getattr(type_hint, '__origin__', None)
+    if origin is getattr(typing, 'Literal', None):
+        return True
+    if is_union_type_hint(type_hint):
+        return all(is_immutable_type_hint(arg) for arg in get_type_hint_args(type_hint))
+    if origin in (tuple, frozenset):
+        # The items of the tuples and frozensets without args (or with TypeVars) could be mutable
+        args = getattr(type_hint, '__args__', None) or ()
+        return bool(args) and all(
+            arg is ... or arg == () or (not isinstance(arg, TypeVar) and is_immutable_type_hint(arg)) for arg in args
+        )
+    return False
+
+
+def get_type_hint_classes(type_hint: Any) -> Optional[Tuple[type, ...]]:
+    """
+    Classes that the values of a type hint are instances of (e.g. (list,) for List[int], or (int, NoneType)
+    for Optional[int]), or None if they cannot be checked with isinstance (e.g. Any or Literal type hints).
+    """
+    type_hint = get_freezable_type_hint(type_hint)
+    if type_hint is Any:
+        return None
+    if type_hint is None:
+        return (type(None),)
+    if is_union_type_hint(type_hint):
+        classes: Tuple[type, ...] = ()
+        for arg in get_type_hint_args(type_hint):
+            arg_classes = get_type_hint_classes(arg)
+            if arg_classes is None:
+                return None
+            classes += arg_classes
+        return classes
+    origin = getattr(type_hint, '__origin__', None)
+    if isinstance(origin, type):
+        return (origin,)
+    if isinstance(type_hint, type):
+        return (type_hint,)
+    return None
+
+
 FrozenList = Union['FrozenBase', Sized, Iterable, Reversible, 'frozenlist']
 FrozenDict = Union['FrozenBase', Mapping, 'frozendict']
+FrozenMap = Union['FrozenBase', Mapping, 'frozenmap']
+FrozenVector = Union['FrozenBase', Sized, Iterable, Reversible, 'frozenvector']
 FrozenZet = Union['FrozenBase', Sized, Iterable, 'frozenzet']
 FrozenNdArray = Union['FrozenBase', Sized, Iterable, 'frozenndarray']
+FrozenArray = Union['FrozenBase', Sized, Iterable, Reversible, 'frozenarray']
 
 
 FrozenType = Optional[
@@ -45,9 +145,12 @@ FrozenType = Optional[
         str,
         bytes,
         FrozenDict,
+        FrozenMap,
         FrozenList,
+        FrozenVector,
         FrozenZet,
         FrozenNdArray,
+        FrozenArray,
         tuple,
         frozenset,
         'FrozenBase',
@@ -62,3 +165,6 @@ except TypeError:
 
 
 OnFreezeFuncType = Callable[[Any], Any]
+
+
+FreezerFuncType = Callable[..., Any]
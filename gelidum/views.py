@@ -0,0 +1,282 @@
+import inspect
+import threading
+import weakref
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Tuple, Type
+
+try:
+    from collections import Mapping, Sequence, Set
+except ImportError:
+    # For python > 3.10
+    from collections.abc import Mapping, Sequence, Set
+
+from gelidum.frozen import FrozenBase
+from gelidum.typing import FrozenType, OnUpdateFuncType
+
+__all__ = ['frozendictview', 'frozenlistview', 'frozenobjectview', 'frozensetview']
+
+
+# Classes whose objects are returned as they are by the views
+_IMMUTABLE_CLASSES = frozenset((bool, int, float, complex, str, bytes, type(None)))
+
+
+class _FrozenView(FrozenBase):
+    """
+    Read-only view of a mutable object, created by freeze with on_freeze='view'.
+    The viewed object is not copied nor modified, so the view reflects its changes.
+    The values read from the view are views of the original values, created
+    the first time they are read.
+    """
+
+    def __init__(self, obj: Any, on_update: OnUpdateFuncType):
+        object.__setattr__(self, '_gelidum_obj', obj)
+        object.__setattr__(self, '_gelidum_on_update', on_update)
+        # Views of the values read from the view, with the values they view
+        object.__setattr__(self, '_gelidum_views', {})
+
+    def _gelidum_view(self, key: Hashable, value: Any) -> FrozenType:
+        if type(value) in _IMMUTABLE_CLASSES:
+            return value
+        views: Dict[Hashable, Tuple[Any, FrozenType]] = self._gelidum_views
+        value_view = views.get(key)
+        if value_view is not None and value_view[0] is value:
+            return value_view[1]
+        from gelidum.freeze import freeze
+
+        view = freeze(value, on_update=self._gelidum_on_update, on_freeze='view')
+        views[key] = (value, view)
+        return view
+
+    def get_gelidum_hot_class_name(self) -> str:
+        return type(self._gelidum_obj).__name__
+
+    def get_gelidum_hot_class_module(self) -> str:
+        return type(self._gelidum_obj).__module__
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._gelidum_obj!r})'
+
+    def __copy__(self) -> '_FrozenView':
+        return self
+
+
+class frozendictview(_FrozenView, Mapping):  # noqa
+    __hash__ = None
+
+    def __getitem__(self, key: Hashable) -> FrozenType:
+        return self._gelidum_view(key, self._gelidum_obj[key])
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._gelidum_obj
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._gelidum_obj)
+
+    def __len__(self) -> int:
+        return len(self._gelidum_obj)
+
+
+class frozenlistview(_FrozenView, Sequence):  # noqa
+    __hash__ = None
+
+    def __getitem__(self, index: Any) -> FrozenType:
+        if type(index) is slice:
+            return frozenlistview(self._gelidum_obj[index], on_update=self._gelidum_on_update)
+        value = self._gelidum_obj[index]
+        return self._gelidum_view(index if index >= 0 else index + len(self._gelidum_obj), value)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._gelidum_obj
+
+    def __len__(self) -> int:
+        return len(self._gelidum_obj)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (list, tuple, frozenlistview)):
+            return NotImplemented
+        return len(self) == len(other) and all(item == other_item for item, other_item in zip(self, other))
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+
+class frozensetview(_FrozenView, Set):  # noqa
+    __hash__ = None
+
+    @classmethod
+    def _from_iterable(cls, items: Iterable) -> frozenset:
+        # Results of set operations are not views
+        return frozenset(items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._gelidum_obj
+
+    def __iter__(self) -> Iterator[FrozenType]:
+        for item in self._gelidum_obj:
+            yield self._gelidum_view(id(item), item)
+
+    def __len__(self) -> int:
+        return len(self._gelidum_obj)
+
+
+class frozenobjectview(_FrozenView):  # noqa
+    """
+    Read-only view of an object. Methods are bound to the view,
+    so they cannot modify the object either. The special methods of the class
+    of the object (e.g. __len__ or __iter__) are called by the view too.
+    """
+
+    def __new__(cls, obj: Any, on_update: OnUpdateFuncType) -> 'frozenobjectview':
+        return object.__new__(_object_view_class(type(obj)))
+
+    @property
+    def __class__(self) -> type:
+        # Views of objects pass the isinstance checks of the classes of their objects
+        return type(self._gelidum_obj)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_gelidum_'):
+            # View without object (e.g. not initialized yet)
+            raise AttributeError(name)
+        obj = self._gelidum_obj
+        klass = type(obj)
+        obj_dict = getattr(obj, '__dict__', None)
+        if obj_dict is None or name not in obj_dict:
+            try:
+                class_attr = inspect.getattr_static(klass, name)
+            except AttributeError:
+                class_attr = None
+            if (
+                class_attr is not None
+                and hasattr(class_attr, '__get__')
+                and not isinstance(class_attr, MemberDescriptorType)
+            ):
+                # Methods and properties of the class are bound to the view
+                value = class_attr.__get__(self, klass)
+                if inspect.ismethod(value):
+                    return value
+                return self._gelidum_view(name, value)
+        return self._gelidum_view(name, getattr(obj, name))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, frozenobjectview):
+            other = other._gelidum_obj
+        return self._gelidum_obj == other
+
+    def __hash__(self) -> int:
+        return hash(self._gelidum_obj)
+
+    def __dir__(self) -> Iterable[str]:
+        return dir(self._gelidum_obj)
+
+
+# Special methods that are looked up in the classes of the objects (not in the objects),
+# so the views of objects must define them to support the protocols of the classes of their objects
+_FORWARDED_METHOD_NAMES = (
+    '__len__',
+    '__length_hint__',
+    '__iter__',
+    '__next__',
+    '__reversed__',
+    '__contains__',
+    '__getitem__',
+    '__call__',
+    '__bool__',
+    '__str__',
+    '__bytes__',
+    '__format__',
+    '__int__',
+    '__float__',
+    '__complex__',
+    '__index__',
+    '__round__',
+    '__fspath__',
+    '__enter__',
+    '__exit__',
+    '__lt__',
+    '__le__',
+    '__gt__',
+    '__ge__',
+    '__neg__',
+    '__pos__',
+    '__abs__',
+    '__invert__',
+    '__add__',
+    '__sub__',
+    '__mul__',
+    '__matmul__',
+    '__truediv__',
+    '__floordiv__',
+    '__mod__',
+    '__divmod__',
+    '__pow__',
+    '__lshift__',
+    '__rshift__',
+    '__and__',
+    '__xor__',
+    '__or__',
+    '__radd__',
+    '__rsub__',
+    '__rmul__',
+    '__rmatmul__',
+    '__rtruediv__',
+    '__rfloordiv__',
+    '__rmod__',
+    '__rdivmod__',
+    '__rpow__',
+    '__rlshift__',
+    '__rrshift__',
+    '__rand__',
+    '__rxor__',
+    '__ror__',
+    '__iadd__',
+    '__isub__',
+    '__imul__',
+    '__imatmul__',
+    '__itruediv__',
+    '__ifloordiv__',
+    '__imod__',
+    '__ipow__',
+    '__ilshift__',
+    '__irshift__',
+    '__iand__',
+    '__ixor__',
+    '__ior__',
+)
+
+
+def _forwarded_method(name: str) -> Callable:
+    def forwarded_method(self: frozenobjectview, *args, **kwargs) -> Any:
+        # The method of the class of the object is bound to the view
+        return self.__getattr__(name)(*args, **kwargs)
+
+    forwarded_method.__name__ = name
+    return forwarded_method
+
+
+# The view classes are not kept alive by the classes of the objects
+_OBJECT_VIEW_CLASSES: 'weakref.WeakKeyDictionary[type, Type[frozenobjectview]]' = weakref.WeakKeyDictionary()
+_OBJECT_VIEW_CLASSES_LOCK = threading.Lock()
+
+
+def _object_view_class(klass: type) -> Type[frozenobjectview]:
+    """
+    Class of the views of the objects of a class: frozenobjectview, or a subclass of it with the
+    special methods that the class defines. Created only the first time for each class.
+    """
+    view_class = _OBJECT_VIEW_CLASSES.get(klass)
+    if view_class is not None:
+        return view_class
+
+    with _OBJECT_VIEW_CLASSES_LOCK:
+        view_class = _OBJECT_VIEW_CLASSES.get(klass)
+        if view_class is None:
+            methods = {
+                name: _forwarded_method(name)
+                for name in _FORWARDED_METHOD_NAMES
+                if any(name in base.__dict__ for base in klass.__mro__ if base is not object)
+            }
+            view_class = type('frozenobjectview', (frozenobjectview,), methods) if methods else frozenobjectview
+            _OBJECT_VIEW_CLASSES[klass] = view_class
+    return view_class